@@ -0,0 +1,56 @@
+"""Benchmark sizing auto-size columns of a large DataGrid.
+
+Usage:
+    python benchmarks/bench_grid_autosize.py [rows]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtWidgets import QApplication
+from ui.components.data_grid import DataGrid
+
+def make_columns(rows: int, auto_size):
+    """Generate column arrays and configuration with every column auto-sized."""
+    data = {
+        "id": list(range(rows)),
+        "name": [f"Product {(i * 7919) % rows}" for i in range(rows)],
+        "price": [((i * 104729) % 100000) / 100.0 for i in range(rows)],
+    }
+    columns = [
+        {"key": "id", "title": "ID", "auto_size": auto_size},
+        {"key": "name", "title": "Name", "auto_size": auto_size},
+        {"key": "price", "title": "Price", "auto_size": auto_size, "formatter": lambda v: f"${v:,.2f}"},
+    ]
+    return data, columns
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    app = QApplication.instance() or QApplication(sys.argv)
+    grid = DataGrid()
+    grid.resize(800, 600)
+    grid.show()
+    app.processEvents()
+    print(f"rows: {rows:,}")
+    for label, auto_size in (("sampled", True), ("contents", "contents")):
+        data, columns = make_columns(rows, auto_size)
+        start = time.perf_counter()
+        grid.load_data(data, columns)
+        # Content-sized sections are measured on the next layout
+        app.processEvents()
+        header = grid._table_view.horizontalHeader()
+        widths = [header.sectionSize(i) for i in range(len(columns))]
+        print(f"load + size ({label}):  {time.perf_counter() - start:8.3f}s  widths {widths}")
+        
+        # Content-sized sections are re-measured as rows change
+        start = time.perf_counter()
+        for step in range(100):
+            grid.update_rows([{"id": step * 997 % rows, "name": f"Renamed {step}"}])
+            app.processEvents()
+        print(f"100 updates ({label}):  {time.perf_counter() - start:8.3f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark loading large CSV and JSON Lines files into DataGrid.
+
+Usage:
+    python benchmarks/bench_grid_file.py [rows]
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtWidgets import QApplication
+from ui.components.data_grid import DataGrid
+
+def write_files(directory: str, rows: int):
+    """Write the same random rows as CSV and JSON Lines."""
+    rng = random.Random(42)
+    csv_path = os.path.join(directory, "rows.csv")
+    jsonl_path = os.path.join(directory, "rows.jsonl")
+    with open(csv_path, "w", newline="") as csv_file, open(jsonl_path, "w") as jsonl_file:
+        csv_file.write("id,name,price\n")
+        for row_id in range(rows):
+            name = f"Product {rng.randrange(rows)}"
+            price = round(rng.random() * 1000, 2)
+            csv_file.write(f'{row_id},"{name}",{price}\n')
+            jsonl_file.write(json.dumps({"id": row_id, "name": name, "price": price}) + "\n")
+    return csv_path, jsonl_path
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    app = QApplication.instance() or QApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_files(directory, rows)
+        print(f"rows: {rows:,}")
+        for path in paths:
+            grid = DataGrid()
+            grid.resize(800, 600)
+            grid.show()
+            done = []
+            grid.index_progress.connect(lambda percent: percent == 100 and done.append(True))
+
+            start = time.perf_counter()
+            grid.load_file(path)
+            while grid._model.rowCount() == 0:
+                app.processEvents()
+            first = time.perf_counter() - start
+            while not done:
+                app.processEvents()
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(path) / 2**20
+            print(f"{os.path.basename(path):12} {size:8.1f} MB  first rows {first * 1000:7.1f} ms  "
+                  f"indexed in {elapsed:6.2f} s ({size / elapsed:6.1f} MB/s)")
+            grid.close()
+
+if __name__ == "__main__":
+    main()
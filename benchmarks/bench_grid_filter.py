@@ -0,0 +1,59 @@
+"""Benchmark DataGrid text filtering with the search index.
+
+Usage:
+    python benchmarks/bench_grid_filter.py [rows]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.components.data_grid_store import ColumnStore
+from ui.components.data_grid_search import SearchIndex
+
+COLUMNS = [
+    {"key": "id", "title": "ID"},
+    {"key": "name", "title": "Name"},
+    {"key": "price", "title": "Price", "formatter": lambda x: f"${x:.2f}"},
+]
+
+def timed(func):
+    """Run func once and return (result, elapsed milliseconds)."""
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1000
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(42)
+    store = ColumnStore.from_columns({
+        "id": list(range(rows)),
+        "name": [f"Product {rng.randrange(rows)}" for _ in range(rows)],
+        "price": [rng.random() * 1000 for _ in range(rows)],
+    }, COLUMNS)
+    print(f"rows: {rows:,}")
+
+    index, build = timed(lambda: SearchIndex.build(store, COLUMNS))
+    print(f"index build:            {build:8.1f} ms")
+
+    # Legacy cost: format and lowercase every cell on each keystroke
+    def legacy(query):
+        values = [store.column(col["key"]) for col in COLUMNS]
+        renders = [col.get("formatter") or str for col in COLUMNS]
+        return [
+            row for row in range(rows)
+            if any(query in render(column[row]).lower() for render, column in zip(renders, values))
+        ]
+    _, legacy_ms = timed(lambda: legacy("uct 12345"))
+    print(f"legacy keystroke:       {legacy_ms:8.1f} ms")
+
+    # First query also joins the row texts
+    for query in ("p", "pr", "uct 1", "uct 12", "uct 123", "uct 1234", "uct 12345", "$99"):
+        matches, elapsed = timed(lambda: index.search(query))
+        print(f"search {query!r:14}  {elapsed:8.1f} ms  {len(matches):>9,} rows")
+
+if __name__ == "__main__":
+    main()
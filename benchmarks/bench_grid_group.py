@@ -0,0 +1,74 @@
+"""Benchmark grouping a large DataGrid and expanding its groups.
+
+Usage:
+    python benchmarks/bench_grid_group.py [rows]
+"""
+
+import os
+import random
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+from ui.components.data_grid import DataGrid
+
+COLUMNS = [
+    {"key": "id", "title": "ID"},
+    {"key": "region", "title": "Region"},
+    {"key": "category", "title": "Category"},
+    {"key": "price", "title": "Price", "formatter": lambda x: f"${x:.2f}"},
+]
+
+def peak_rss_mb() -> float:
+    """Get peak resident memory of the process in MB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(42)
+    app = QApplication.instance() or QApplication(sys.argv)
+    grid = DataGrid()
+    grid.resize(800, 600)
+    grid.show()
+    grid.load_data({
+        "id": list(range(rows)),
+        "region": [f"Region {rng.randrange(10)}" for _ in range(rows)],
+        "category": [f"Category {rng.randrange(1000)}" for _ in range(rows)],
+        "price": [rng.random() * 1000 for _ in range(rows)],
+    }, COLUMNS)
+    app.processEvents()
+    print(f"rows: {rows:,}")
+    rss = peak_rss_mb()
+
+    for keys in (["region"], ["category"], ["region", "category"]):
+        start = time.perf_counter()
+        grid.set_group_by(keys)
+        app.processEvents()
+        model = grid._table_view.model()
+        print(f"group by {'/'.join(keys):18} {(time.perf_counter() - start) * 1000:8.1f} ms  "
+              f"({model.group_count:,} groups)")
+
+    start = time.perf_counter()
+    model.set_expanded(0, True)
+    app.processEvents()
+    print(f"expand region:               {(time.perf_counter() - start) * 1000:8.1f} ms  "
+          f"({model.rowCount() - model.group_count:,} subgroups)")
+    start = time.perf_counter()
+    model.set_expanded(1, True)
+    app.processEvents()
+    print(f"expand category:             {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+    start = time.perf_counter()
+    grid.sort_by([("price", Qt.DescendingOrder)])
+    while grid._model.is_sorting:
+        app.processEvents()
+    app.processEvents()
+    print(f"sort + regroup:              {(time.perf_counter() - start) * 1000:8.1f} ms")
+    print(f"peak memory growth:          {peak_rss_mb() - rss:8.1f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark DataGrid paint throughput for a full-screen grid.
+
+Usage:
+    python benchmarks/bench_grid_paint.py [rows] [frames]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+from ui.components.data_grid import DataGrid
+
+COLUMNS = [
+    {"key": "id", "title": "ID", "align": Qt.AlignRight | Qt.AlignVCenter},
+    {"key": "name", "title": "Name"},
+    {"key": "category", "title": "Category"},
+    {"key": "price", "title": "Price", "formatter": lambda x: f"${x:.2f}"},
+    {"key": "qty", "title": "Qty", "align": Qt.AlignRight | Qt.AlignVCenter},
+    {"key": "total", "title": "Total", "formatter": lambda x: f"${x:,.2f}"},
+]
+
+ROLES = (Qt.DisplayRole, Qt.TextAlignmentRole, Qt.ForegroundRole, Qt.BackgroundRole)
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    rng = random.Random(42)
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    price = [rng.random() * 1000 for _ in range(rows)]
+    qty = [rng.randrange(1, 100) for _ in range(rows)]
+    grid = DataGrid()
+    grid.resize(1920, 1080)
+    grid.show()
+    grid.load_data({
+        "id": list(range(rows)),
+        "name": [f"Product {rng.randrange(rows)}" for _ in range(rows)],
+        "category": [rng.choice(("Tools", "Garden", "Kitchen", "Toys")) for _ in range(rows)],
+        "price": price,
+        "qty": qty,
+        "total": [p * q for p, q in zip(price, qty)],
+    }, COLUMNS)
+    app.processEvents()
+
+    view = grid._table_view
+    viewport = view.viewport()
+    scrollbar = view.verticalScrollBar()
+    visible = view.rowAt(viewport.height() - 1) - view.rowAt(0) + 1
+    print(f"rows: {rows:,}  visible rows: {visible}  columns: {len(COLUMNS)}")
+
+    # Role lookups as issued by the delegate for every visible cell
+    model = grid._model
+    indexes = [model.index(row, column) for row in range(visible) for column in range(len(COLUMNS))]
+    for role in ROLES:
+        start = time.perf_counter()
+        for index in indexes * 10:
+            model.data(index, role)
+        rate = len(indexes) * 10 / (time.perf_counter() - start)
+        print(f"data() role {int(role):>2}:          {rate:12,.0f} calls/s")
+
+    # Full repaints while scrolling one page per frame
+    start = time.perf_counter()
+    for frame in range(frames):
+        scrollbar.setValue((frame * visible) % max(scrollbar.maximum(), 1))
+        viewport.repaint()
+    elapsed = time.perf_counter() - start
+    print(f"full-screen repaint:     {frames / elapsed:12.1f} frames/s ({elapsed / frames * 1000:.1f} ms/frame)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark keyed DataGrid reloads of refreshed data against full reloads.
+
+Refreshes change 1% of the rows, either only their values or also
+removing and inserting rows, and keep the rest identical. The diff time
+should grow linearly with the row count.
+
+Usage:
+    python benchmarks/bench_grid_reload.py [rows]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtWidgets import QApplication
+from ui.components.data_grid import DataGrid
+
+COLUMNS = [
+    {"key": "id", "title": "ID"},
+    {"key": "name", "title": "Name"},
+    {"key": "price", "title": "Price", "formatter": lambda x: f"${x:.2f}"},
+]
+
+def make_data(rows: int, rng: random.Random):
+    """Generate column arrays of ``rows`` rows."""
+    return {
+        "id": list(range(rows)),
+        "name": [f"Product {rng.randrange(rows)}" for _ in range(rows)],
+        "price": [rng.random() * 1000 for _ in range(rows)],
+    }
+
+def refresh(data, rng: random.Random, values_only: bool = False):
+    """Change the values of 1% of the rows, then remove and insert 1% of the rows."""
+    rows = len(data["id"])
+    data = {key: list(values) for key, values in data.items()}
+    for row in rng.sample(range(rows), rows // 100):
+        data["price"][row] = rng.random() * 1000
+    if values_only:
+        return data
+    removed = set(rng.sample(range(rows), rows // 100))
+    data = {key: [value for row, value in enumerate(values) if row not in removed] for key, values in data.items()}
+    for offset in range(rows // 100):
+        row = rng.randrange(len(data["id"]))
+        data["id"].insert(row, rows + offset)
+        data["name"].insert(row, "New")
+        data["price"].insert(row, rng.random() * 1000)
+    return data
+
+def main():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(42)
+    app = QApplication.instance() or QApplication(sys.argv)
+    grid = DataGrid()
+    grid.resize(800, 600)
+    grid.show()
+    for rows in (largest // 8, largest // 4, largest // 2, largest):
+        data = make_data(rows, rng)
+        print(f"rows: {rows:,}")
+        for label, values_only in (("values", True), ("values + rows", False)):
+            new_data = refresh(data, rng, values_only)
+            grid.load_data(data, COLUMNS)
+            grid._table_view.scrollToBottom()
+            app.processEvents()
+            
+            start = time.perf_counter()
+            grid.load_data(new_data, COLUMNS, key="id")
+            app.processEvents()
+            elapsed = time.perf_counter() - start
+            stats = grid.reload_stats
+            print(f"  keyed reload ({label:13}) {elapsed * 1000:8.1f} ms  "
+                  f"diff {stats['diff_ms']:7.1f} ms ({stats['diff_ms'] * 1e6 / rows:5.0f} ns/row)  "
+                  f"apply {stats['apply_ms']:7.1f} ms")
+            
+            start = time.perf_counter()
+            grid.load_data(new_data, COLUMNS)
+            app.processEvents()
+            print(f"  full reload  ({label:13}) {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
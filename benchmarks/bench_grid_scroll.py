@@ -0,0 +1,68 @@
+"""Benchmark scrolling a wide DataGrid with stylesheet and fast-path cell painting.
+
+Usage:
+    python benchmarks/bench_grid_scroll.py [rows] [frames] [columns]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+from ui.components.data_grid import DataGrid
+
+def make_data(rows: int, columns: int, rng: random.Random):
+    """Generate alternating text and number columns."""
+    data, config = {}, []
+    for column in range(columns):
+        key = f"c{column}"
+        if column % 2:
+            data[key] = [rng.random() * 1000 for _ in range(rows)]
+            config.append({"key": key, "title": f"Amount {column}", "width": 90,
+                           "align": Qt.AlignRight | Qt.AlignVCenter, "formatter": lambda x: f"{x:,.2f}"})
+        else:
+            data[key] = [f"Item {rng.randrange(rows)}" for _ in range(rows)]
+            config.append({"key": key, "title": f"Name {column}", "width": 110})
+    return data, config
+
+def scroll(app: QApplication, grid: DataGrid, frames: int) -> float:
+    """Scroll a few rows per frame, repainting each time; returns frames per second."""
+    view = grid._table_view
+    viewport = view.viewport()
+    scrollbar = view.verticalScrollBar()
+    app.processEvents()
+    start = time.perf_counter()
+    for frame in range(frames):
+        scrollbar.setValue((frame * 3) % max(scrollbar.maximum(), 1))
+        viewport.repaint()
+    return frames / (time.perf_counter() - start)
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    columns = int(sys.argv[3]) if len(sys.argv) > 3 else 24
+    rng = random.Random(42)
+    app = QApplication.instance() or QApplication(sys.argv)
+    data, config = make_data(rows, columns, rng)
+
+    grid = DataGrid()
+    grid.resize(1920, 1080)
+    grid.show()
+    grid.load_data(data, config)
+    view = grid._table_view
+    view.selectRow(5)
+    visible = view.rowAt(view.viewport().height() - 1) - view.rowAt(0) + 1
+    cells = visible * (view.columnAt(view.viewport().width() - 1) - view.columnAt(0) + 1)
+    print(f"rows: {rows:,}  columns: {columns}  visible cells: {cells:,}")
+
+    for label, fast in (("stylesheet", False), ("fast delegate", True)):
+        grid.set_fast_painting(fast)
+        fps = scroll(app, grid, frames)
+        print(f"{label:14} {fps:8.1f} frames/s ({1000 / fps:6.1f} ms/frame, {fps * cells / 1e3:7.0f}k cells/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark reopening DataGrid data from a binary snapshot against parsing CSV.
+
+The CSV reopen parses every row and loads it; the snapshot reopen maps
+the file and copies its buffers, restoring the saved sort without
+sorting again.
+
+Usage:
+    python benchmarks/bench_grid_snapshot.py [rows]
+"""
+
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+from ui.components.data_grid import DataGrid
+
+COLUMNS = [
+    {"key": "id", "title": "ID", "type": "int"},
+    {"key": "name", "title": "Name", "type": "str"},
+    {"key": "category", "title": "Category", "type": "str"},
+    {"key": "price", "title": "Price", "type": "float"},
+]
+
+CATEGORIES = ["Books", "Games", "Garden", "Music", "Tools", "Toys"]
+
+def make_data(rows: int):
+    """Generate column arrays of ``rows`` rows."""
+    rng = random.Random(42)
+    return {
+        "id": list(range(rows)),
+        "name": [f"Product {rng.randrange(rows)}" for _ in range(rows)],
+        "category": [rng.choice(CATEGORIES) for _ in range(rows)],
+        "price": [round(rng.random() * 1000, 2) for _ in range(rows)],
+    }
+
+def read_csv(path: str):
+    """Parse a CSV file into column arrays."""
+    with open(path, newline="") as file:
+        reader = csv.reader(file)
+        next(reader)
+        ids, names, categories, prices = zip(*reader)
+    return {
+        "id": list(map(int, ids)),
+        "name": list(names),
+        "category": list(categories),
+        "price": list(map(float, prices)),
+    }
+
+def timed(app: QApplication, action) -> float:
+    """Run an action and pending events, returning the elapsed milliseconds."""
+    start = time.perf_counter()
+    action()
+    app.processEvents()
+    return (time.perf_counter() - start) * 1000
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    app = QApplication.instance() or QApplication(sys.argv)
+    grid = DataGrid()
+    grid.resize(800, 600)
+    grid.show()
+    data = make_data(rows)
+    grid.load_data(data, COLUMNS)
+    grid.sort_by([("price", Qt.DescendingOrder)])
+    while grid._model.is_sorting:
+        app.processEvents()
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "data.csv")
+        snapshot_path = os.path.join(directory, "data.snapshot")
+        with open(csv_path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(data)
+            writer.writerows(zip(*data.values()))
+        save_ms = timed(app, lambda: grid.save_snapshot(snapshot_path))
+        print(f"rows: {rows:,}  csv: {os.path.getsize(csv_path) / 1e6:.1f} MB  "
+              f"snapshot: {os.path.getsize(snapshot_path) / 1e6:.1f} MB (saved in {save_ms:.0f} ms)")
+
+        def reopen_csv():
+            grid.load_data(read_csv(csv_path), COLUMNS)
+            grid.sort_by([("price", Qt.DescendingOrder)])
+            while grid._model.is_sorting:
+                app.processEvents()
+
+        for label, action in (
+            ("csv parse + load + sort", reopen_csv),
+            ("snapshot (verified)", lambda: grid.load_snapshot(snapshot_path)),
+            ("snapshot (unverified)", lambda: grid.load_snapshot(snapshot_path, verify=False)),
+        ):
+            print(f"{label:24} {timed(app, action):8.0f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark DataGrid sorting against the legacy string-key sort.
+
+Usage:
+    python benchmarks/bench_grid_sort.py [rows]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.components.data_grid_store import ColumnStore
+from ui.components.data_grid_sort import SortEngine
+
+COLUMNS = [
+    {"key": "id", "title": "ID"},
+    {"key": "name", "title": "Name"},
+    {"key": "price", "title": "Price"},
+]
+
+def make_rows(count: int):
+    """Generate sample rows in random order."""
+    rng = random.Random(42)
+    return [
+        {"id": rng.randrange(count), "name": f"item-{rng.randrange(count)}", "price": rng.random() * 1000}
+        for _ in range(count)
+    ]
+
+def timed(func) -> float:
+    """Run func once and return elapsed milliseconds."""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    data = make_rows(rows)
+    store = ColumnStore.from_rows(data, COLUMNS)
+    print(f"rows: {rows:,}")
+    print(f"{'column':8} {'legacy':>10} {'cold':>10} {'warm asc':>10} {'warm desc':>10} {'chunked':>10}  (ms)")
+
+    engine = SortEngine()
+    for key in ("id", "name", "price"):
+        legacy_rows = list(data)
+        legacy = timed(lambda: legacy_rows.sort(key=lambda x: str(x.get(key, ""))))
+        cold = timed(lambda: engine.argsort(store, [(key, False)]))
+        warm_asc = timed(lambda: engine.argsort(store, [(key, False)]))
+        warm_desc = timed(lambda: engine.argsort(store, [(key, True)]))
+        chunked = timed(lambda: SortEngine().argsort(store, [(key, False)], chunked=True))
+        print(f"{key:8} {legacy:10.1f} {cold:10.1f} {warm_asc:10.1f} {warm_desc:10.1f} {chunked:10.1f}")
+
+    # Keys for both columns are cached from the runs above
+    multi = timed(lambda: engine.argsort(store, [("name", False), ("price", True)]))
+    print(f"multi-column (name, price desc), warm: {multi:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark opening, sorting and filtering a large SQLite table in DataGrid.
+
+Usage:
+    python benchmarks/bench_grid_sqlite.py [rows]
+"""
+
+import os
+import resource
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+from ui.components.data_grid import DataGrid
+from ui.components.data_grid_sqlite import SqliteSource
+
+def create_table(path: str, rows: int):
+    """Create a table of generated rows with an index on ``price`` and an FTS index on ``name``."""
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE products (id INTEGER PRIMARY KEY, name TEXT, price REAL)")
+    connection.execute(
+        "INSERT INTO products "
+        "WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i + 1 < ?) "
+        "SELECT i, 'Product ' || ((i * 7919) % ?), ((i * 104729) % 100000) / 100.0 FROM n",
+        (rows, rows),
+    )
+    connection.execute("CREATE INDEX products_price ON products (price)")
+    connection.execute(
+        "CREATE VIRTUAL TABLE products_fts USING fts5(name, content='products', content_rowid='id')"
+    )
+    connection.execute("INSERT INTO products_fts(products_fts) VALUES ('rebuild')")
+    connection.commit()
+    connection.close()
+
+def peak_rss_mb() -> float:
+    """Get peak resident memory of the process in MB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    app = QApplication.instance() or QApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "products.db")
+        start = time.perf_counter()
+        create_table(path, rows)
+        print(f"rows: {rows:,}  created in {time.perf_counter() - start:.1f}s")
+        rss = peak_rss_mb()
+
+        grid = DataGrid()
+        source = SqliteSource(path, table="products")
+        start = time.perf_counter()
+        grid.load_source(source, source.columns)
+        print(f"open:                  {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+        model = grid._model
+        start = time.perf_counter()
+        pages = 0
+        while model.rowCount() < 200_000 and model.canFetchMore():
+            model.fetchMore()
+            pages += 1
+        elapsed = time.perf_counter() - start
+        print(f"scroll {model.rowCount():,} rows:   {elapsed / pages * 1000:8.2f} ms/page (keyset)")
+
+        deep = rows // 2
+        start = time.perf_counter()
+        source.fetch(deep, 1000)
+        print(f"page at row {deep:,}: {(time.perf_counter() - start) * 1000:8.1f} ms (offset)")
+
+        start = time.perf_counter()
+        grid.sort_by([("price", Qt.DescendingOrder)])
+        print(f"sort by price:         {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+        start = time.perf_counter()
+        model.set_filter_text("Product 12345")
+        print(f"filter (LIKE):         {(time.perf_counter() - start) * 1000:8.1f} ms  "
+              f"({model.rowCount():,} rows)")
+        print(f"peak memory growth:    {peak_rss_mb() - rss:8.1f} MB")
+        source.close()
+
+        source = SqliteSource(path, table="products", fts_table="products_fts")
+        grid.load_source(source, source.columns)
+        grid.sort_by([("price", Qt.DescendingOrder)])
+        model = grid._model
+        start = time.perf_counter()
+        model.set_filter_text("Product 12345")
+        print(f"filter (FTS):          {(time.perf_counter() - start) * 1000:8.1f} ms  "
+              f"({model.rowCount():,} rows)")
+        source.close()
+        app.processEvents()
+
+if __name__ == "__main__":
+    main()
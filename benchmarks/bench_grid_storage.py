@@ -0,0 +1,116 @@
+"""Benchmark DataGrid storage: memory per row and data() latency.
+
+Compares the legacy list-of-dicts model against the column store.
+
+Usage:
+    python benchmarks/bench_grid_storage.py [rows]
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from ui.components.data_grid import DataGridModel
+from ui.components.data_grid_store import ColumnStore
+from ui.themes.theme_engine import ThemeEngine
+
+COLUMNS = [
+    {"key": "id", "title": "ID"},
+    {"key": "name", "title": "Name"},
+    {"key": "price", "title": "Price", "formatter": lambda x: f"${x:.2f}"},
+    {"key": "qty", "title": "Qty"},
+]
+
+ROLES = (Qt.DisplayRole, Qt.TextAlignmentRole, Qt.ForegroundRole, Qt.BackgroundRole)
+VIEWPORT_ROWS = 40
+
+class LegacyModel(QAbstractTableModel):
+    """List-of-dicts model as it was before the column store."""
+
+    def __init__(self, data: List[Dict], columns: List[Dict]):
+        super().__init__()
+        self._data = data
+        self._columns = columns
+        self._theme_engine = ThemeEngine.get_instance()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return len(self._data)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return len(self._columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        col_config = self._columns[index.column()]
+        item = self._data[index.row()].get(col_config["key"], "")
+        if role == Qt.DisplayRole:
+            formatter = col_config.get("formatter")
+            return formatter(item) if formatter else str(item)
+        elif role == Qt.TextAlignmentRole:
+            return col_config.get("align", Qt.AlignLeft | Qt.AlignVCenter)
+        elif role == Qt.ForegroundRole:
+            return self._theme_engine.get_color("text")
+        elif role == Qt.BackgroundRole:
+            return self._theme_engine.get_color(
+                "alternate_bg" if index.row() % 2 else "background"
+            )
+        return None
+
+def make_rows(count: int) -> List[Dict]:
+    """Generate sample rows."""
+    names = [f"product-{i}" for i in range(1000)]
+    return [
+        {"id": i, "name": names[i % 1000], "price": i * 0.25, "qty": i % 97}
+        for i in range(count)
+    ]
+
+def measure_memory(build) -> int:
+    """Measure bytes retained by the object returned from build()."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+def measure_scroll(model, rows: int, pages: int = 200) -> float:
+    """Average time to fetch all roles for one viewport, in milliseconds."""
+    rng = random.Random(42)
+    columns = model.columnCount()
+    start = time.perf_counter()
+    for _ in range(pages):
+        top = rng.randrange(max(1, rows - VIEWPORT_ROWS))
+        for row in range(top, top + VIEWPORT_ROWS):
+            for column in range(columns):
+                index = model.index(row, column)
+                for role in ROLES:
+                    model.data(index, role)
+    return (time.perf_counter() - start) * 1000 / pages
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"rows: {rows:,}")
+
+    legacy_bytes = measure_memory(lambda: make_rows(rows))
+    data = make_rows(rows)
+    store_bytes = measure_memory(lambda: ColumnStore.from_rows(data, COLUMNS))
+    per_million = 1_000_000 / rows
+    print(f"memory  list-of-dicts: {legacy_bytes * per_million / 2**20:8.1f} MiB per 1M rows")
+    print(f"memory  column store:  {store_bytes * per_million / 2**20:8.1f} MiB per 1M rows")
+
+    legacy = LegacyModel(data, COLUMNS)
+    model = DataGridModel(ColumnStore.from_rows(data, COLUMNS), COLUMNS)
+    print(f"data()  list-of-dicts: {measure_scroll(legacy, rows):8.3f} ms per viewport")
+    print(f"data()  column store:  {measure_scroll(model, rows):8.3f} ms per viewport")
+
+if __name__ == "__main__":
+    main()
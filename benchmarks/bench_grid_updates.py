@@ -0,0 +1,80 @@
+"""Benchmark incremental DataGrid row updates on a sorted grid.
+
+Usage:
+    python benchmarks/bench_grid_updates.py [rows]
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+from ui.components.data_grid import DataGrid
+
+COLUMNS = [
+    {"key": "id", "title": "ID"},
+    {"key": "name", "title": "Name"},
+    {"key": "price", "title": "Price", "formatter": lambda x: f"${x:.2f}"},
+]
+
+UPDATES = 10_000
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(42)
+    app = QApplication.instance() or QApplication(sys.argv)
+    grid = DataGrid()
+    grid.resize(800, 600)
+    grid.show()
+    grid.load_data({
+        "id": list(range(rows)),
+        "name": [f"Product {rng.randrange(rows)}" for _ in range(rows)],
+        "price": [rng.random() * 1000 for _ in range(rows)],
+    }, COLUMNS)
+    grid.sort_by([("price", Qt.AscendingOrder)])
+    while grid._model.is_sorting:
+        app.processEvents()
+    print(f"rows: {rows:,}")
+
+    cases = [
+        ("name (unsorted column)", lambda row_id: {"id": row_id, "name": f"Product {rng.randrange(rows)}"}),
+        ("price (sorted column)", lambda row_id: {"id": row_id, "price": rng.random() * 1000}),
+    ]
+    for label, make_update in cases:
+        for batch in (1, 100):
+            ids = rng.sample(range(rows), UPDATES)
+            start = time.perf_counter()
+            for offset in range(0, UPDATES, batch):
+                grid.update_rows([make_update(row_id) for row_id in ids[offset:offset + batch]])
+                app.processEvents()
+            rate = UPDATES / (time.perf_counter() - start)
+            print(f"update {label:24} batch {batch:>3}  {rate:10,.0f} rows/s")
+
+    # Producer thread feeding the coalescing queue while the UI keeps running
+    def produce():
+        for _ in range(UPDATES * 10):
+            grid.queue_update({"id": rng.randrange(rows // 100), "price": rng.random() * 1000})
+    producer = threading.Thread(target=produce)
+    start = time.perf_counter()
+    producer.start()
+    while producer.is_alive():
+        app.processEvents()
+    grid._model.flush_updates()
+    elapsed = time.perf_counter() - start
+    print(f"queued updates:          {UPDATES * 10 / elapsed:10,.0f} cells/s  {grid.update_stats}")
+
+    start = time.perf_counter()
+    grid.append_rows([{"id": rows + i, "name": "New", "price": rng.random() * 1000} for i in range(1000)])
+    print(f"append 1,000 rows:       {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+    start = time.perf_counter()
+    grid.remove_rows(rng.sample(range(rows), 1000))
+    print(f"remove 1,000 rows:       {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
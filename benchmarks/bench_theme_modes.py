@@ -0,0 +1,79 @@
+"""Benchmark per-widget stylesheets against the application stylesheet mode.
+
+Builds a window holding many themed buttons, inputs and checkboxes,
+then switches the theme back and forth, unbatched and batched, in each
+ThemeEngine style mode.
+
+Usage:
+    python benchmarks/bench_theme_modes.py [widgets]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication, QGridLayout, QWidget
+from ui.components.button import StyledButton
+from ui.components.checkbox import Checkbox
+from ui.components.input import StyledInput
+from ui.themes.theme_engine import ThemeEngine
+
+COLUMNS = 20
+
+def make_widget(index: int) -> QWidget:
+    """Create the themed widget for a grid cell."""
+    kind = index % 4
+    if kind == 0:
+        return StyledButton(f"Button {index}")
+    if kind == 1:
+        button = StyledButton(f"Button {index}")
+        button.set_secondary()
+        return button
+    if kind == 2:
+        return StyledInput(f"Input {index}")
+    return Checkbox(f"Check {index}")
+
+def build_window(count: int) -> QWidget:
+    """Create and show a window with ``count`` themed widgets."""
+    window = QWidget()
+    layout = QGridLayout(window)
+    for index in range(count):
+        layout.addWidget(make_widget(index), index // COLUMNS, index % COLUMNS)
+    window.show()
+    return window
+
+def timed(app: QApplication, action) -> float:
+    """Run an action and pending events, returning the elapsed milliseconds."""
+    start = time.perf_counter()
+    result = action()
+    app.processEvents()
+    return (time.perf_counter() - start) * 1000, result
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    app = QApplication.instance() or QApplication(sys.argv)
+    engine = ThemeEngine.get_instance()
+    print(f"widgets: {count:,}")
+    for mode in ("widget", "application"):
+        engine.switch_theme("light")
+        engine.set_style_mode(mode)
+        app.processEvents()
+        construct_ms, window = timed(app, lambda: build_window(count))
+        print(f"{mode:12} construct {construct_ms:8.0f} ms")
+        for batched in (False, True):
+            dark_ms, _ = timed(app, lambda: engine.switch_theme("dark", batched))
+            light_ms, _ = timed(app, lambda: engine.switch_theme("light", batched))
+            stats = engine.switch_stats
+            print(f"  {'batched' if batched else 'unbatched':10} switch to dark {dark_ms:8.0f} ms  "
+                  f"switch to light {light_ms:8.0f} ms  "
+                  f"({stats['widgets']:,} widgets themed, {stats['restyled']:,} restyled)")
+        window.close()
+        window.deleteLater()
+        app.sendPostedEvents(None, QEvent.DeferredDelete)
+    engine.set_style_mode("widget")
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,20 @@
 """Test data grid component."""
 
+import sqlite3
+import threading
 import pytest
+from array import array
+from decimal import Decimal
+from fractions import Fraction
 from PySide6.QtCore import Qt, QModelIndex, QPoint
 from PySide6.QtTest import QTest
 from PySide6.QtWidgets import QHeaderView
+from ui.components import data_grid, data_grid_export, data_grid_file
 from ui.components.data_grid import DataGrid, DataGridModel
+from ui.components.data_grid_delegate import FastGridDelegate
+from ui.components.data_grid_store import ColumnStore
+from ui.components.data_grid_search import SearchIndex
+from ui.components.data_grid_sqlite import SqliteSource
 from ui.themes.theme_engine import ThemeEngine
 
 @pytest.fixture
@@ -135,6 +145,96 @@ def test_row_selection(qtbot, sample_data, sample_columns):
     assert selected_data is not None
     assert selected_data["name"] == "Alice"
 
+def test_multi_row_selection(qtbot, sample_columns):
+    """Test extended selections are kept as row ranges through view changes."""
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.show()
+    grid.load_data({"id": list(range(10)), "name": [f"n{i}" for i in range(10)], "age": [0] * 10}, sample_columns)
+    selections = []
+    grid.rows_selected.connect(selections.append)
+    
+    grid.select_all()
+    assert selections[-1].ranges == [(0, 9)]
+    assert len(selections[-1]) == 10
+    grid._model.sort(0, Qt.DescendingOrder)
+    assert grid.selected_rows().ranges == [(0, 9)]
+    
+    # Click, then shift-click selects the rows in between
+    view = grid._table_view
+    def click(row, modifier=Qt.NoModifier):
+        rect = view.visualRect(grid._proxy_model.index(row, 0))
+        qtbot.mouseClick(view.viewport(), Qt.LeftButton, modifier, rect.center())
+    click(1)
+    click(4, Qt.ShiftModifier)
+    assert grid.selected_rows().ranges == [(1, 4)]
+    assert list(grid.selected_rows()) == [8, 7, 6, 5]
+    click(2, Qt.ControlModifier)
+    assert grid.selected_rows().ranges == [(1, 1), (3, 4)]
+    assert view.selectionModel().isSelected(grid._proxy_model.index(3, 1))
+    
+    # Selected rows follow their data through sorting, filtering and edits
+    grid._model.sort(0, Qt.AscendingOrder)
+    assert list(grid.selected_rows()) == [5, 6, 8]
+    grid._model.set_filter_text("8")
+    assert list(grid.selected_rows()) == [8]
+    grid._model.set_filter_text("")
+    assert list(grid.selected_rows()) == [8]
+    grid.select_all()
+    grid.remove_rows([0, 1])
+    grid.append_rows([{"id": 10, "name": "n10", "age": 0}])
+    assert grid.selected_rows().ranges == [(0, 7)]
+    grid.clear_selection()
+    assert not grid.selected_rows()
+
+def test_group_by(qtbot, sample_columns):
+    """Test grouped rows expand lazily and follow sorting, filtering and edits."""
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.show()
+    grid.load_data([{"id": i, "name": "abc"[i % 3], "age": 20 + i % 2} for i in range(9)], sample_columns)
+    clicked = []
+    grid.row_selected.connect(clicked.append)
+    
+    grid.set_group_by(["name"])
+    model = grid._table_view.model()
+    view = grid._table_view
+    assert grid.group_by == ["name"]
+    assert [model.data(model.index(row, 0)) for row in range(model.rowCount())] == [
+        "▸ Name: a (3)", "▸ Name: b (3)", "▸ Name: c (3)"
+    ]
+    assert view.columnSpan(0, 0) == 3
+    
+    # Clicking a group row expands it; clicking a row selects it
+    def click(row):
+        qtbot.mouseClick(view.viewport(), Qt.LeftButton, pos=view.visualRect(model.index(row, 1)).center())
+    click(1)
+    assert model.rowCount() == 6
+    assert [model.data(model.index(row, 0)) for row in (2, 3, 4)] == ["1", "4", "7"]
+    click(3)
+    assert clicked[-1]["id"] == 4
+    assert list(grid.selected_rows()) == [4]
+    
+    # Nested groups keep their expanded state through sorting and edits
+    grid.set_group_by(["name", "age"])
+    model = view.model()
+    model.set_expanded(0, True)
+    model.set_expanded(1, True)
+    assert [model.data(model.index(row, 0)) for row in range(5)] == [
+        "▾ Name: a (3)", "    ▾ Age: 20 (2)", "0", "6", "    ▸ Age: 21 (1)"
+    ]
+    grid.sort_by([("name", Qt.DescendingOrder), ("id", Qt.DescendingOrder)])
+    qtbot.waitUntil(lambda: model.data(model.index(0, 0)) == "▸ Name: c (3)")
+    assert model.data(model.index(2, 0)) == "▾ Name: a (3)"
+    assert [model.data(model.index(row, 0)) for row in (4, 5)] == ["6", "0"]
+    grid.update_rows([{"id": 6, "name": "b"}])
+    qtbot.waitUntil(lambda: model.data(model.index(1, 0)) == "▸ Name: b (4)")
+    assert model.data(model.index(4, 0)) == "0"
+    
+    grid.set_group_by(None)
+    assert view.model() is grid._proxy_model
+    assert view.columnSpan(0, 0) == 1
+
 def test_theme_integration(qtbot, sample_data, sample_columns):
     """Test theme changes."""
     engine = ThemeEngine.get_instance()
@@ -156,6 +256,30 @@ def test_theme_integration(qtbot, sample_data, sample_columns):
     assert grid._table_view.styleSheet() != initial_style
     assert "#212529" in grid._table_view.styleSheet()  # Dark theme background
 
+def test_fast_painting(qtbot, sample_data, sample_columns):
+    """Test the fast-path delegate paints selection with theme colors."""
+    engine = ThemeEngine.get_instance()
+    engine.switch_theme("light")
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_data(sample_data, sample_columns)
+    grid.set_fast_painting(True)
+    view = grid._table_view
+    
+    assert isinstance(view.itemDelegate(), FastGridDelegate)
+    assert "QTableView::item" not in view.styleSheet()
+    
+    grid.show()
+    view.selectRow(1)
+    QTest.qWait(50)
+    rect = view.visualRect(view.model().index(1, 0))
+    image = view.viewport().grab().toImage()
+    assert image.pixelColor(rect.left() + 2, rect.center().y()).name() == engine.theme_data["primary"]
+    
+    grid.set_fast_painting(False)
+    assert not isinstance(view.itemDelegate(), FastGridDelegate)
+    assert "QTableView::item" in view.styleSheet()
+
 def test_custom_formatter(qtbot):
     """Test custom cell formatting."""
     data = [{"value": 123.456}]
@@ -196,4 +320,632 @@ def test_clear_filter(qtbot, sample_data, sample_columns):
     
     # Verify all rows visible
     assert grid._proxy_model.rowCount() == len(sample_data)
-    assert grid._filter_bar.search_input.text() == ""
\ No newline at end of file
+    assert grid._filter_bar.search_input.text() == ""
+
+def test_column_store_typed_buffers(sample_data, sample_columns):
+    """Test column store packs numeric columns into typed arrays."""
+    store = ColumnStore.from_rows(sample_data, sample_columns)
+    
+    assert len(store) == len(sample_data)
+    assert isinstance(store.column("id"), array)
+    assert store.column("id").typecode == "q"
+    assert isinstance(store.column("name"), list)
+    assert store.row(1) == {"id": 2, "name": "Bob", "age": 25}
+
+def test_load_column_arrays(qtbot, sample_columns):
+    """Test loading data as column arrays."""
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    
+    grid.load_data({
+        "id": array("q", [1, 2]),
+        "name": ["Alice", "Bob"],
+        "age": [30.5, 25.0],
+    }, sample_columns)
+    
+    assert grid._model.rowCount() == 2
+    assert grid._model.data(grid._model.index(1, 1), Qt.DisplayRole) == "Bob"
+    assert grid._model.data(grid._model.index(0, 2), Qt.DisplayRole) == "30.5"
+    assert grid._model.store.column("age").typecode == "d"
+
+def test_load_column_arrays_copied(qtbot, sample_columns):
+    """Test edits to loaded column arrays leave the caller's buffers unchanged."""
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    ids = array("q", [1, 2])
+    ages = array("d", [30.5, 25.0])
+    
+    grid.load_data({"id": ids, "name": ["Alice", "Bob"], "age": ages}, sample_columns)
+    grid._model.append_rows([{"id": 3, "name": "Carol", "age": 41.0}])
+    grid._model.update_rows([{"id": 1, "age": 31.5}])
+    
+    assert grid._model.rowCount() == 3
+    assert ids == array("q", [1, 2])
+    assert ages == array("d", [30.5, 25.0])
+
+class CountingSource:
+    """Paged test source that generates rows on demand."""
+    
+    def __init__(self, total: int):
+        self.total = total
+        self.fetches = []
+        
+    def row_count_hint(self):
+        return self.total
+        
+    def fetch(self, offset, limit):
+        self.fetches.append(offset)
+        end = min(offset + limit, self.total)
+        return [{"id": i, "name": f"row-{i}", "age": i % 90} for i in range(offset, end)]
+
+def test_paged_source(qtbot, sample_columns):
+    """Test lazy paging from a data source."""
+    source = CountingSource(1000)
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    
+    grid.load_source(source, sample_columns, page_size=100, max_pages=2)
+    
+    # Only the first page is fetched up front
+    assert grid._model.rowCount() == 100
+    assert source.fetches == [0]
+    assert grid._model.canFetchMore(QModelIndex())
+    
+    grid._model.fetchMore(QModelIndex())
+    grid._model.fetchMore(QModelIndex())
+    assert grid._model.rowCount() == 300
+    assert grid._model.store.cached_pages == 2
+    
+    # Evicted pages are fetched again on access
+    assert grid._model.data(grid._model.index(5, 1), Qt.DisplayRole) == "row-5"
+    assert source.fetches[-1] == 0
+    assert grid._model.store.cached_pages == 2
+
+def test_paged_source_end(qtbot, sample_columns):
+    """Test paging stops at the end of the source."""
+    source = CountingSource(150)
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    
+    grid.load_source(source, sample_columns, page_size=100)
+    grid._model.fetchMore(QModelIndex())
+    
+    assert grid._model.rowCount() == 150
+    assert not grid._model.canFetchMore(QModelIndex())
+
+def test_paged_source_sort(qtbot, sample_columns):
+    """Test header sorting orders the loaded rows of a paged source by value."""
+    source = CountingSource(150)
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    
+    grid.load_source(source, sample_columns, page_size=100)
+    grid._model.fetchMore(QModelIndex())
+    grid._table_view.sortByColumn(2, Qt.DescendingOrder)
+    
+    proxy = grid._table_view.model()
+    ages = [int(proxy.index(row, 2).data()) for row in range(proxy.rowCount())]
+    assert len(ages) == 150
+    assert ages == sorted(ages, reverse=True)
+    
+    grid._table_view.sortByColumn(0, Qt.AscendingOrder)
+    assert [proxy.index(row, 0).data() for row in range(3)] == ["0", "1", "2"]
+
+def test_numeric_sort(qtbot, sample_columns):
+    """Test numeric columns sort by value, not by text."""
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_data([
+        {"id": 10, "name": "a", "age": 1},
+        {"id": 9, "name": "b", "age": 2},
+        {"id": 100, "name": "c", "age": 3},
+    ], sample_columns)
+    
+    grid._model.sort(0, Qt.AscendingOrder)
+    
+    ids = [grid._model.data(grid._model.index(row, 0)) for row in range(3)]
+    assert ids == ["9", "10", "100"]
+    # Sorting permutes the view, not the stored rows
+    assert list(grid._model.store.column("id")) == [10, 9, 100]
+    
+    grid.load_data([
+        {"id": Decimal("10"), "name": "a", "age": 1},
+        {"id": Decimal("9.5"), "name": "b", "age": 2},
+        {"id": Fraction(1, 3), "name": "c", "age": 3},
+        {"id": 100, "name": "d", "age": 4},
+    ], sample_columns)
+    grid._model.sort(0, Qt.DescendingOrder)
+    assert [grid._model.row_data(row)["name"] for row in range(4)] == ["d", "a", "b", "c"]
+
+def test_multi_column_sort(qtbot, sample_columns):
+    """Test stable sort on several columns."""
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_data([
+        {"id": 1, "name": "b", "age": 30},
+        {"id": 2, "name": "a", "age": 30},
+        {"id": 3, "name": "c", "age": 25},
+    ], sample_columns)
+    
+    grid.sort_by([("age", Qt.DescendingOrder), ("name", Qt.AscendingOrder)])
+    
+    assert [grid._model.row_data(row)["id"] for row in range(3)] == [2, 1, 3]
+    assert grid._model.sort_spec == [("age", True), ("name", False)]
+
+def test_background_sort(qtbot, monkeypatch, sample_columns):
+    """Test large sorts run on a worker thread."""
+    monkeypatch.setattr(data_grid, "ASYNC_SORT_THRESHOLD", 0)
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_data([{"id": i, "name": str(i), "age": -i} for i in range(1000)], sample_columns)
+    
+    grid._model.sort(2, Qt.AscendingOrder)
+    assert grid._model.is_sorting
+    
+    qtbot.waitUntil(lambda: not grid._model.is_sorting, timeout=5000)
+    assert grid._model.row_data(0)["id"] == 999
+
+def test_search_index(sample_data, sample_columns):
+    """Test search index matches formatted text and refines narrowing queries."""
+    columns = sample_columns + [{"key": "age", "title": "Label", "formatter": lambda x: f"{x} yrs"}]
+    index = SearchIndex.build(ColumnStore.from_rows(sample_data, columns), columns)
+    
+    assert list(index.search("LI")) == [0, 2]
+    assert list(index.search("lic")) == [0]  # Refined from previous matches
+    assert list(index.search("25 yrs")) == [1]
+    assert index.search("") is None
+
+def test_filter_with_sort(qtbot, sample_data, sample_columns):
+    """Test filtering keeps the active sort order."""
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_data(sample_data, sample_columns)
+    
+    grid._model.sort(2, Qt.DescendingOrder)
+    grid._filter_bar.search_input.setText("li")
+    
+    names = [grid._proxy_model.index(row, 1).data() for row in range(grid._proxy_model.rowCount())]
+    assert names == ["Charlie", "Alice"]
+
+def test_background_filter(qtbot, monkeypatch, sample_columns):
+    """Test large filters are debounced and run on a worker thread."""
+    monkeypatch.setattr(data_grid, "ASYNC_FILTER_THRESHOLD", 0)
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_data([{"id": i, "name": f"user{i}", "age": i} for i in range(1000)], sample_columns)
+    grid._model.sort(0, Qt.DescendingOrder)
+    
+    grid._filter_bar.search_input.setText("user1")
+    grid._filter_bar.search_input.setText("user12")  # Supersedes the pending query
+    assert grid._filter_bar.status_label.isVisibleTo(grid)
+    assert grid._proxy_model.rowCount() == 1000  # Unchanged until the filter completes
+    
+    qtbot.waitUntil(lambda: grid._proxy_model.rowCount() == 11, timeout=5000)
+    assert grid._model.filter_text == "user12"
+    assert grid._model.row_data(0)["id"] == 129
+    qtbot.waitUntil(lambda: not grid._filter_bar.status_label.isVisibleTo(grid))
+
+def test_append_rows(qtbot, sample_data, sample_columns):
+    """Test appended rows are inserted at their sorted position."""
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_data(sample_data, sample_columns)
+    grid._model.sort(2, Qt.AscendingOrder)
+    
+    with qtbot.waitSignal(grid._model.rowsInserted) as blocker:
+        grid.append_rows([{"id": 4, "name": "Dave", "age": 28}])
+    
+    assert blocker.args[1:] == [1, 1]
+    assert [grid._model.row_data(row)["id"] for row in range(4)] == [2, 4, 1, 3]
+
+def test_update_rows(qtbot, sample_data, sample_columns):
+    """Test keyed updates move sorted rows and keep the selection."""
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_data(sample_data, sample_columns)
+    grid._model.sort(2, Qt.AscendingOrder)
+    grid._table_view.selectRow(0)  # Bob
+    
+    grid.update_rows([{"id": 2, "age": 40}, {"id": 3, "name": "Carl"}])
+    
+    assert [grid._model.row_data(row)["id"] for row in range(3)] == [1, 3, 2]
+    assert grid._model.row_data(1)["name"] == "Carl"
+    selected = grid._table_view.selectionModel().selectedRows()
+    assert [index.row() for index in selected] == [2]
+    with pytest.raises(KeyError):
+        grid.update_rows([{"id": 99, "age": 1}])
+
+def test_remove_rows(qtbot, sample_data, sample_columns):
+    """Test removing rows keeps sort and filter state."""
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_data(sample_data, sample_columns)
+    grid._model.sort(2, Qt.DescendingOrder)
+    grid._filter_bar.search_input.setText("li")
+    
+    grid.remove_rows([3])
+    
+    assert grid._proxy_model.rowCount() == 1
+    assert grid._model.row_data(0)["name"] == "Alice"
+    grid._filter_bar.search_input.clear()
+    assert [grid._model.row_data(row)["id"] for row in range(2)] == [1, 2]
+
+def test_keyed_reload(qtbot, sample_columns):
+    """Test a keyed reload only notifies the rows that differ."""
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    names = ["a", "b", "c", "d", "e"]
+    grid.load_data([{"id": i, "name": name, "age": 20 + i} for i, name in enumerate(names)], sample_columns)
+    model = grid._model
+    grid._table_view.selectRow(3)
+    resets, changes = [], []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.dataChanged.connect(lambda first, last, roles: changes.append((first.row(), last.row())))
+    
+    # Remove "b", rename "c", insert "f" before "a" and move "e" up
+    rows = [
+        {"id": 5, "name": "f", "age": 25},
+        {"id": 0, "name": "a", "age": 20},
+        {"id": 4, "name": "e", "age": 24},
+        {"id": 2, "name": "C", "age": 22},
+        {"id": 3, "name": "d", "age": 23},
+    ]
+    grid.load_data(rows, sample_columns, key="id")
+    
+    assert grid._model is model
+    assert not resets
+    assert changes == [(2, 2)]
+    assert [model.row_data(row)["name"] for row in range(model.rowCount())] == ["f", "a", "e", "C", "d"]
+    assert [row["name"] for row in map(model.row_data, grid.selected_rows())] == ["d"]
+    stats = grid.reload_stats
+    assert (stats["removed"], stats["changed"], stats["inserted"], stats["reordered"]) == (1, 1, 1, True)
+    assert stats["diff_ms"] >= 0
+    
+    grid.sort_by([("age", Qt.DescendingOrder)])
+    grid.load_data(rows[:4] + [{"id": 3, "name": "d", "age": 30}], sample_columns, key="id")
+    assert [model.row_data(row)["name"] for row in range(model.rowCount())] == ["d", "f", "e", "C", "a"]
+    model.set_filter_text("c")
+    assert model.rowCount() == 1
+    model.set_filter_text("")
+    
+    # Reordered ties stay sorted, so later reloads place changed rows correctly
+    grid.sort_by([("age", Qt.AscendingOrder)])
+    tied = [{"id": i, "name": name, "age": 30} for i, name in enumerate(names)]
+    grid.load_data(tied, sample_columns, key="id")
+    grid.load_data(tied[::-1], sample_columns, key="id")
+    assert [model.row_data(row)["name"] for row in range(model.rowCount())] == ["e", "d", "c", "b", "a"]
+    grid.load_data(tied[:0:-1] + [{"id": 0, "name": "a", "age": 10}], sample_columns, key="id")
+    assert [model.row_data(row)["name"] for row in range(model.rowCount())] == ["a", "e", "d", "c", "b"]
+    
+    with pytest.raises(ValueError):
+        grid.load_data(rows + rows[:1], sample_columns, key="id")
+
+def test_queued_updates(qtbot, sample_data, sample_columns):
+    """Test updates queued from other threads are merged per cell and flushed together."""
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_data(sample_data, sample_columns)
+    changes = []
+    grid._model.dataChanged.connect(lambda *args: changes.append(args))
+    
+    def produce():
+        for age in range(100):
+            grid.queue_update({"id": 1, "age": age})
+            grid.queue_update({"id": 2, "age": age})
+        grid.queue_update({"id": 99, "age": 1})
+    producer = threading.Thread(target=produce)
+    producer.start()
+    producer.join()
+    
+    qtbot.waitUntil(lambda: grid.update_stats["flushes"] > 0)
+    assert grid._model.row_data(0)["age"] == 99
+    assert grid._model.row_data(1)["age"] == 99
+    assert len(changes) == 1  # Adjacent rows merged into one range
+    assert grid.update_stats == {"queued": 201, "merged": 198, "dropped": 1, "flushes": 1}
+
+def test_format_cache(qtbot, sample_columns):
+    """Test formatter output is cached per cell and invalidated on changes."""
+    calls = []
+    columns = sample_columns + [{"key": "price", "title": "Price", "formatter": lambda x: calls.append(x) or f"${x:.2f}"}]
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.set_format_cache(2)
+    grid.load_data([{"id": i, "name": "", "age": 0, "price": float(i)} for i in range(3)], columns)
+    model = grid._model
+    
+    def price(row):
+        return model.data(model.index(row, 3))
+    calls.clear()
+    assert [price(0), price(0), price(1)] == ["$0.00", "$0.00", "$1.00"]
+    assert calls == [0.0, 1.0]
+    
+    price(2)  # Evicts row 0
+    grid.update_rows([{"id": 1, "price": 5.0}])
+    assert price(1) == "$5.00"
+    assert model.format_cache_stats == {"hits": 1, "misses": 4, "evictions": 1, "size": 2, "max_size": 2}
+    
+    engine = ThemeEngine.get_instance()
+    engine.switch_theme("light" if engine.current_theme == "dark" else "dark")
+    assert model.format_cache_stats["size"] == 0
+
+def test_color_roles(qtbot, sample_data, sample_columns):
+    """Test color roles return theme brushes rebuilt on theme change."""
+    engine = ThemeEngine.get_instance()
+    engine.switch_theme("light")
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_data(sample_data, sample_columns)
+    model = grid._model
+    
+    assert model.data(model.index(0, 0), Qt.ForegroundRole).color().name() == "#212529"
+    assert model.data(model.index(0, 0), Qt.BackgroundRole).color().name() == "#ffffff"
+    assert model.data(model.index(1, 0), Qt.BackgroundRole).color().name() == "#f8f9fa"
+    assert model.data(model.index(0, 0), Qt.TextAlignmentRole) == Qt.AlignLeft | Qt.AlignVCenter
+    
+    engine.switch_theme("dark")
+    assert model.data(model.index(0, 0), Qt.ForegroundRole).color().name() == "#f8f9fa"
+    assert model.data(model.index(0, 0), Qt.BackgroundRole).color().name() == "#212529"
+
+def test_load_file(qtbot, tmp_path, monkeypatch):
+    """Test CSV files are indexed in the background and parsed lazily."""
+    monkeypatch.setattr(data_grid_file, "INDEX_CHUNK_SIZE", 64)
+    path = tmp_path / "rows.csv"
+    lines = ["id,name"] + [f'{i},"row\n{i}"' for i in range(300)]
+    path.write_text("\n".join(lines), newline="")
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    progress = []
+    grid.index_progress.connect(progress.append)
+    
+    with qtbot.waitSignal(grid.index_progress, check_params_cb=lambda percent: percent == 100):
+        grid.load_file(str(path), columns=[{"key": "id", "title": "ID", "type": "int"},
+                                           {"key": "name", "title": "Name"}], page_size=100)
+    model = grid._model
+    assert not grid._filter_bar.status_label.isVisible()
+    assert model.store.source.row_count_hint() == 300
+    assert progress == sorted(progress) and len(progress) > 2
+    
+    while model.canFetchMore(QModelIndex()):
+        model.fetchMore(QModelIndex())
+    assert model.rowCount() == 300
+    assert model.row_data(299) == {"id": 299, "name": "row\n299"}
+    assert model.data(model.index(5, 0), Qt.DisplayRole) == "5"
+
+def test_load_jsonl(qtbot, tmp_path):
+    """Test JSON Lines columns are derived from the first record."""
+    path = tmp_path / "rows.jsonl"
+    path.write_text('{"id": 1, "name": "a"}\n{"id": 2, "name": "b"}\n')
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    
+    with qtbot.waitSignal(grid.index_progress, check_params_cb=lambda percent: percent == 100):
+        grid.load_file(str(path))
+    assert grid._model.rowCount() == 2
+    assert grid._model.row_data(1) == {"id": 2, "name": "b"}
+    assert grid._columns == [{"key": "id", "title": "id"}, {"key": "name", "title": "name"}]
+
+def test_sqlite_source(qtbot, tmp_path):
+    """Test SQLite sources page rows and apply sorting and filtering in SQL."""
+    path = tmp_path / "rows.db"
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE people (id INTEGER, name TEXT, age INTEGER)")
+    connection.executemany(
+        "INSERT INTO people VALUES (?, ?, ?)",
+        [(i, f"name {i}", 20 + i % 3) for i in range(10)],
+    )
+    connection.commit()
+    connection.close()
+    source = SqliteSource.from_url(f"sqlite:///{path}", table="people")
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_source(source, source.columns, page_size=3, max_pages=2)
+    model = grid._model
+    assert isinstance(grid._proxy_model, data_grid.DataGridProxyModel)
+    
+    def ids():
+        while model.canFetchMore():
+            model.fetchMore()
+        return [model.row_data(row)["id"] for row in range(model.rowCount())]
+        
+    assert ids() == list(range(10))
+    grid.sort_by([("age", Qt.DescendingOrder)])
+    assert model.sort_spec == [("age", True)]
+    assert ids() == [2, 5, 8, 1, 4, 7, 0, 3, 6, 9]
+    # Pages evicted from the cache are re-fetched in the same order
+    assert [model.row_data(row)["id"] for row in range(10)] == [2, 5, 8, 1, 4, 7, 0, 3, 6, 9]
+    grid._filter_bar.search_input.setText("name 1")
+    qtbot.waitUntil(lambda: model.filter_text == "name 1")
+    assert ids() == [1]
+    assert source.row_count() == 1
+    grid.set_filter_columns(["id"])
+    assert ids() == []
+    source.close()
+
+def test_sqlite_source_nulls(qtbot):
+    """Test keyset paging keeps NULL sort values in both sort orders."""
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE items (id INTEGER, v INTEGER, w INTEGER)")
+    connection.executemany(
+        "INSERT INTO items VALUES (?, ?, ?)",
+        [(i, None if i % 3 == 0 else i % 4, None if i % 2 else i % 5) for i in range(30)],
+    )
+    source = SqliteSource(connection, table="items")
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_source(source, source.columns, page_size=5, max_pages=2)
+    model = grid._model
+    
+    def ids():
+        while model.canFetchMore():
+            model.fetchMore()
+        return [model.row_data(row)["id"] for row in range(model.rowCount())]
+        
+    for spec, order_by in (
+        ([("v", Qt.DescendingOrder)], "v DESC"),
+        ([("v", Qt.AscendingOrder)], "v ASC"),
+        ([("v", Qt.AscendingOrder), ("w", Qt.DescendingOrder)], "v ASC, w DESC"),
+        ([("v", Qt.DescendingOrder), ("w", Qt.AscendingOrder)], "v DESC, w ASC"),
+    ):
+        grid.sort_by(spec)
+        expected = [row[0] for row in connection.execute(f"SELECT id FROM items ORDER BY {order_by}, rowid")]
+        assert ids() == expected
+    source.close()
+
+def test_export(qtbot, tmp_path, monkeypatch, sample_data, sample_columns):
+    """Test exports write the sorted, filtered view in chunks."""
+    monkeypatch.setattr(data_grid_export, "EXPORT_CHUNK_SIZE", 1)
+    columns = sample_columns[:2] + [dict(sample_columns[2], formatter=lambda x: f"{x} y")]
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_data(sample_data, columns)
+    grid.sort_by([("age", Qt.DescendingOrder)])
+    grid._model.set_filter_text("i")
+    
+    path = tmp_path / "view.csv"
+    progress = []
+    grid.export_progress.connect(progress.append)
+    with qtbot.waitSignal(grid.export_finished) as blocker:
+        grid.export(str(path), formatted=True)
+    assert blocker.args == [str(path), 2]
+    assert progress == [50, 100]
+    assert not grid.is_exporting
+    assert path.read_text().splitlines() == ["id,name,age", "3,Charlie,35 y", "1,Alice,30 y"]
+    
+    path = tmp_path / "view.jsonl"
+    with qtbot.waitSignal(grid.export_finished):
+        grid.export(str(path))
+    assert path.read_text().splitlines() == [
+        '{"id": 3, "name": "Charlie", "age": 35}',
+        '{"id": 1, "name": "Alice", "age": 30}',
+    ]
+    
+    exported = path.read_text()
+    with pytest.raises(data_grid_export.ExportCancelled):
+        data_grid_export.export_rows(str(path), grid._model.store, [0, 1], columns, is_cancelled=lambda: True)
+    assert path.read_text() == exported
+    assert sorted(tmp_path.iterdir()) == [tmp_path / "view.csv", path]
+    
+    # A replaced export to the same path does not remove the file of the next one
+    grid.export(str(path), formatted=True)
+    with qtbot.waitSignal(grid.export_finished):
+        grid.export(str(path))
+    qtbot.waitUntil(lambda: sorted(tmp_path.iterdir()) == [tmp_path / "view.csv", path])
+    assert path.read_text() == exported
+    with pytest.raises(ValueError):
+        grid.export(str(tmp_path / "view.xlsx"))
+
+def test_snapshot(qtbot, tmp_path, sample_data, sample_columns):
+    """Test snapshots restore data, columns, sort and filter, and reject corrupt files."""
+    columns = sample_columns + [{"key": "next", "title": "Next", "expression": "age + 1", "formatter": str}]
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_data(sample_data, columns)
+    grid.sort_by([("age", Qt.DescendingOrder)])
+    grid._filter_bar.search_input.setText("li")
+    path = tmp_path / "grid.snapshot"
+    grid.save_snapshot(str(path))
+    assert list(tmp_path.iterdir()) == [path]  # No partial file left behind
+    
+    restored = DataGrid()
+    qtbot.addWidget(restored)
+    restored.load_snapshot(str(path))
+    model = restored._model
+    assert restored._columns == sample_columns + [{"key": "next", "title": "Next", "expression": "age + 1"}]
+    assert model.sort_spec == [("age", True)]
+    assert restored._filter_bar.search_input.text() == "li"
+    assert [model.row_data(row)["name"] for row in range(model.rowCount())] == ["Charlie", "Alice"]
+    assert model.row_data(0)["next"] == 36
+    
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        restored.load_snapshot(str(path))
+
+def test_aggregates(qtbot, sample_data, sample_columns):
+    """Test footer aggregates follow the filter and row changes."""
+    columns = [dict(sample_columns[0], aggregate="count"), sample_columns[1],
+               dict(sample_columns[2], aggregate="max")]
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_data(sample_data, columns)
+    model = grid._model
+    
+    assert not grid._footer.isHidden()
+    assert grid.aggregates == {"id": 3, "age": 35}
+    assert grid._footer.model().headerData(2, Qt.Horizontal) == "Max: 35"
+    
+    model.set_filter_text("li")
+    assert grid.aggregates == {"id": 2, "age": 35}
+    
+    with qtbot.waitSignal(model.aggregates_changed):
+        grid.append_rows([{"id": 4, "name": "Alina", "age": 40}, {"id": 5, "name": "Dave", "age": 99}])
+    assert grid.aggregates == {"id": 3, "age": 40}
+    grid.update_rows([{"id": 4, "age": 20}, {"id": 2, "name": "Olive"}])
+    assert grid.aggregates == {"id": 4, "age": 35}
+    grid.remove_rows([3])
+    assert grid.aggregates == {"id": 3, "age": 30}
+    
+    model.set_filter_text("")
+    assert grid.aggregates == {"id": 4, "age": 99}
+    with pytest.raises(ValueError):
+        DataGridModel([], [{"key": "id", "title": "ID", "aggregate": "median"}])
+
+def test_computed_columns(qtbot):
+    """Test computed columns are evaluated, kept current and sortable."""
+    columns = [
+        {"key": "id", "title": "ID"},
+        {"key": "price", "title": "Price"},
+        {"key": "qty", "title": "Qty"},
+        {"key": "total", "title": "Total", "expression": "price * qty"},
+        {"key": "label", "title": "Label", "expression": "'big' if total > 10 else 'small'"},
+    ]
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_data([
+        {"id": 1, "price": 2.0, "qty": 3},
+        {"id": 2, "price": 5.0, "qty": 4},
+        {"id": 3, "price": 1.5, "qty": ""},
+    ], columns)
+    model = grid._model
+    
+    assert list(model.store.column("total")) == [6.0, 20.0, ""]
+    grid.sort_by([("total", Qt.AscendingOrder)])
+    assert [model.row_data(row)["id"] for row in range(3)] == [1, 2, 3]
+    
+    grid.update_rows([{"id": 1, "qty": 30}])
+    assert model.row_data(1) == {"id": 1, "price": 2.0, "qty": 30, "total": 60.0, "label": "big"}
+    grid.append_rows([{"id": 4, "price": 10.0, "qty": 3}])
+    assert [model.row_data(row)["id"] for row in range(4)] == [2, 4, 1, 3]
+    
+    model.set_filter_text("big")
+    assert model.rowCount() == 3
+    
+    source = CountingSource(10)
+    grid.load_source(source, [{"key": "id", "title": "ID"}, {"key": "double", "title": "x2", "expression": "id * 2"}])
+    assert grid._model.data(grid._model.index(4, 1), Qt.DisplayRole) == "8"
+    
+    with pytest.raises(ValueError):
+        DataGridModel([], [{"key": "x", "title": "X", "expression": "__import__('os')"}])
+
+def test_auto_size_columns(qtbot):
+    """Test auto-size columns fit their longest value from a sample of rows."""
+    rows = [{"id": i, "name": f"Item {i}"} for i in range(1000)]
+    rows[500]["name"] = "An unusually long product name in the middle"
+    columns = [
+        {"key": "id", "title": "ID", "auto_size": True},
+        {"key": "name", "title": "Name", "auto_size": True},
+    ]
+    grid = DataGrid()
+    qtbot.addWidget(grid)
+    grid.load_data(rows, columns)
+    header = grid._table_view.horizontalHeader()
+    metrics = grid._table_view.fontMetrics()
+    
+    assert header.sectionResizeMode(1) == QHeaderView.Interactive
+    assert header.sectionSize(1) > metrics.horizontalAdvance(rows[500]["name"])
+    assert 500 in grid._model.longest_rows("name")
+    
+    columns[1]["auto_size"] = "contents"
+    grid.load_data(rows, columns)
+    assert header.sectionResizeMode(1) == QHeaderView.ResizeToContents
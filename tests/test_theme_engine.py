@@ -1,7 +1,9 @@
 """Test theme engine and themed components."""
 
+import gc
 import pytest
-from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication, QVBoxLayout, QWidget
 from PySide6.QtTest import QTest
 from ui.themes.theme_engine import ThemeEngine
 from ui.components.input import StyledInput
@@ -128,4 +130,138 @@ def test_component_theme_persistence(qtbot):
     
     # Both should have dark theme
     assert input1.styleSheet() == input2.styleSheet()
-    assert "#2c3034" in input1.styleSheet()  # Dark theme input background
\ No newline at end of file
+    assert "#2c3034" in input1.styleSheet()  # Dark theme input background
+
+def test_stylesheet_cache(qtbot):
+    """Test stylesheets are built once per theme and shared by widgets."""
+    engine = ThemeEngine.get_instance()
+    engine.switch_theme("light")
+    engine.stylesheet("button", "secondary")
+    before = engine.stylesheet_stats
+    
+    buttons = [StyledButton(f"Button {i}") for i in range(20)]
+    for button in buttons:
+        qtbot.addWidget(button)
+        button.set_secondary()
+    stats = engine.stylesheet_stats
+    assert stats["builds"] - before["builds"] <= 1
+    assert stats["hits"] - before["hits"] >= 20
+    assert len({button.styleSheet() for button in buttons}) == 1
+    
+    engine.switch_theme("dark")
+    switched = engine.stylesheet_stats
+    assert switched["builds"] - stats["builds"] == stats["entries"]
+    assert "#5c636a" in buttons[0].styleSheet()  # Dark theme secondary hover
+    assert engine.stylesheet_stats["builds"] == switched["builds"]
+
+def test_application_style_mode(qtbot):
+    """Test application style mode styles widgets through one app stylesheet."""
+    app = QApplication.instance()
+    engine = ThemeEngine.get_instance()
+    engine.switch_theme("light")
+    button = StyledButton("Test Button")
+    qtbot.addWidget(button)
+    button.set_secondary()
+    
+    engine.set_style_mode("application")
+    try:
+        assert engine.style_mode == "application"
+        assert button.styleSheet() == ""
+        assert button.property("themeVariant") == "secondary"
+        assert 'QPushButton[themeComponent="button"][themeVariant="secondary"]' in app.styleSheet()
+        
+        engine.switch_theme("dark")
+        assert "#5c636a" in app.styleSheet()  # Dark theme secondary hover
+        button.set_primary()
+        assert button.property("themeVariant") == "primary"
+        assert "#0d6efd" in app.styleSheet()  # Dark theme primary color
+        with pytest.raises(ValueError):
+            engine.set_style_mode("invalid")
+    finally:
+        engine.set_style_mode("widget")
+    assert app.styleSheet() == ""
+    assert "#0d6efd" in button.styleSheet()
+
+def test_batched_theme_switch(qtbot):
+    """Test batched switches suspend window updates and report their work."""
+    engine = ThemeEngine.get_instance()
+    engine.switch_theme("light")
+    window = QWidget()
+    qtbot.addWidget(window)
+    layout = QVBoxLayout(window)
+    buttons = [StyledButton(f"Button {i}") for i in range(5)]
+    for button in buttons:
+        layout.addWidget(button)
+    window.show()
+    
+    updates = []
+    def on_theme_change(_):
+        updates.append(window.updatesEnabled())
+        
+    engine.theme_changed.connect(on_theme_change)
+    engine.switch_theme("dark")
+    engine.theme_changed.disconnect(on_theme_change)
+    stats = engine.switch_stats
+    assert updates[-1] is False
+    assert window.updatesEnabled()
+    assert stats["theme"] == "dark"
+    assert stats["windows"] >= 1
+    assert stats["widgets"] >= len(buttons)
+    assert stats["restyled"] >= len(buttons)
+    assert stats["ms"] > 0
+    
+    engine.switch_theme("light", batched=False)
+    assert engine.switch_stats["windows"] == 0
+
+def test_weak_subscribers(qtbot):
+    """Test theme subscribers are held weakly and pruned once deleted."""
+    app = QApplication.instance()
+    engine = ThemeEngine.get_instance()
+    engine.switch_theme("light")
+    count = engine.subscriber_count
+    
+    window = QWidget()
+    layout = QVBoxLayout(window)
+    for i in range(5):
+        layout.addWidget(StyledButton(f"Button {i}"))
+    gc.collect()
+    assert engine.subscriber_count == count + 5
+    engine.switch_theme("dark")
+    assert all("#0d6efd" in button.styleSheet() for button in window.findChildren(StyledButton))
+    
+    # Deleted by Qt while Python still references the wrapper
+    button = window.findChildren(StyledButton)[0]
+    window.deleteLater()
+    app.sendPostedEvents(None, QEvent.DeferredDelete)
+    assert engine.subscriber_count == count
+    
+    # Garbage collected
+    del button, window, layout
+    StyledInput()
+    gc.collect()
+    assert engine.subscriber_count == count
+    engine.switch_theme("light")
+
+def test_frozen_theme_data():
+    """Test theme data is shared, deeply read-only and hashable."""
+    engine = ThemeEngine.get_instance()
+    engine.switch_theme("light")
+    theme_data = engine.theme_data
+    
+    assert engine.theme_data is theme_data
+    assert theme_data.flat["text.primary"] == "#212529"
+    assert theme_data["text"]["primary"] == "#212529"
+    with pytest.raises(TypeError):
+        theme_data["primary"] = "#000000"
+    with pytest.raises(TypeError):
+        theme_data["text"].update(primary="#000000")
+    
+    cache = {theme_data: "light"}
+    engine.switch_theme("dark")
+    assert engine.theme_data not in cache
+    engine.switch_theme("light")
+    assert cache[engine.theme_data] == "light"
+    
+    copy = theme_data.copy()
+    copy["primary"] = "#000000"
+    assert engine.get_color("primary") == "#007bff"
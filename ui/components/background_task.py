@@ -0,0 +1,72 @@
+"""Cancellable background tasks for long-running component work."""
+
+import logging
+import threading
+from typing import Any, Callable
+from PySide6.QtCore import QObject, QThreadPool, Signal
+
+logger = logging.getLogger(__name__)
+
+class BackgroundTask(QObject):
+    """Runs a callable on the global thread pool and reports back via signals.
+
+    The callable receives the task itself so it can poll ``is_cancelled``
+    and call ``report_progress``. Signals are delivered on the thread that
+    owns the receiver, so UI code can connect to them directly.
+    """
+
+    finished = Signal(object)  # Emits result of the callable
+    failed = Signal(str)  # Emits error message
+    progress = Signal(int)  # Emits progress percentage
+
+    def __init__(self, func: Callable[['BackgroundTask'], Any]):
+        """Initialize background task.
+
+        Args:
+            func: Callable run on the worker thread
+        """
+        super().__init__()
+        self._func = func
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Check whether the task was cancelled."""
+        return self._cancelled.is_set()
+
+    @property
+    def is_done(self) -> bool:
+        """Check whether the task has stopped running."""
+        return self._done.is_set()
+
+    def cancel(self):
+        """Request cancellation; results of a cancelled task are dropped."""
+        self._cancelled.set()
+
+    def report_progress(self, percent: int):
+        """Report progress from the worker thread."""
+        if not self.is_cancelled:
+            self.progress.emit(percent)
+
+    def start(self):
+        """Start the task on the global thread pool."""
+        QThreadPool.globalInstance().start(self._run)
+
+    def wait(self, timeout: float = None) -> bool:
+        """Block until the task stops running."""
+        return self._done.wait(timeout)
+
+    def _run(self):
+        """Run the callable and emit its outcome."""
+        try:
+            result = self._func(self)
+        except Exception as e:
+            if not self.is_cancelled:
+                logger.error(f"Background task failed: {str(e)}", exc_info=True)
+                self.failed.emit(str(e))
+        else:
+            if not self.is_cancelled:
+                self.finished.emit(result)
+        finally:
+            self._done.set()
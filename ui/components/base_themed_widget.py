@@ -20,7 +20,7 @@ class ThemedWidget(QWidget):
         
         # Subscribe to theme changes if component type specified
         if component_type:
-            self._theme_engine.theme_changed.connect(self._on_theme_changed)
+            self._theme_engine.subscribe(self._on_theme_changed)
             self._apply_initial_theme()
             
     def _apply_initial_theme(self):
@@ -20,7 +20,7 @@ class StyledButton(QPushButton):
         self._setup_button()
         
         # Subscribe to theme changes
-        self._theme_engine.theme_changed.connect(self._on_theme_changed)
+        self._theme_engine.subscribe(self._on_theme_changed)
         
     def _setup_button(self):
         """Configure button widget."""
@@ -34,31 +34,7 @@ class StyledButton(QPushButton):
         
     def _apply_current_style(self):
         """Apply current style based on variant."""
-        theme = self._theme_engine.theme_data
-        variant_bg = theme["button"]["primary_bg"] if self._variant == "primary" else theme["button"]["secondary_bg"]
-        variant_hover = theme["primary_hover"] if self._variant == "primary" else theme["secondary_hover"]
-        variant_pressed = theme["primary_pressed"] if self._variant == "primary" else theme["secondary_pressed"]
-        
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {variant_bg};
-                color: {theme["button"]["primary_text"]};
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 14px;
-            }}
-            QPushButton:hover {{
-                background-color: {variant_hover};
-            }}
-            QPushButton:pressed {{
-                background-color: {variant_pressed};
-            }}
-            QPushButton:disabled {{
-                background-color: {theme["button"]["disabled_bg"]};
-                color: {theme["button"]["disabled_text"]};
-            }}
-        """)
+        self._theme_engine.apply_theme_to_widget(self, "button", self._variant)
         
     def set_primary(self):
         """Set primary button style."""
@@ -52,26 +52,4 @@ class Checkbox(ThemedWidget):
         if not hasattr(self, '_checkbox'):
             return
             
-        checkbox_theme = theme_data.get("checkbox", {})
-        style = f"""
-            QCheckBox {{
-                color: {checkbox_theme.get("text", "#212529")};
-                spacing: 8px;
-            }}
-            QCheckBox::indicator {{
-                width: 16px;
-                height: 16px;
-                border: 1px solid {checkbox_theme.get("border", "#ced4da")};
-                border-radius: 3px;
-                background-color: {checkbox_theme.get("background", "#ffffff")};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {checkbox_theme.get("checked_bg", "#007bff")};
-                border-color: {checkbox_theme.get("checked_border", "#007bff")};
-            }}
-            QCheckBox::indicator:disabled {{
-                background-color: {checkbox_theme.get("disabled_bg", "#e9ecef")};
-                border-color: {checkbox_theme.get("disabled_border", "#dee2e6")};
-            }}
-        """
-        self._checkbox.setStyleSheet(style)
\ No newline at end of file
+        self._theme_engine.apply_theme_to_widget(self._checkbox, "checkbox")
\ No newline at end of file
@@ -1,66 +1,1523 @@
 """Reusable data grid component for tabular data display."""
 
-from typing import Any, Dict, List, Optional
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal, QSortFilterProxyModel, QPoint
+import logging
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, compress
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+from PySide6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, Signal, QSortFilterProxyModel, QIdentityProxyModel, QPoint, QTimer,
+    QEvent, QSize
+)
+from PySide6.QtGui import QBrush, QColor
 from PySide6.QtWidgets import (
     QTableView, QHeaderView, QWidget, QVBoxLayout, QHBoxLayout, 
-    QToolButton, QLabel, QLineEdit
+    QToolButton, QLabel, QLineEdit, QSizePolicy
 )
 from ui.themes.theme_engine import ThemeEngine
 from ui.components.base_themed_widget import ThemedWidget
 from ui.components.button import StyledButton
+from ui.components.loading_spinner import LoadingSpinner
+from ui.components.background_task import BackgroundTask
+from ui.components.data_grid_store import ColumnStore
+from ui.components.data_grid_source import (
+    DataGridSource, QueryableSource, PagedStore, DEFAULT_PAGE_SIZE, DEFAULT_MAX_PAGES
+)
+from ui.components.data_grid_sort import SortEngine, SortKey, SortCancelled, row_sort_key
+from ui.components.data_grid_search import SearchIndex, SearchCancelled
+from ui.components.data_grid_cache import FormatCache
+from ui.components.data_grid_file import FileSource
+from ui.components.data_grid_selection import (
+    RowSelection, RowSelectionModel, RowSelectionTableView, SelectionDelegate
+)
+from ui.components.data_grid_export import export_format, export_rows
+from ui.components.data_grid_aggregate import AGGREGATES, ColumnAggregate
+from ui.components.data_grid_compute import computed_columns, compute_columns, compute_rows, compute_row_update
+from ui.components.data_grid_autosize import AUTO_SIZE_EDGE_ROWS, TextWidths, longest_rows
+from ui.components.data_grid_diff import diff_stores
+from ui.components.data_grid_group import DataGridGroupModel
+from ui.components.data_grid_delegate import FastGridDelegate
+from ui.components.data_grid_snapshot import read_snapshot, write_snapshot
+
+# Sorts over more rows than this run on a worker thread
+ASYNC_SORT_THRESHOLD = 200_000
+
+# Number of sort columns kept; earlier header clicks become tie-breakers
+MAX_SORT_KEYS = 3
+
+logger = logging.getLogger(__name__)
+
+# Filters over more rows than this run on a worker thread
+ASYNC_FILTER_THRESHOLD = 100_000
+
+# Quiet period after the last keystroke before a background filter starts
+FILTER_DEBOUNCE_MS = 150
+
+# Appends larger than this re-sort and re-filter instead of placing rows one by one
+INCREMENTAL_ROW_LIMIT = 1000
+
+# Updates moving more rows than this relayout once instead of moving rows one by one
+MOVE_SIGNAL_LIMIT = 64
+
+# Queued updates are applied at most once per this interval (one frame)
+UPDATE_FLUSH_INTERVAL_MS = 16
+
+# Maximum number of rows with queued updates; updates to further rows are dropped
+MAX_PENDING_UPDATES = 100_000
+
+# Lookups of more rows than this build a storage row -> view row table
+_POSITION_TABLE_THRESHOLD = 256
+
+# Item data roles as plain ints; Qt enum attribute lookups are slow in data()
+_DISPLAY_ROLE = int(Qt.DisplayRole)
+_ALIGNMENT_ROLE = int(Qt.TextAlignmentRole)
+_FOREGROUND_ROLE = int(Qt.ForegroundRole)
+_BACKGROUND_ROLE = int(Qt.BackgroundRole)
+
+# Marks a layout change whose view mapping must be recomposed
+_COMPOSE = object()
 
 class DataGridModel(QAbstractTableModel):
-    """Custom table model for efficient data handling."""
+    """Custom table model for efficient data handling.
+    
+    Rows are exposed through a view mapping (view row -> storage row)
+    composed from the active sort permutation and text filter.
+    """
     
-    def __init__(self, data: List[Dict], columns: List[Dict], parent=None):
+    busy_changed = Signal(bool)  # Emits True while a background sort runs
+    filtering_changed = Signal(bool)  # Emits True while a background filter runs
+    aggregates_changed = Signal()  # Emitted when footer aggregates may have changed
+    _flush_requested = Signal()  # Schedules a flush on the model's thread
+    
+    def __init__(self, data: Union[ColumnStore, PagedStore, List[Dict]], columns: List[Dict], parent=None):
         super().__init__(parent)
-        self._data = data
+        if not isinstance(data, (ColumnStore, PagedStore)):
+            data = ColumnStore.from_rows(data, columns)
+        # Computed columns are stored like any other column and kept current
+        self._expressions = computed_columns(columns)
+        if self._expressions and isinstance(data, ColumnStore):
+            compute_columns(data, self._expressions, columns)
+        for col in columns:
+            if col.get("aggregate") not in (None,) + AGGREGATES:
+                raise ValueError(f"Unknown aggregate: {col['aggregate']}")
+        self._store = data
         self._columns = columns
         self._theme_engine = ThemeEngine.get_instance()
+        self._view = None  # View row -> storage row, None for identity
+        self._order = None  # Sort permutation, None when unsorted
+        self._sort_spec: List[Tuple[str, bool]] = []
+        self._sort_engine = SortEngine()
+        self._sort_task: Optional[BackgroundTask] = None
+        self._pending_sort_spec: List[Tuple[str, bool]] = []
+        self._filter_text = ""
+        self._filter_keys: Optional[List[str]] = None  # None searches all columns
+        self._pushed_filter: Tuple[str, Optional[List[str]]] = ("", None)  # Applied by a queryable source
+        self._filter_rows = None  # Matching storage rows, None when unfiltered
+        self._search_index: Optional[SearchIndex] = None
+        self._index_lock = threading.Lock()
+        self._index_generation = 0
+        self._filter_task: Optional[BackgroundTask] = None
+        self._key_index: Optional[Tuple[str, Dict[Any, int]]] = None  # Row key -> storage row
+        self._positions: Optional[array] = None  # Storage row -> view row, -1 when hidden
+        self._update_lock = threading.Lock()
+        self._pending_updates: Dict[Tuple[str, Any], Dict[str, Any]] = {}
+        self._flush_scheduled = False
+        self._update_stats = dict.fromkeys(("queued", "merged", "dropped", "flushes"), 0)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(UPDATE_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._on_flush_timer)
+        self._flush_requested.connect(self._flush_timer.start)
+        self._format_cache: Optional[FormatCache] = None
+        self._aggregates: Optional[Dict[str, ColumnAggregate]] = None  # By column key, None when stale
+        self._longest_rows: Dict[str, List[int]] = {}  # Auto-size candidates by column key
+        self._renumbered: Optional[array] = None  # Old -> new storage row during a reordering layout change
+        self._reload_stats: Optional[Dict[str, Any]] = None
+        self._theme_engine.subscribe(self._on_theme_changed)
+        self._build_brushes(self._theme_engine.theme_data)
+        self._bind_columns()
+
+    def _bind_columns(self):
+        """Resolve column buffers, formatters and alignments by column index."""
+        self._buffers = [self._store.column(col["key"]) for col in self._columns]
+        self._formatters = [col.get("formatter") for col in self._columns]
+        self._alignments = tuple(
+            col.get("align", Qt.AlignLeft | Qt.AlignVCenter) for col in self._columns
+        )
+
+    def _build_brushes(self, theme_data: Dict):
+        """Build the brushes returned for color roles from theme data."""
+        colors = _grid_colors(theme_data)
+        self._foreground = QBrush(QColor(colors["text"]))
+        # Indexed by row parity
+        self._backgrounds = (
+            QBrush(QColor(colors["background"])),
+            QBrush(QColor(colors["alternate_bg"])),
+        )
+
+    @property
+    def store(self) -> Union[ColumnStore, PagedStore]:
+        """Get underlying column store."""
+        return self._store
+
+    @property
+    def sort_spec(self) -> List[Tuple[str, bool]]:
+        """Get active sort as (column key, descending) pairs."""
+        return list(self._sort_spec)
+
+    @property
+    def is_sorting(self) -> bool:
+        """Check whether a background sort is running."""
+        return self._sort_task is not None
+
+    @property
+    def filter_text(self) -> str:
+        """Get active filter text."""
+        return self._filter_text
+
+    @property
+    def is_filtering(self) -> bool:
+        """Check whether a background filter runs."""
+        return self._filter_task is not None
+
+    @property
+    def supports_index_filter(self) -> bool:
+        """Check whether filtering can use the in-memory search index."""
+        return isinstance(self._store, ColumnStore)
+
+    @property
+    def supports_query_pushdown(self) -> bool:
+        """Check whether sorting and filtering are pushed down to the data source."""
+        return isinstance(self._store, PagedStore) and isinstance(self._store.source, QueryableSource)
 
+    @property
+    def filters_in_background(self) -> bool:
+        """Check whether filter queries run on a worker thread."""
+        return self.supports_index_filter and len(self._store) >= ASYNC_FILTER_THRESHOLD
+
+    def storage_row(self, row: int) -> int:
+        """Map a model row to its row in the store."""
+        return row if self._view is None else self._view[row]
+
+    def storage_rows(self, ranges: Iterable[Tuple[int, int]]) -> array:
+        """Map inclusive (first, last) model row ranges to their rows in the store."""
+        rows = array("q")
+        for first, last in ranges:
+            rows.extend(range(first, last + 1) if self._view is None else self._view[first:last + 1])
+        return rows
+
+    def column_index(self, key: str) -> int:
+        """Get the index of a column by key.
+        
+        Raises:
+            KeyError: If no column has the key
+        """
+        for i, col in enumerate(self._columns):
+            if col["key"] == key:
+                return i
+        raise KeyError(f"No column {key!r}")
+
+    def column_key(self, column: int) -> str:
+        """Get the key of a column by index."""
+        return self._columns[column]["key"]
+
+    def sort_key(self, key: str) -> SortKey:
+        """Get the cached sort key of a column, with value ranks computed.
+        
+        Raises:
+            TypeError: If the rows are not held in memory
+        """
+        sort_key = self._sort_engine.sort_key(self._column_store(), key)
+        sort_key.ensure_ranks()
+        return sort_key
+
+    def storage_text(self, row: int, column: int) -> str:
+        """Get the display text of a cell by storage row."""
+        value = self._buffers[column][row]
+        formatter = self._formatters[column]
+        return str(value) if formatter is None else str(formatter(value))
+
+    def sample_rows(self, visible: range, count: int = AUTO_SIZE_EDGE_ROWS) -> List[int]:
+        """Get storage rows sampled to size columns.
+        
+        Args:
+            visible: Model rows currently visible
+            count: Number of rows taken from the top and bottom of the view
+            
+        Returns:
+            Storage rows of the first, last and visible model rows
+        """
+        total = self.rowCount()
+        if not total:
+            return []
+        ranges = [(0, min(count, total) - 1), (max(total - count, 0), total - 1)]
+        if visible:
+            ranges.append((max(visible.start, 0), min(visible.stop, total) - 1))
+        return sorted(set(self.storage_rows(ranges)))
+
+    def longest_rows(self, key: str) -> List[int]:
+        """Get storage rows holding the longest values of a column.
+        
+        Found once per column and data change; paged stores are not
+        scanned and yield none.
+        """
+        if not isinstance(self._store, ColumnStore):
+            return []
+        rows = self._longest_rows.get(key)
+        if rows is None:
+            rows = self._longest_rows[key] = longest_rows(self._store.column(key))
+        return rows
+
+    def row_data(self, row: int) -> Dict[str, Any]:
+        """Get a copy of a row as a dictionary."""
+        return self._store.row(self.storage_row(row))
+
+    def export_task(self, path: str, format: Optional[str] = None, formatted: bool = False) -> BackgroundTask:
+        """Create a task writing the rows in view order to a file.
+        
+        Rows are read straight from the store through the view mapping
+        as it is when the task is created, a chunk at a time.
+        
+        Args:
+            path: Destination path
+            format: "csv", "jsonl" or "parquet"; inferred from the extension if omitted
+            formatted: Write display text instead of raw values
+            
+        Returns:
+            BackgroundTask: Unstarted task; ``finished`` emits the number of rows written
+        """
+        if not isinstance(self._store, ColumnStore):
+            raise TypeError("Export requires an in-memory data store")
+        format = export_format(path, format)
+        columns = list(self._columns)
+        # Snapshot buffers and mapping; later edits replace or extend them
+        store = ColumnStore({col["key"]: self._store.column(col["key"]) for col in columns})
+        rows = range(len(self._store)) if self._view is None else array("q", self._view)
+        
+        def run(task: BackgroundTask):
+            return export_rows(path, store, rows, columns, format, formatted,
+                               lambda: task.is_cancelled, task.report_progress)
+            
+        return BackgroundTask(run)
+        
+    def save_snapshot(self, path: str, filter_text: Optional[str] = None):
+        """Write the stored rows, columns, sort and filter to a snapshot file.
+        
+        Computed columns are left out; they are recomputed on load.
+        
+        Args:
+            path: Destination path
+            filter_text: Filter text to save; the model's filter text if omitted
+            
+        Raises:
+            TypeError: If rows are paged from a data source
+            ValueError: If a column holds values a snapshot cannot store
+        """
+        if not isinstance(self._store, ColumnStore):
+            raise TypeError("Snapshots require an in-memory data store")
+        write_snapshot(
+            path, self._store, self._columns, self._sort_spec,
+            self._filter_text if filter_text is None else filter_text,
+            self._order, skip=list(self._expressions),
+        )
+        
+    @property
+    def aggregates(self) -> Dict[str, Any]:
+        """Get configured aggregates of the visible rows by column key."""
+        return {
+            col["key"]: self.aggregate(column)
+            for column, col in enumerate(self._columns) if col.get("aggregate")
+        }
+        
+    def aggregate(self, column: int) -> Any:
+        """Get the configured aggregate of a column over the visible rows.
+        
+        Aggregates are recomputed in bulk after the filter changes and kept
+        current incrementally as rows are appended, updated or removed.
+        
+        Returns:
+            The aggregate, or None if not configured or not available
+        """
+        name = self._columns[column].get("aggregate")
+        if not name or not isinstance(self._store, ColumnStore):
+            return None
+        key = self._columns[column]["key"]
+        aggregate = self._column_aggregates()[key]
+        if aggregate.stale:
+            aggregate.recompute(self._store.column(key), self._filter_rows)
+        return aggregate.value(name)
+        
+    def aggregate_text(self, column: int) -> str:
+        """Get footer text of a column's aggregate."""
+        value = self.aggregate(column)
+        if value is None:
+            return ""
+        col = self._columns[column]
+        name = col["aggregate"]
+        formatter = col.get("formatter")
+        if name != "count" and formatter is not None:
+            text = str(formatter(value))
+        elif isinstance(value, float):
+            text = f"{value:,.2f}"
+        else:
+            text = f"{value:,}"
+        return f"{name.capitalize()}: {text}"
+        
+    def _column_aggregates(self) -> Dict[str, ColumnAggregate]:
+        """Get aggregates per column key, recomputing them after filter changes."""
+        if self._aggregates is None:
+            names: Dict[str, set] = {}
+            for col in self._columns:
+                if col.get("aggregate"):
+                    names.setdefault(col["key"], set()).add(col["aggregate"])
+            aggregates = {}
+            for key, used in names.items():
+                aggregate = aggregates[key] = ColumnAggregate(count_only=used == {"count"})
+                aggregate.recompute(self._store.column(key), self._filter_rows)
+            self._aggregates = aggregates
+        return self._aggregates
+        
+    def _tracked_aggregates(self) -> Optional[Dict[str, ColumnAggregate]]:
+        """Get aggregates to update incrementally, None if none are current."""
+        return self._aggregates or None
+        
+    def _is_visible(self, row: int) -> bool:
+        """Check whether a storage row matches the active filter."""
+        rows = self._filter_rows
+        if rows is None:
+            return True
+        position = bisect_left(rows, row)
+        return position < len(rows) and rows[position] == row
+        
+    def _aggregate_snapshot(self, row: int) -> Optional[Tuple[bool, Dict[str, Any]]]:
+        """Capture visibility and aggregated values of a row before an update."""
+        aggregates = self._tracked_aggregates()
+        if aggregates is None:
+            return None
+        return self._is_visible(row), {key: self._store.value(row, key) for key in aggregates}
+        
+    def _reaggregate_row(self, row: int, snapshot: Tuple[bool, Dict[str, Any]]):
+        """Replace a row's previous values in the aggregates with its current ones."""
+        was_visible, old_values = snapshot
+        visible = self._is_visible(row)
+        for key, aggregate in self._aggregates.items():
+            old, new = old_values[key], self._store.value(row, key)
+            if was_visible == visible and (not visible or old == new):
+                continue
+            if was_visible:
+                aggregate.remove(old)
+            if visible:
+                aggregate.add(new)
+        
     def rowCount(self, parent=QModelIndex()) -> int:
-        return len(self._data)
+        if parent.isValid():
+            return 0
+        return len(self._store) if self._view is None else len(self._view)
 
     def columnCount(self, parent=QModelIndex()) -> int:
-        return len(self._columns)
+        return 0 if parent.isValid() else len(self._columns)
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        if parent.isValid() or not isinstance(self._store, PagedStore):
+            return False
+        return self._store.can_fetch_more()
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Fetch the next page of rows from a paged source."""
+        if not self.canFetchMore(parent):
+            return
+        count = self._store.prefetch_next_page()
+        if count <= 0:
+            return
+        first = len(self._store)
+        self.beginInsertRows(QModelIndex(), first, first + count - 1)
+        self._store.reveal_rows(count)
+        self.endInsertRows()
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
         if not index.isValid():
             return None
             
-        col_config = self._columns[index.column()]
-        item = self._data[index.row()].get(col_config["key"], "")
-        
-        if role == Qt.DisplayRole:
-            formatter = col_config.get("formatter")
-            return formatter(item) if formatter else str(item)
-        elif role == Qt.TextAlignmentRole:
-            return col_config.get("align", Qt.AlignLeft | Qt.AlignVCenter)
-        elif role == Qt.ForegroundRole:
-            return self._theme_engine.get_color("text")
-        elif role == Qt.BackgroundRole:
-            return self._theme_engine.get_color(
-                "alternate_bg" if index.row() % 2 else "background"
-            )
+        column = index.column()
+        
+        if role == _DISPLAY_ROLE:
+            row = index.row()
+            if self._view is not None:
+                row = self._view[row]
+            formatter = self._formatters[column]
+            if formatter is None:
+                return str(self._buffers[column][row])
+            cache = self._format_cache
+            if cache is None:
+                return formatter(self._buffers[column][row])
+            key = (row, column)
+            text = cache.get(key)
+            if text is None:
+                text = formatter(self._buffers[column][row])
+                cache.put(key, text)
+            return text
+        elif role == _ALIGNMENT_ROLE:
+            return self._alignments[column]
+        elif role == _FOREGROUND_ROLE:
+            return self._foreground
+        elif role == _BACKGROUND_ROLE:
+            return self._backgrounds[index.row() & 1]
             
         return None
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
-        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+        if role == _DISPLAY_ROLE and orientation == Qt.Horizontal:
             return self._columns[section]["title"]
         return None
 
+    @property
+    def format_cache_stats(self) -> Optional[Dict[str, int]]:
+        """Get formatted-value cache statistics, or None when disabled."""
+        return None if self._format_cache is None else self._format_cache.stats
+
+    def set_format_cache(self, max_size: Optional[int]):
+        """Enable caching of formatter output for columns with a formatter.
+        
+        Args:
+            max_size: Maximum number of cached cells, or None to disable
+        """
+        self._format_cache = FormatCache(max_size) if max_size else None
+
+    def clear_format_cache(self):
+        """Drop cached formatter output, e.g. after a locale change."""
+        if self._format_cache is not None:
+            self._format_cache.clear()
+
+    def _reload_pages(self):
+        """Refetch a paged source from its first page after its rows changed."""
+        self.beginResetModel()
+        self._store.reset()
+        self.clear_format_cache()
+        self.endResetModel()
+        self.fetchMore()
+
+    def _on_theme_changed(self, theme_data: Dict):
+        """Rebuild color role brushes and drop theme-dependent cached values."""
+        self._build_brushes(theme_data)
+        self.clear_format_cache()
+
+    def set_filter_columns(self, keys: Optional[Sequence[str]]):
+        """Set which columns the text filter searches.
+        
+        Args:
+            keys: Column keys, or None to search all columns
+        """
+        self._filter_keys = list(keys) if keys is not None else None
+        self._reset_search_index()
+        if self._filter_text:
+            self.set_filter_text(self._filter_text)
+
+    def set_filter_text(self, text: str):
+        """Show only rows whose display text contains ``text``.
+        
+        The search index is built on first use and reused until the
+        data or the filter columns change. On large stores the query
+        runs on a worker thread and supersedes any query still running;
+        the visible rows are swapped in once it completes. Queryable
+        sources filter their raw values themselves and are re-paged.
+        """
+        if self.supports_query_pushdown:
+            self._filter_text = text
+            if (text, self._filter_keys) != self._pushed_filter:
+                self._pushed_filter = (text, self._filter_keys)
+                self._store.source.set_filter(text, self._filter_keys)
+                self._reload_pages()
+            return
+        if not self.supports_index_filter:
+            return
+        self.cancel_filter()
+        self._filter_text = text
+        if text and self.filters_in_background:
+            self._start_background_filter(text)
+            return
+        rows = self._ensure_search_index().search(text) if text else None
+        self._relayout(lambda: setattr(self, "_filter_rows", rows))
+
+    def cancel_filter(self):
+        """Cancel a running background filter."""
+        if self._filter_task is not None:
+            self._filter_task.cancel()
+            self._filter_task = None
+            self.filtering_changed.emit(False)
+
+    def _start_background_filter(self, text: str):
+        """Filter on a worker thread, keeping the visible rows until done."""
+        order, row_count = self._order, len(self._store)
+        
+        def run(task: BackgroundTask):
+            try:
+                rows = self._ensure_search_index().search(text, lambda: task.is_cancelled)
+            except SearchCancelled:
+                return None
+            return order, rows, compose_view(order, rows, row_count)
+            
+        self._filter_task = BackgroundTask(run)
+        self._filter_task.finished.connect(self._on_filter_finished)
+        self._filter_task.failed.connect(self._on_filter_failed)
+        self._filter_task.start()
+        self.filtering_changed.emit(True)
+
+    def _on_filter_finished(self, result):
+        """Apply the result of a background filter."""
+        if self.sender() is not self._filter_task or result is None:
+            return
+        self._filter_task = None
+        order, rows, view = result
+        # Recompose if the sort order changed while filtering
+        self._relayout(
+            lambda: setattr(self, "_filter_rows", rows),
+            view if order is self._order else _COMPOSE
+        )
+        self.filtering_changed.emit(False)
+
+    def _on_filter_failed(self, _):
+        """Handle a failed background filter."""
+        if self.sender() is self._filter_task:
+            self._filter_task = None
+            self.filtering_changed.emit(False)
+
+    def _search_columns(self) -> List[Dict]:
+        """Get configuration of the columns the filter searches."""
+        if self._filter_keys is None:
+            return self._columns
+        return [col for col in self._columns if col["key"] in self._filter_keys]
+
+    def _ensure_search_index(self) -> SearchIndex:
+        """Get the search index, building it if needed.
+        
+        Safe to call from worker threads; concurrent callers wait for a
+        single build instead of each building their own index.
+        """
+        with self._index_lock:
+            index = self._search_index
+            if index is None:
+                generation = self._index_generation
+                index = SearchIndex.build(self._store, self._search_columns())
+                if generation == self._index_generation:
+                    self._search_index = index
+            return index
+
+    def _reset_search_index(self):
+        """Drop the search index after data or filter column changes."""
+        self._index_generation += 1
+        self._search_index = None
+
+    def append_rows(self, rows: Sequence[Dict]):
+        """Append rows, placing them at their sorted position.
+        
+        Rows not matching the active filter are stored but stay hidden.
+        
+        Args:
+            rows: Row dictionaries
+        """
+        rows = list(rows)
+        if not rows:
+            return
+        store = self._column_store()
+        if self._expressions:
+            rows = compute_rows(rows, self._expressions)
+        state = self._begin_mutation()
+        first = len(store)
+        if self._view is None:
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            store.append_rows(rows)
+            self._rows_appended(first)
+            self.endInsertRows()
+        else:
+            store.append_rows(rows)
+            self._rows_appended(first)
+            if len(rows) > INCREMENTAL_ROW_LIMIT:
+                # New rows stay hidden until sort and filter are reapplied
+                if self._order is not None:
+                    state["resort"] = self._sort_spec
+                state["refilter"] = state["refilter"] or self._filter_rows is not None
+            else:
+                row_key = row_sort_key(store, self._sort_spec)
+                for row in range(first, len(store)):
+                    self._place_row(row, row_key)
+        aggregates = self._tracked_aggregates()
+        if aggregates is not None:
+            visible = [row for row in range(first, len(store)) if self._is_visible(row)]
+            for key, aggregate in aggregates.items():
+                for value in map(store.column(key).__getitem__, visible):
+                    aggregate.add(value)
+        self._end_mutation(state)
+        self._notify_aggregates()
+
+    def update_rows(self, rows: Sequence[Dict], key: str = "id"):
+        """Update rows identified by a key column.
+        
+        Changed cells emit ``dataChanged``; rows whose sort position or
+        filter match changes are moved, shown or hidden.
+        
+        Args:
+            rows: Row dictionaries holding the key and the changed values
+            key: Column identifying rows
+            
+        Raises:
+            KeyError: If a row key is not in the grid
+        """
+        store = self._column_store()
+        lookup = self._key_lookup(key)
+        updates = []
+        for values in rows:
+            if values.get(key) not in lookup:
+                raise KeyError(f"No row with {key}={values.get(key)!r}")
+            updates.append((lookup[values[key]], values))
+        if not updates:
+            return
+        
+        state = self._begin_mutation()
+        sort_keys = {name for name, _ in self._sort_spec}
+        updates = [
+            (row, {name: value for name, value in values.items() if name != key})
+            for row, values in updates
+        ]
+        if self._expressions:
+            for row, values in updates:
+                values.update(compute_row_update(store, row, values, self._expressions))
+        resorts = [self._order is not None and not sort_keys.isdisjoint(values) for _, values in updates]
+        # Many moves are cheaper as one layout change than as row signals
+        moving = len(updates) if self._filter_rows is not None else sum(resorts)
+        notify = moving <= MOVE_SIGNAL_LIMIT
+        changed_keys = set()
+        
+        def apply():
+            row_key = row_sort_key(store, self._sort_spec)
+            for (row, values), resort in zip(updates, resorts):
+                order_row = bisect_left(self._order, row_key(row), key=row_key) if resort else None
+                view_row = None
+                if not notify:
+                    pass  # The view is recomposed afterwards
+                elif self._filter_rows is None:
+                    view_row = order_row  # The view lists the sort order unfiltered
+                else:
+                    view_row = self._locate_view_row(row, row_key)
+                snapshot = self._aggregate_snapshot(row)
+                store.update_row(row, values)
+                if resort:
+                    row_key = row_sort_key(store, self._sort_spec)  # Buffers may be widened
+                changed_keys.update(values)
+                if self._search_index is not None:
+                    self._search_index.update_rows(store, [row])
+                if resort or self._filter_rows is not None:
+                    self._reposition_row(row, row_key, view_row, order_row, notify)
+                if snapshot is not None:
+                    self._reaggregate_row(row, snapshot)
+            self._bind_columns()
+            if self._format_cache is not None:
+                self._format_cache.invalidate_rows(
+                    [row for row, _ in updates],
+                    [i for i, col in enumerate(self._columns) if col["key"] in changed_keys]
+                )
+            
+        if notify:
+            apply()
+            self._emit_rows_changed([row for row, _ in updates], changed_keys)
+        else:
+            self._relayout(apply)
+        for name in changed_keys:
+            self._sort_engine.invalidate(name)
+        self._end_mutation(state)
+        self._notify_aggregates()
+
+    def remove_rows(self, keys: Sequence[Any], key: str = "id"):
+        """Remove rows identified by a key column.
+        
+        Args:
+            keys: Key values of the rows to remove
+            key: Column identifying rows
+            
+        Raises:
+            KeyError: If a row key is not in the grid
+        """
+        store = self._column_store()
+        lookup = self._key_lookup(key)
+        missing = [value for value in keys if value not in lookup]
+        if missing:
+            raise KeyError(f"No row with {key}={missing[0]!r}")
+        rows = sorted({lookup[value] for value in keys})
+        if not rows:
+            return
+        
+        state = self._begin_mutation()
+        aggregates = self._tracked_aggregates()
+        if aggregates is not None:
+            visible = [row for row in rows if self._is_visible(row)]
+            for key, aggregate in aggregates.items():
+                for value in map(store.column(key).__getitem__, visible):
+                    aggregate.remove(value)
+        if self._view is None:
+            self._view = array("q", range(len(store)))
+            self._positions = None
+        
+        # Remove visible rows in contiguous runs, last first
+        positions = sorted((p for p in self.view_rows(rows) if p is not None), reverse=True)
+        while positions:
+            last = first = positions.pop(0)
+            while positions and positions[0] == first - 1:
+                first = positions.pop(0)
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._view[first:last + 1]
+            self.endRemoveRows()
+        
+        # Drop hidden rows and renumber storage rows below the view
+        keep = bytearray(b"\x01") * len(store)
+        for row in rows:
+            keep[row] = 0
+        renumber = array("q", accumulate(keep))
+        
+        def remap(sequence):
+            if sequence is None:
+                return None
+            return array("q", [renumber[row] - 1 for row in compress(sequence, map(keep.__getitem__, sequence))])
+            
+        self._order = remap(self._order)
+        self._filter_rows = remap(self._filter_rows)
+        self._view = remap(self._view) if self._order is not None or self._filter_rows is not None else None
+        store.remove_rows(rows)
+        if self._search_index is not None:
+            self._search_index.remove_rows(rows)
+        self._sort_engine.invalidate()
+        self._key_index = None
+        self._positions = None
+        self.clear_format_cache()  # Storage rows were renumbered
+        self._bind_columns()
+        self._end_mutation(state)
+        self._notify_aggregates()
+
+    def reload_rows(self, data: ColumnStore, key: str = "id") -> Dict[str, Any]:
+        """Replace all rows, notifying only the rows that differ.
+        
+        Rows are matched by a key column: missing rows are removed, new
+        rows inserted, changed cells emit ``dataChanged`` and a change of
+        row order is applied as one layout change, so persistent indexes,
+        selection and scroll position follow their rows.
+        
+        Args:
+            data: Store holding the new rows
+            key: Column identifying rows
+            
+        Returns:
+            Dict with the number of rows ``removed``, ``changed`` and
+            ``inserted``, whether rows were ``reordered``, and the time
+            taken by the diff (``diff_ms``) and by applying it (``apply_ms``)
+            
+        Raises:
+            ValueError: If the old or new rows repeat a key
+        """
+        store = self._column_store()
+        if self._expressions:
+            compute_columns(data, self._expressions, self._columns)
+        start = time.perf_counter()
+        diff = diff_stores(store, data, key)
+        diffed = time.perf_counter()
+        
+        updates = []
+        for row, names in diff.changed.items():
+            # Computed values follow from their inputs
+            names = [name for name in names if name not in self._expressions]
+            if names:
+                updates.append({key: data.value(row, key), **{name: data.value(row, name) for name in names}})
+        if updates:
+            self.update_rows(updates, key)
+        if diff.removed:
+            self.remove_rows(diff.removed, key)
+        if diff.added:
+            self.append_rows([
+                {name: value for name, value in data.row(row).items() if name not in self._expressions}
+                for row in diff.added
+            ])
+        reordered = diff.reordered
+        self._swap_store(data, diff.renumber if reordered else None)
+        
+        self._reload_stats = {
+            "removed": len(diff.removed),
+            "changed": len(diff.changed),
+            "inserted": len(diff.added),
+            "reordered": reordered,
+            "diff_ms": (diffed - start) * 1000,
+            "apply_ms": (time.perf_counter() - diffed) * 1000,
+        }
+        logger.debug(f"Reloaded {len(data):,} rows by {key!r}: {self._reload_stats}")
+        return self._reload_stats
+
+    @property
+    def reload_stats(self) -> Optional[Dict[str, Any]]:
+        """Get counters and timings of the last ``reload_rows``, if any."""
+        return self._reload_stats
+
+    def _swap_store(self, data: ColumnStore, renumber: Optional[array] = None):
+        """Swap in a store holding the same rows, possibly in another order.
+        
+        Args:
+            data: Store holding the rows
+            renumber: Current storage row -> storage row in ``data``, or
+                None if the rows are in the same order
+        """
+        state = self._begin_mutation()
+        if renumber is None:
+            self._store = data
+        else:
+            def update():
+                self._store = data
+                if self._order is not None:
+                    # Ties are ordered by storage row, so renumbered ties must be sorted again
+                    order = map(renumber.__getitem__, self._order)
+                    self._order = array("q", sorted(order, key=row_sort_key(data, self._sort_spec)))
+                if self._filter_rows is not None:
+                    self._filter_rows = array("q", sorted(map(renumber.__getitem__, self._filter_rows)))
+                    
+            self._relayout(update, renumber=renumber)
+            if self._search_index is not None:
+                self._search_index.reorder(renumber)
+            self._key_index = None
+            self.clear_format_cache()  # Storage rows were renumbered
+        self._sort_engine.invalidate()
+        self._bind_columns()
+        self._end_mutation(state)
+
+    @property
+    def update_stats(self) -> Dict[str, int]:
+        """Get counters of the update queue.
+        
+        Returns:
+            Dict with the number of cell updates ``queued``, ``merged`` into
+            a pending update of the same cell, and ``dropped`` (queue full
+            or unknown row), plus the number of ``flushes``
+        """
+        with self._update_lock:
+            return dict(self._update_stats)
+
+    def queue_update(self, values: Mapping[str, Any], key: str = "id"):
+        """Queue a row update; safe to call from any thread.
+        
+        Updates to the same cell are merged and applied together with
+        ``update_rows`` at most once per frame.
+        
+        Args:
+            values: Row dictionary holding the key and the changed values
+            key: Column identifying rows
+        """
+        self._column_store()
+        row_id = (key, values[key])
+        cells = len(values) - 1
+        with self._update_lock:
+            pending = self._pending_updates.get(row_id)
+            if pending is None:
+                if len(self._pending_updates) >= MAX_PENDING_UPDATES:
+                    self._update_stats["dropped"] += cells
+                    return
+                pending = self._pending_updates[row_id] = {}
+            for name, value in values.items():
+                if name != key:
+                    self._update_stats["merged"] += name in pending
+                    pending[name] = value
+            self._update_stats["queued"] += cells
+            schedule = not self._flush_scheduled
+            self._flush_scheduled = True
+        if schedule:
+            self._flush_requested.emit()
+
+    def flush_updates(self):
+        """Apply queued updates now."""
+        with self._update_lock:
+            pending, self._pending_updates = self._pending_updates, {}
+            self._flush_scheduled = False
+        if not pending:
+            return
+        
+        rows_by_key: Dict[str, List[Dict]] = {}
+        for (key, value), values in pending.items():
+            rows_by_key.setdefault(key, []).append({key: value, **values})
+        dropped = 0
+        for key, rows in rows_by_key.items():
+            lookup = self._key_lookup(key)
+            known = [row for row in rows if row[key] in lookup]
+            dropped += sum(len(row) - 1 for row in rows if row[key] not in lookup)
+            self.update_rows(known, key)
+        with self._update_lock:
+            self._update_stats["dropped"] += dropped
+            self._update_stats["flushes"] += 1
+
+    def _on_flush_timer(self):
+        """Flush queued updates unless background work is running."""
+        if self._sort_task is not None or self._filter_task is not None:
+            # Changes would restart the sort/filter; keep merging until done
+            self._flush_timer.start()
+        else:
+            self.flush_updates()
+
+    def _column_store(self) -> ColumnStore:
+        """Get the store, requiring it to be held in memory."""
+        if not isinstance(self._store, ColumnStore):
+            raise TypeError("Incremental updates require an in-memory data store")
+        return self._store
+
+    def _begin_mutation(self) -> Dict[str, Any]:
+        """Prepare sort/filter state for in-place changes.
+        
+        Running background work is cancelled and restarted by
+        ``_end_mutation``. The view mapping is detached from the sort and
+        filter arrays so each can be edited separately.
+        """
+        state = {
+            "resort": self._pending_sort_spec if self._sort_task is not None else None,
+            "refilter": self._filter_task is not None
+                or (self._filter_rows is not None and self._search_index is None),
+        }
+        self.cancel_sort()
+        self.cancel_filter()
+        if self._search_index is None:
+            self._reset_search_index()  # Discard indexes still being built
+        if self._view is not None and (self._view is self._order or self._view is self._filter_rows):
+            self._view = array("q", self._view)
+        return state
+
+    def _end_mutation(self, state: Dict[str, Any]):
+        """Restart sort/filter work cancelled by ``_begin_mutation``."""
+        self._longest_rows.clear()
+        if state["resort"] is not None:
+            self.sort_by(state["resort"])
+        if state["refilter"]:
+            self.set_filter_text(self._filter_text)
+
+    def _notify_aggregates(self):
+        """Signal that aggregates may have changed, if any are configured."""
+        if any(col.get("aggregate") for col in self._columns):
+            self.aggregates_changed.emit()
+
+    def _rows_appended(self, first: int):
+        """Update caches after rows were appended from ``first`` on."""
+        count = len(self._store) - first
+        self._bind_columns()
+        self._sort_engine.invalidate()
+        self._positions = None
+        if self._search_index is not None:
+            self._search_index.append_rows(self._store, count)
+        if self._key_index is not None:
+            name, lookup = self._key_index
+            for offset, value in enumerate(self._store.column(name)[first:]):
+                lookup.setdefault(value, first + offset)
+
+    def _key_lookup(self, key: str) -> Dict[Any, int]:
+        """Get the key value -> storage row table for a key column."""
+        if self._key_index is None or self._key_index[0] != key:
+            values = self._store.column(key)
+            # Built backwards so the first row wins for repeated keys
+            lookup = dict(zip(reversed(values), range(len(values) - 1, -1, -1)))
+            self._key_index = (key, lookup)
+        return self._key_index[1]
+
+    def _matches_filter(self, row: int, default: bool = False) -> bool:
+        """Check whether a storage row matches the active filter.
+        
+        Returns ``default`` while no search index is available; the
+        filter is reapplied once the change completes.
+        """
+        if self._filter_rows is None:
+            return True
+        if self._search_index is None:
+            return default
+        return self._filter_text.lower() in self._search_index.text(row)
+
+    def _locate_view_row(self, row: int, row_key: Callable[[int], tuple]) -> Optional[int]:
+        """Find the view row of a storage row by bisecting the view."""
+        if self._view is None:
+            return row
+        if self._order is None:
+            position = bisect_left(self._view, row)
+        else:
+            position = bisect_left(self._view, row_key(row), key=row_key)
+        if position < len(self._view) and self._view[position] == row:
+            return position
+        return None
+
+    def _view_insert_position(self, row: int, row_key: Callable[[int], tuple]) -> int:
+        """Find where a storage row belongs in the view."""
+        if self._order is None:
+            return bisect_right(self._view, row)
+        return bisect_right(self._view, row_key(row), key=row_key)
+
+    def _place_row(self, row: int, row_key: Callable[[int], tuple]):
+        """Insert a new storage row into the sort order, filter and view."""
+        if self._order is not None:
+            self._order.insert(bisect_right(self._order, row_key(row), key=row_key), row)
+        if not self._matches_filter(row):
+            return
+        if self._filter_rows is not None:
+            self._filter_rows.insert(bisect_right(self._filter_rows, row), row)
+        position = self._view_insert_position(row, row_key)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._view.insert(position, row)
+        self.endInsertRows()
+
+    def _reposition_row(self, row: int, row_key: Callable[[int], tuple],
+                        view_row: Optional[int], order_row: Optional[int], notify: bool = True):
+        """Move, show or hide an updated storage row.
+        
+        Args:
+            row: Storage row with its new values
+            row_key: Sort key function
+            view_row: View row before the update, None if hidden
+            order_row: Position in the sort order before the update, if
+                the update changed a sorted column
+            notify: Update the view with row signals; otherwise only the
+                sort order and filter matches are updated
+        """
+        if order_row is not None:
+            _move_item(self._order, order_row, _sorted_position(self._order, order_row, row_key))
+        
+        if self._filter_rows is not None:
+            position = bisect_left(self._filter_rows, row)
+            listed = position < len(self._filter_rows) and self._filter_rows[position] == row
+            matches = self._matches_filter(row, default=listed)
+            if listed and not matches:
+                del self._filter_rows[position]
+            elif matches and not listed:
+                self._filter_rows.insert(position, row)
+        else:
+            matches = True
+        if not notify:
+            return
+        
+        if view_row is None:
+            if matches:
+                position = self._view_insert_position(row, row_key)
+                self.beginInsertRows(QModelIndex(), position, position)
+                self._view.insert(position, row)
+                self.endInsertRows()
+        elif not matches:
+            self.beginRemoveRows(QModelIndex(), view_row, view_row)
+            del self._view[view_row]
+            self.endRemoveRows()
+        elif order_row is not None:
+            position = _sorted_position(self._view, view_row, row_key)
+            if position == view_row:
+                return
+            # Destination is given as a row index before the move
+            destination = position if position < view_row else position + 1
+            self.beginMoveRows(QModelIndex(), view_row, view_row, QModelIndex(), destination)
+            _move_item(self._view, view_row, position)
+            self.endMoveRows()
+        else:
+            return
+        self._positions = None
+
+    def view_rows(self, rows: Sequence[int]) -> List[Optional[int]]:
+        """Map storage rows to view rows (None when hidden).
+        
+        While a layout change renumbers the store, rows are taken as
+        storage rows from before the change.
+        """
+        if self._renumbered is not None:
+            rows = [self._renumbered[row] for row in rows]
+        if self._view is None:
+            return list(rows)
+        if self._positions is None and len(rows) <= _POSITION_TABLE_THRESHOLD:
+            row_key = row_sort_key(self._store, self._sort_spec)
+            return [self._locate_view_row(row, row_key) for row in rows]
+        if self._positions is None:
+            positions = array("q", [-1]) * len(self._store)
+            for position, row in enumerate(self._view):
+                positions[row] = position
+            self._positions = positions
+        return [None if self._positions[row] < 0 else self._positions[row] for row in rows]
+
+    def _emit_rows_changed(self, rows: Sequence[int], keys: set):
+        """Emit dataChanged for changed rows, merging adjacent view rows."""
+        columns = [i for i, col in enumerate(self._columns) if col["key"] in keys]
+        if not columns:
+            return
+        positions = sorted({position for position in self.view_rows(rows) if position is not None})
+        left, right = min(columns), max(columns)
+        start = 0
+        for i in range(1, len(positions) + 1):
+            if i == len(positions) or positions[i] != positions[i - 1] + 1:
+                self.dataChanged.emit(
+                    self.index(positions[start], left), self.index(positions[i - 1], right), [Qt.DisplayRole]
+                )
+                start = i
+
     def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
-        """Sort data by column."""
+        """Sort data by column.
+        
+        Previously sorted columns are kept as tie-breakers. A negative
+        column (or one out of range) restores the original row order.
+        """
+        if not 0 <= column < len(self._columns):
+            self.sort_by([])
+            return
+        key = self._columns[column]["key"]
+        spec = [(key, order == Qt.DescendingOrder)]
+        spec += [item for item in self._sort_spec if item[0] != key]
+        self.sort_by(spec[:MAX_SORT_KEYS])
+
+    def sort_by(self, spec: Sequence[Tuple[str, bool]]):
+        """Sort by several columns.
+        
+        Queryable sources sort themselves and are re-paged from the top.
+        
+        Args:
+            spec: (column key, descending) pairs, most significant first
+        """
+        if self.supports_query_pushdown:
+            self._sort_spec = list(spec)
+            self._store.source.set_sort(self._sort_spec)
+            self._reload_pages()
+            return
+        if not isinstance(self._store, ColumnStore):
+            return  # Paged sources are not held in memory
+        self.cancel_sort()
+        spec = list(spec)
+        if not spec:
+            self._apply_order(None, spec)
+        elif len(self._store) < ASYNC_SORT_THRESHOLD:
+            self._apply_order(self._sort_engine.argsort(self._store, spec), spec)
+        else:
+            self._start_background_sort(spec)
+
+    def restore_sort(self, spec: Sequence[Tuple[str, bool]], order: array):
+        """Apply a sort permutation computed earlier, without sorting.
+        
+        Args:
+            spec: (column key, descending) pairs the permutation sorts by
+            order: View position -> storage row
+            
+        Raises:
+            ValueError: If the permutation does not cover the stored rows
+        """
+        if not isinstance(self._store, ColumnStore) or len(order) != len(self._store):
+            raise ValueError("Sort order does not match the stored rows")
+        self.cancel_sort()
+        self._apply_order(order, list(spec))
+        
+    def invalidate_sort_keys(self, key: Optional[str] = None):
+        """Drop cached sort keys after data changes."""
+        self._sort_engine.invalidate(key)
+
+    def _start_background_sort(self, spec: List[Tuple[str, bool]]):
+        """Sort on a worker thread, keeping the current order until done."""
+        store, engine = self._store, self._sort_engine
+        
+        def run(task: BackgroundTask):
+            try:
+                return engine.argsort(store, spec, chunked=True, is_cancelled=lambda: task.is_cancelled)
+            except SortCancelled:
+                return None
+                
+        self._pending_sort_spec = spec
+        self._sort_task = BackgroundTask(run)
+        self._sort_task.finished.connect(self._on_sort_finished)
+        self._sort_task.failed.connect(self._on_sort_failed)
+        self._sort_task.start()
+        self.busy_changed.emit(True)
+
+    def cancel_sort(self):
+        """Cancel a running background sort."""
+        if self._sort_task is not None:
+            self._sort_task.cancel()
+            self._sort_task = None
+            self.busy_changed.emit(False)
+
+    def _on_sort_finished(self, order):
+        """Apply the result of a background sort."""
+        if self.sender() is not self._sort_task or order is None:
+            return
+        self._sort_task = None
+        self._apply_order(order, self._pending_sort_spec)
+        self.busy_changed.emit(False)
+
+    def _on_sort_failed(self, _):
+        """Handle a failed background sort."""
+        if self.sender() is self._sort_task:
+            self._sort_task = None
+            self.busy_changed.emit(False)
+
+    def _apply_order(self, order, spec: List[Tuple[str, bool]]):
+        """Swap in a new sort permutation."""
+        def update():
+            self._order = order
+            self._sort_spec = spec
+        self._relayout(update)
+
+    def _compose_view(self):
+        """Combine sort permutation and filter matches into the view mapping."""
+        return compose_view(self._order, self._filter_rows, len(self._store))
+
+    def _relayout(self, update: Callable[[], None], view=_COMPOSE, renumber: Optional[array] = None):
+        """Apply a sort/filter state change as a single layout change.
+        
+        Persistent indexes follow their storage rows; rows that are no
+        longer visible get invalid indexes.
+        
+        Args:
+            update: Applies the new sort/filter state
+            view: Precomputed view mapping for the new state, if any
+            renumber: Old -> new storage row, if ``update`` reorders the store
+        """
         self.layoutAboutToBeChanged.emit()
-        col_key = self._columns[column]["key"]
-        reverse = order == Qt.DescendingOrder
-        self._data.sort(
-            key=lambda x: str(x.get(col_key, "")),
-            reverse=reverse
-        )
+        persistent = self.persistentIndexList()
+        storage_rows = [self.storage_row(index.row()) for index in persistent]
+        if renumber is not None:
+            storage_rows = [renumber[row] for row in storage_rows]
+        filter_rows = self._filter_rows
+        update()
+        self._view = self._compose_view() if view is _COMPOSE else view
+        self._positions = None
+        self._renumbered = renumber
+        if persistent:
+            positions = {storage: self._view_position(storage) for storage in set(storage_rows)}
+            self.changePersistentIndexList(persistent, [
+                QModelIndex() if positions[storage] is None
+                else self.index(positions[storage], index.column())
+                for index, storage in zip(persistent, storage_rows)
+            ])
         self.layoutChanged.emit()
+        self._renumbered = None
+        if self._filter_rows is not filter_rows:
+            self._aggregates = None  # Recomputed for the new matches on next use
+            self._notify_aggregates()
+
+    def _view_position(self, storage_row: int) -> Optional[int]:
+        """Find the view row showing a storage row."""
+        if self._view is None:
+            return storage_row
+        try:
+            return self._view.index(storage_row)
+        except ValueError:
+            return None
+
+def _grid_colors(theme_data: Dict) -> Dict[str, str]:
+    """Resolve grid colors from theme data.
+    
+    Text colors are nested under ``text``; alternate rows fall back to
+    the theme's surface color.
+    """
+    text = theme_data.get("text", {})
+    return {
+        "text": text.get("primary", "#212529") if isinstance(text, dict) else text,
+        "background": theme_data.get("background", "#ffffff"),
+        "alternate_bg": theme_data.get("alternate_bg", theme_data.get("surface", "#f8f9fa")),
+    }
+
+def _grid_stylesheet(theme_data: Dict, variant: str) -> str:
+    """Build the DataGrid stylesheet.
+    
+    The "fast_painting" variant leaves out the item rules, since the
+    fast-path delegate paints items itself.
+    """
+    colors = _grid_colors(theme_data)
+    style = f"""
+            QTableView {{
+                background-color: {colors["background"]};
+                alternate-background-color: {colors["alternate_bg"]};
+                gridline-color: {theme_data.get("border", "#dee2e6")};
+                color: {colors["text"]};
+                border: 1px solid {theme_data.get("border", "#dee2e6")};
+            }}
+            QHeaderView::section {{
+                background-color: {theme_data.get("header_bg", "#e9ecef")};
+                color: {colors["text"]};
+                padding: 8px;
+                border: none;
+                border-right: 1px solid {theme_data.get("border", "#dee2e6")};
+                border-bottom: 1px solid {theme_data.get("border", "#dee2e6")};
+            }}
+        """
+    if variant != "fast_painting":
+        style += f"""
+            QTableView::item {{
+                padding: 8px;
+            }}
+            QTableView::item:selected {{
+                background-color: {theme_data.get("primary", "#007bff")};
+                color: {theme_data.get("text_light", "#ffffff")};
+            }}
+            """
+    return style
+
+def _filter_stylesheet(theme_data: Dict, variant: str) -> str:
+    """Build the stylesheet of the filter bar input, or of its "status" label."""
+    if variant == "status":
+        return f"color: {theme_data.get('text', {}).get('secondary', '#6c757d')};"
+    return f"""
+            QLineEdit {{
+                background-color: {theme_data.get("input_bg", "#ffffff")};
+                color: {_grid_colors(theme_data)["text"]};
+                border: 1px solid {theme_data.get("border", "#ced4da")};
+                border-radius: 4px;
+                padding: 6px 12px;
+            }}
+        """
+
+ThemeEngine.register_stylesheet("data_grid", _grid_stylesheet)
+ThemeEngine.register_stylesheet("data_grid_filter", _filter_stylesheet)
+
+def _sorted_position(rows: array, index: int, row_key: Callable[[int], tuple]) -> int:
+    """Find where an item whose key changed belongs in an otherwise sorted array.
+    
+    Returns:
+        Index of the item after moving it
+    """
+    key = row_key(rows[index])
+    if index > 0 and key < row_key(rows[index - 1]):
+        return bisect_right(rows, key, 0, index, key=row_key)
+    if index + 1 < len(rows) and row_key(rows[index + 1]) < key:
+        return bisect_right(rows, key, index + 1, len(rows), key=row_key) - 1
+    return index
+
+def _move_item(rows: array, source: int, target: int):
+    """Move an item, shifting only the items in between."""
+    item = rows[source]
+    if target < source:
+        rows[target + 1:source + 1] = rows[target:source]
+    elif target > source:
+        rows[source:target] = rows[source + 1:target + 1]
+    rows[target] = item
+
+def compose_view(order: Optional[array], filter_rows: Optional[array], row_count: int) -> Optional[array]:
+    """Combine a sort permutation and filter matches into a view mapping.
+    
+    Args:
+        order: Sort permutation, or None when unsorted
+        filter_rows: Ascending matching storage rows, or None when unfiltered
+        row_count: Number of rows in the store
+        
+    Returns:
+        View row -> storage row, or None for identity
+    """
+    if filter_rows is None:
+        return order
+    if order is None:
+        return filter_rows
+    matches = bytearray(row_count)
+    for row in filter_rows:
+        matches[row] = 1
+    return array("q", compress(order, map(matches.__getitem__, order)))
+
+class DataGridProxyModel(QIdentityProxyModel):
+    """Passthrough proxy that delegates sorting to the source model's sort engine.
+    
+    In-memory models sort and filter themselves, so row moves and inserts
+    pass straight through instead of rebuilding a proxy row mapping.
+    """
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
+        source = self.sourceModel()
+        if source is not None:
+            source.sort(column, order)
+
+class DataGridFilterProxyModel(QSortFilterProxyModel):
+    """Proxy filtering and sorting the loaded rows of paged sources.
+    
+    Paged sources that cannot query have no search index and are not
+    held in memory, so the rows fetched so far are filtered and sorted
+    here, by stored value rather than display text.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFilterKeyColumn(-1)  # Search all columns
+        self.setFilterRole(Qt.DisplayRole)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self._row_key: Optional[Callable[[int], tuple]] = None
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
+        source = self.sourceModel()
+        if source is None:
+            return
+        if source.supports_query_pushdown or isinstance(source.store, ColumnStore):
+            source.sort(column, order)
+            return
+        if 0 <= column < source.columnCount():
+            self._row_key = row_sort_key(source.store, [(source.column_key(column), False)])
+        super().sort(column, order)
+        
+    def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
+        source = self.sourceModel()
+        row_key = self._row_key
+        return row_key(source.storage_row(left.row())) < row_key(source.storage_row(right.row()))
+
+class DataGridFooterModel(QAbstractTableModel):
+    """Exposes the column aggregates of a DataGridModel as header data."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._source: Optional[DataGridModel] = None
+        
+    def set_source(self, source: DataGridModel):
+        """Show aggregates of another model."""
+        self.beginResetModel()
+        if self._source is not None:
+            self._source.aggregates_changed.disconnect(self._on_aggregates_changed)
+        self._source = source
+        source.aggregates_changed.connect(self._on_aggregates_changed)
+        self.endResetModel()
+        
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0
+        
+    def columnCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid() or self._source is None:
+            return 0
+        return self._source.columnCount()
+        
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        return None
+        
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == _DISPLAY_ROLE and orientation == Qt.Horizontal and self._source is not None:
+            return self._source.aggregate_text(section)
+        return None
+        
+    def _on_aggregates_changed(self):
+        """Repaint the footer with the current aggregates."""
+        if self.columnCount():
+            self.headerDataChanged.emit(Qt.Horizontal, 0, self.columnCount() - 1)
+
+class DataGridFooter(QHeaderView):
+    """Footer row under a table view, kept aligned with its columns."""
+    
+    def __init__(self, table_view: QTableView, parent=None):
+        super().__init__(Qt.Horizontal, parent)
+        self._table_view = table_view
+        self._footer_model = DataGridFooterModel(self)
+        self.setModel(self._footer_model)
+        self.setSectionsClickable(False)
+        self.setSectionResizeMode(QHeaderView.Fixed)
+        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        
+        header = table_view.horizontalHeader()
+        header.sectionResized.connect(lambda section, old, new: self.resizeSection(section, new))
+        table_view.horizontalScrollBar().valueChanged.connect(lambda _: self.setOffset(header.offset()))
+        table_view.viewport().installEventFilter(self)
+        
+    def set_source(self, model: DataGridModel):
+        """Show aggregates of a grid model."""
+        self._footer_model.set_source(model)
+        header = self._table_view.horizontalHeader()
+        for section in range(header.count()):
+            self.resizeSection(section, header.sectionSize(section))
+        self.setOffset(header.offset())
+        
+    def minimumSizeHint(self) -> QSize:
+        # The scroll area minimum would be taller than a single header row
+        return self.sizeHint()
+        
+    def eventFilter(self, watched, event: QEvent) -> bool:
+        """Match the table viewport's horizontal extent as it resizes."""
+        if event.type() == QEvent.Resize:
+            geometry = self._table_view.viewport().geometry()
+            self.setViewportMargins(geometry.left(), 0, self._table_view.width() - geometry.right() - 1, 0)
+        return False
 
 class FilterBar(ThemedWidget):
     """Search/filter bar for DataGrid."""
@@ -71,6 +1528,9 @@ class FilterBar(ThemedWidget):
         # Create widgets before theme initialization
         self.search_input = QLineEdit()
         self.clear_btn = StyledButton("Clear")
+        self.status_label = QLabel("Filtering…")
+        self._busy = False
+        self._status: Optional[str] = None
         
         # Initialize themed widget
         super().__init__(parent, component_type="filter_bar")
@@ -89,48 +1549,82 @@ class FilterBar(ThemedWidget):
         self.clear_btn.set_secondary()
         self.clear_btn.clicked.connect(self._clear_filter)
         
+        # Shown while a filter query is pending or a file is indexed
+        self.status_label.hide()
+        
         layout.addWidget(self.search_input)
+        layout.addWidget(self.status_label)
         layout.addWidget(self.clear_btn)
         self.setLayout(layout)
         
     def _clear_filter(self):
         """Clear search input."""
         self.search_input.clear()
+        
+    def set_busy(self, busy: bool):
+        """Show or hide the filtering indicator."""
+        self._busy = busy
+        self._update_status()
+        
+    def set_status(self, text: Optional[str]):
+        """Show a status message, or hide it with None."""
+        self._status = text
+        self._update_status()
+        
+    def _update_status(self):
+        """Show the filtering indicator, else the status message."""
+        text = "Filtering…" if self._busy else self._status
+        if text:
+            self.status_label.setText(text)
+        self.status_label.setVisible(bool(text))
 
     def _apply_theme(self, theme_data: Dict):
         """Apply theme to filter bar."""
         if not hasattr(self, 'search_input'):
             return
             
-        self.search_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {theme_data.get("input_bg", "#ffffff")};
-                color: {theme_data.get("text", "#212529")};
-                border: 1px solid {theme_data.get("border", "#ced4da")};
-                border-radius: 4px;
-                padding: 6px 12px;
-            }}
-        """)
+        self._theme_engine.apply_theme_to_widget(self.search_input, "data_grid_filter")
+        self._theme_engine.apply_theme_to_widget(self.status_label, "data_grid_filter", "status")
 
 class DataGrid(ThemedWidget):
     """Theme-aware data grid component with sorting and filtering."""
     
     row_selected = Signal(dict)  # Emits selected row data
+    rows_selected = Signal(object)  # Emits RowSelection of all selected rows
     row_double_clicked = Signal(dict)  # Emits double-clicked row data
     column_sorted = Signal(str, Qt.SortOrder)  # Emits (column_key, order)
+    index_progress = Signal(int)  # Emits percentage of a loaded file indexed
+    export_progress = Signal(int)  # Emits percentage of exported rows written
+    export_finished = Signal(str, int)  # Emits (path, rows written)
+    export_failed = Signal(str)  # Emits error message
     
     def __init__(self, parent=None):
         # Create components before theme initialization
-        self._table_view = QTableView()
-        self._proxy_model = QSortFilterProxyModel()
+        self._table_view = RowSelectionTableView()
+        self._proxy_model = DataGridProxyModel()
         self._model = DataGridModel([], [], None)
         self._filter_bar = FilterBar()
+        self._footer = DataGridFooter(self._table_view)
+        self._busy_spinner = LoadingSpinner(self._table_view)
+        self._fast_delegate: Optional[FastGridDelegate] = None
         
         # Initialize themed widget
         super().__init__(parent, component_type="data_grid")
         
-        self._data: List[Dict] = []
+        # Background filters start once typing pauses
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        
         self._columns: List[Dict] = []
+        self._filter_columns: Optional[List[str]] = None
+        self._format_cache_size: Optional[int] = None
+        self._file_source: Optional[FileSource] = None
+        self._index_task: Optional[BackgroundTask] = None
+        self._export_task: Optional[BackgroundTask] = None
+        self._export_path = ""
+        self._text_widths = TextWidths()
+        self._group_model: Optional[DataGridGroupModel] = None
         
         self._init_ui()
         self._connect_signals()
@@ -146,6 +1640,10 @@ class DataGrid(ThemedWidget):
         # Configure table view
         self._table_view.setModel(self._proxy_model)
         self._proxy_model.setSourceModel(self._model)
+        self._selection_model: Optional[RowSelectionModel] = None
+        self._selection_delegate = SelectionDelegate(parent=self._table_view)
+        self._table_view.setItemDelegate(self._selection_delegate)
+        self._install_selection_model()
         
         header = self._table_view.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Interactive)
@@ -153,11 +1651,16 @@ class DataGrid(ThemedWidget):
         
         self._table_view.verticalHeader().hide()
         self._table_view.setSelectionBehavior(QTableView.SelectRows)
-        self._table_view.setSelectionMode(QTableView.SingleSelection)
+        self._table_view.setSelectionMode(QTableView.ExtendedSelection)
         self._table_view.setAlternatingRowColors(True)
         self._table_view.setSortingEnabled(True)
         
         layout.addWidget(self._table_view)
+        
+        # Shown when a column has an aggregate
+        self._footer.set_source(self._model)
+        self._footer.hide()
+        layout.addWidget(self._footer)
         self.setLayout(layout)
         
     def _connect_signals(self):
@@ -165,37 +1668,401 @@ class DataGrid(ThemedWidget):
         self._table_view.doubleClicked.connect(self._handle_double_click)
         self._table_view.clicked.connect(self._handle_click)
         self._filter_bar.filter_changed.connect(self._handle_filter)
+        self._table_view.horizontalHeader().sortIndicatorChanged.connect(self._handle_sort_indicator)
+        self._model.busy_changed.connect(self._set_busy)
+        self._model.filtering_changed.connect(self._filter_bar.set_busy)
+        self._filter_timer.timeout.connect(self._apply_pending_filter)
         
     def _handle_click(self, index: QModelIndex):
-        """Handle row selection."""
-        source_index = self._proxy_model.mapToSource(index)
-        row = source_index.row()
-        if 0 <= row < len(self._data):
-            # Get the actual row data
-            data = dict(self._data[row])
-            self.row_selected.emit(data)
+        """Handle row selection; clicking a group row expands or collapses it."""
+        if self._group_model is not None and self._group_model.is_group_row(index.row()):
+            self._group_model.toggle(index.row())
+            return
+        row = self._source_row(index)
+        if 0 <= row < self._model.rowCount():
+            self.row_selected.emit(self._model.row_data(row))
+            
+    def _source_row(self, index: QModelIndex) -> int:
+        """Map a view index to its source model row, -1 for group rows."""
+        if self._group_model is not None:
+            return self._group_model.source_row(index.row())
+        return self._proxy_model.mapToSource(index).row()
+        
+    def _install_selection_model(self):
+        """Replace the view's selection model with a range-based one."""
+        # Views keep replaced selection models alive, including the default
+        # one created along with a new model
+        for old_selection in (self._table_view.selectionModel(), self._selection_model):
+            if old_selection is not None:
+                old_selection.deleteLater()
+        if self._group_model is not None:
+            selection = RowSelectionModel(self._group_model, parent=self)
+        elif isinstance(self._proxy_model, DataGridProxyModel):
+            # Selected rows follow their storage rows through sorting and filtering
+            selection = RowSelectionModel(
+                self._proxy_model,
+                lambda ranges: self._model.storage_rows(ranges),
+                lambda rows: self._model.view_rows(rows),
+                self,
+            )
+        else:
+            selection = RowSelectionModel(self._proxy_model, parent=self)
+        self._table_view.setSelectionModel(selection)
+        self._selection_model = selection
+        self._selection_delegate.set_selection(selection)
+        if self._fast_delegate is not None:
+            self._fast_delegate.set_selection(selection)
+        selection.rows_changed.connect(self._handle_selection_changed)
+        
+    def _handle_selection_changed(self):
+        """Repaint the selection and emit the selected rows."""
+        self._table_view.viewport().update()
+        self.rows_selected.emit(self.selected_rows())
         
     def _handle_double_click(self, index: QModelIndex):
         """Handle row double click."""
-        source_index = self._proxy_model.mapToSource(index)
-        row = source_index.row()
-        if 0 <= row < len(self._data):
-            # Get the actual row data
-            data = dict(self._data[row])
-            self.row_double_clicked.emit(data)
+        row = self._source_row(index)
+        if 0 <= row < self._model.rowCount():
+            self.row_double_clicked.emit(self._model.row_data(row))
+        
+    def _handle_sort_indicator(self, section: int, order: Qt.SortOrder):
+        """Emit column_sorted for header sort clicks."""
+        if 0 <= section < len(self._columns):
+            self.column_sorted.emit(self._columns[section]["key"], order)
+            
+    def _set_busy(self, busy: bool):
+        """Show or hide the busy indicator over the table."""
+        if busy:
+            viewport = self._table_view.viewport()
+            self._busy_spinner.move(
+                viewport.x() + (viewport.width() - self._busy_spinner.width()) // 2,
+                viewport.y() + (viewport.height() - self._busy_spinner.height()) // 2
+            )
+            self._busy_spinner.raise_()
+            self._busy_spinner.start()
+        else:
+            self._busy_spinner.stop()
         
     def _handle_filter(self, text: str):
-        """Apply filter to proxy model."""
-        self._proxy_model.setFilterFixedString(text)
+        """Apply filter text, debouncing queries that run in the background or the data source."""
+        if self._model.filters_in_background or self._model.supports_query_pushdown:
+            self._model.cancel_filter()
+            self._filter_bar.set_busy(True)
+            self._filter_timer.start()
+        else:
+            self._filter_timer.stop()
+            self._apply_filter(text)
+            
+    def _apply_pending_filter(self):
+        """Apply the filter text once typing has paused."""
+        self._apply_filter(self._filter_bar.search_input.text())
         
-    def load_data(self, data: List[Dict], columns: List[Dict]):
-        """Load data into the grid."""
-        self._data = list(data)  # Create a copy to prevent external modification
+    def _apply_filter(self, text: str):
+        """Apply filter text to the model."""
+        if self._model.supports_index_filter or self._model.supports_query_pushdown:
+            self._model.set_filter_text(text)
+        else:
+            self._proxy_model.setFilterFixedString(text)
+        self._filter_bar.set_busy(self._model.is_filtering)
+        
+    def load_data(self, data: Union[List[Dict], Mapping[str, Sequence], ColumnStore], columns: List[Dict],
+                  key: Optional[str] = None):
+        """Load data into the grid.
+        
+        With a ``key``, data replacing in-memory rows with the same columns
+        is diffed against them by that column: only removed, inserted,
+        changed and reordered rows are updated, keeping scroll position
+        and selection. ``reload_stats`` reports the diff. Row lists and
+        column arrays are copied; a prebuilt ColumnStore is used as-is,
+        so the grid's edits change it in place.
+        
+        Args:
+            data: List of row dictionaries, mapping of column key to
+                column values, or a prebuilt ColumnStore
+            columns: Column configuration
+            key: Column identifying rows to diff a reload by
+            
+        Raises:
+            ValueError: If a keyed reload finds repeated keys
+        """
+        reload = (
+            key is not None and list(columns) == self._columns
+            and isinstance(self._model.store, ColumnStore)
+        )
         self._columns = list(columns)  # Create a copy to prevent external modification
-        self._model = DataGridModel(self._data, self._columns, self)
-        self._proxy_model.setSourceModel(self._model)
+        if isinstance(data, ColumnStore):
+            store = data
+        elif isinstance(data, Mapping):
+            store = ColumnStore.from_columns(data, self._columns)
+        else:
+            store = ColumnStore.from_rows(data, self._columns)
+        if reload:
+            self._model.reload_rows(store, key)
+            return
+        self._set_model(DataGridModel(store, self._columns, self))
+        self._update_columns()
+        
+    def save_snapshot(self, path: str):
+        """Save the data, columns, sort and filter to a binary snapshot.
+        
+        Snapshots reopen with ``load_snapshot`` without parsing or
+        sorting. Formatters and other column settings that are not JSON
+        values are not saved.
+        
+        Args:
+            path: Destination path
+            
+        Raises:
+            TypeError: If rows are paged from a data source
+            ValueError: If a column holds values a snapshot cannot store
+            OSError: If the file cannot be written
+        """
+        self._model.save_snapshot(path, self._filter_bar.search_input.text())
+        
+    def load_snapshot(self, path: str, columns: Optional[List[Dict]] = None, verify: bool = True):
+        """Load data saved by ``save_snapshot``, restoring its sort and filter.
+        
+        Args:
+            path: Path of the snapshot
+            columns: Column configuration replacing the saved one, e.g. to
+                add formatters back
+            verify: Check the checksums of the data buffers
+            
+        Raises:
+            ValueError: If the file is not a valid snapshot
+            OSError: If the file cannot be read
+        """
+        snapshot = read_snapshot(path, verify)
+        self.load_data(snapshot.store, snapshot.columns if columns is None else columns)
+        if snapshot.order is not None:
+            self._model.restore_sort(snapshot.sort_spec, snapshot.order)
+        self._filter_bar.search_input.setText(snapshot.filter_text)
+        
+    def load_source(self, source: DataGridSource, columns: List[Dict],
+                    page_size: int = DEFAULT_PAGE_SIZE, max_pages: int = DEFAULT_MAX_PAGES):
+        """Load rows lazily from a paged data source.
+        
+        Rows are pulled in pages as the view scrolls, keeping at most
+        ``max_pages`` pages in memory.
+        
+        Args:
+            source: Data source implementing DataGridSource
+            columns: Column configuration
+            page_size: Number of rows fetched per request
+            max_pages: Maximum number of pages kept in memory
+        """
+        self._columns = list(columns)
+        store = PagedStore(source, self._columns, page_size, max_pages)
+        self._set_model(DataGridModel(store, self._columns, self))
+        self._model.fetchMore()
         self._update_columns()
         
+    def load_file(self, path: str, format: Optional[str] = None, columns: Optional[List[Dict]] = None,
+                  page_size: int = DEFAULT_PAGE_SIZE, max_pages: int = DEFAULT_MAX_PAGES):
+        """Load a CSV or JSON Lines file without reading it up front.
+        
+        The file is memory-mapped and its row offsets are indexed on a
+        worker thread; rows show up as soon as they are indexed and are
+        parsed page by page as the view scrolls. ``index_progress``
+        reports how much of the file has been indexed.
+        
+        Args:
+            path: Path of the file
+            format: "csv" or "jsonl"; inferred from the extension if omitted
+            columns: Column configuration; derived from the CSV header or
+                the first JSON record if omitted
+            page_size: Number of rows parsed per page
+            max_pages: Maximum number of parsed pages kept in memory
+        """
+        source = FileSource(path, format, columns or ())
+        self.load_source(source, source.columns, page_size, max_pages)
+        self._file_source = source
+        
+        def run(task: BackgroundTask):
+            return source.build_index(lambda: task.is_cancelled, task.report_progress)
+            
+        self._index_task = BackgroundTask(run)
+        self._index_task.progress.connect(self._on_index_progress)
+        self._index_task.finished.connect(self._on_index_finished)
+        self._index_task.failed.connect(self._on_index_failed)
+        self._filter_bar.set_status("Indexing… 0%")
+        self._index_task.start()
+        
+    def _on_index_progress(self, percent: int):
+        """Show indexing progress and the rows indexed so far."""
+        if self.sender() is not self._index_task:
+            return
+        self._filter_bar.set_status(f"Indexing… {percent}%")
+        self._fetch_visible_rows()
+        self.index_progress.emit(percent)
+        
+    def _on_index_finished(self, row_count: int):
+        """Finish loading an indexed file."""
+        if self.sender() is not self._index_task:
+            return
+        self._index_task = None
+        self._filter_bar.set_status(None)
+        self._fetch_visible_rows()
+        self.auto_size_columns()
+        self.index_progress.emit(100)
+        
+    def _on_index_failed(self, message: str):
+        """Stop loading a file that could not be indexed."""
+        if self.sender() is not self._index_task:
+            return
+        self._index_task = None
+        self._filter_bar.set_status(None)
+        logger.error(f"Failed to index file: {message}")
+        
+    def _fetch_visible_rows(self):
+        """Fetch newly indexed rows if the view has room for them."""
+        scrollbar = self._table_view.verticalScrollBar()
+        if self._model.rowCount() == 0 or scrollbar.value() >= scrollbar.maximum():
+            self._model.fetchMore()
+        
+    def sort_by(self, spec: Sequence[Tuple[str, Qt.SortOrder]]):
+        """Sort by several columns, most significant first.
+        
+        Args:
+            spec: (column key, order) pairs
+        """
+        self._model.sort_by([(key, order == Qt.DescendingOrder) for key, order in spec])
+        
+    def append_rows(self, rows: List[Dict]):
+        """Append rows without reloading the grid.
+        
+        Args:
+            rows: Row dictionaries
+        """
+        self._model.append_rows(rows)
+        
+    def update_rows(self, rows: List[Dict], key: str = "id"):
+        """Update rows in place, matched by a key column.
+        
+        Args:
+            rows: Row dictionaries holding the key and the changed values
+            key: Column identifying rows
+        """
+        self._model.update_rows(rows, key)
+        
+    def remove_rows(self, keys: List[Any], key: str = "id"):
+        """Remove rows matched by a key column.
+        
+        Args:
+            keys: Key values of the rows to remove
+            key: Column identifying rows
+        """
+        self._model.remove_rows(keys, key)
+        
+    def queue_update(self, values: Dict, key: str = "id"):
+        """Queue a row update from any thread; applied once per frame.
+        
+        Args:
+            values: Row dictionary holding the key and the changed values
+            key: Column identifying rows
+        """
+        self._model.queue_update(values, key)
+        
+    @property
+    def update_stats(self) -> Dict[str, int]:
+        """Get counters of the update queue."""
+        return self._model.update_stats
+        
+    @property
+    def reload_stats(self) -> Optional[Dict[str, Any]]:
+        """Get counters and timings of the last keyed ``load_data`` reload."""
+        return self._model.reload_stats
+        
+    @property
+    def is_exporting(self) -> bool:
+        """Check whether an export is running."""
+        return self._export_task is not None
+        
+    def export(self, path: str, format: Optional[str] = None, formatted: bool = False):
+        """Export the sorted and filtered rows on a worker thread.
+        
+        Progress is reported by ``export_progress``; ``export_finished`` or
+        ``export_failed`` is emitted when done. A running export is
+        cancelled first. Rows are written to a partial file that
+        replaces ``path`` only once the export completes.
+        
+        Args:
+            path: Destination path
+            format: "csv", "jsonl" or "parquet"; inferred from the extension if omitted
+            formatted: Write formatted display text instead of raw values
+        """
+        task = self._model.export_task(path, format, formatted)
+        self.cancel_export()
+        self._export_path = path
+        self._export_task = task
+        task.progress.connect(self._on_export_progress)
+        task.finished.connect(self._on_export_finished)
+        task.failed.connect(self._on_export_failed)
+        task.start()
+        
+    def cancel_export(self):
+        """Cancel a running export and remove its partial file."""
+        if self._export_task is not None:
+            self._export_task.cancel()
+            self._export_task = None
+            
+    def _on_export_progress(self, percent: int):
+        """Forward progress of the running export."""
+        if self.sender() is self._export_task:
+            self.export_progress.emit(percent)
+            
+    def _on_export_finished(self, row_count: int):
+        """Report a completed export."""
+        if self.sender() is not self._export_task:
+            return
+        self._export_task = None
+        self.export_finished.emit(self._export_path, row_count)
+        
+    def _on_export_failed(self, message: str):
+        """Report a failed export."""
+        if self.sender() is not self._export_task:
+            return
+        self._export_task = None
+        self.export_failed.emit(message)
+        
+    def _set_model(self, model: DataGridModel):
+        """Replace the source model."""
+        old_model = self._model
+        old_model.cancel_sort()
+        old_model.cancel_filter()
+        if self._index_task is not None:
+            self._index_task.cancel()
+            self._index_task = None
+            self._filter_bar.set_status(None)
+        if self._file_source is not None:
+            self._file_source.close()
+            self._file_source = None
+        self._model = model
+        self._model.busy_changed.connect(self._set_busy)
+        self._model.filtering_changed.connect(self._filter_bar.set_busy)
+        self._model.set_filter_columns(self._filter_columns)
+        self._model.set_format_cache(self._format_cache_size)
+        
+        # Only models that neither index nor push down filters need the filtering proxy
+        filters_itself = model.supports_index_filter or model.supports_query_pushdown
+        proxy_type = DataGridProxyModel if filters_itself else DataGridFilterProxyModel
+        if not isinstance(self._proxy_model, proxy_type):
+            old_proxy = self._proxy_model
+            self._proxy_model = proxy_type()
+            if self._group_model is None:
+                self._table_view.setModel(self._proxy_model)
+                self._install_selection_model()
+            old_proxy.deleteLater()
+        self._proxy_model.setSourceModel(self._model)
+        if self._group_model is not None:
+            # Keep grouping by the columns that remain; paged sources cannot be grouped
+            keys = [key for key in self._group_model.keys if any(col["key"] == key for col in self._columns)]
+            self._set_group_model(keys if isinstance(model.store, ColumnStore) else None)
+        self._footer.set_source(self._model)
+        if old_model.parent() is self:
+            old_model.deleteLater()
+        self._handle_filter(self._filter_bar.search_input.text())
+        
     def _update_columns(self):
         """Update column headers and sizing."""
         header = self._table_view.horizontalHeader()
@@ -203,68 +2070,209 @@ class DataGrid(ThemedWidget):
             # Set width if specified
             if "width" in col:
                 header.resizeSection(i, col["width"])
-            # Set resize mode
-            mode = QHeaderView.ResizeToContents if col.get("auto_size") else QHeaderView.Interactive
+            # Set resize mode; sampled auto-size columns are fixed by auto_size_columns
+            mode = QHeaderView.ResizeToContents if col.get("auto_size") == "contents" else QHeaderView.Interactive
             header.setSectionResizeMode(i, mode)
+        self._footer.setVisible(any(col.get("aggregate") for col in self._columns))
+        self.auto_size_columns()
+        
+    def auto_size_columns(self):
+        """Size ``auto_size`` columns to fit a sample of their values.
+        
+        Measures the first and last rows, the visible rows and the rows
+        with the longest values instead of every row, then leaves the
+        width user-resizable. Columns with ``auto_size: "contents"`` keep
+        resizing to all of their contents.
+        """
+        model, view = self._model, self._table_view
+        columns = [
+            i for i, col in enumerate(self._columns)
+            if col.get("auto_size") and col.get("auto_size") != "contents"
+        ]
+        rows = model.sample_rows(self._visible_rows()) if columns else []
+        if not rows:
+            return
+        header = view.horizontalHeader()
+        font = view.font()
+        for i in columns:
+            candidates = set(rows)
+            candidates.update(model.longest_rows(self._columns[i]["key"]))
+            widest = self._text_widths.max_width(font, (model.storage_text(row, i) for row in candidates))
+            # Delegate margins and stylesheet padding around the text
+            index = self._proxy_model.index(0, i)
+            padding = view.sizeHintForIndex(index).width() - self._text_widths.width(
+                font, str(index.data(Qt.DisplayRole) or "")
+            )
+            header.setSectionResizeMode(i, QHeaderView.Interactive)
+            header.resizeSection(i, max(widest + padding, header.sectionSizeHint(i)))
             
-    def set_filter_columns(self, columns: List[str]):
-        """Set which columns are searchable."""
-        def filter_func(source_row: int, source_parent: QModelIndex) -> bool:
-            filter_text = self._proxy_model.filterRegExp().pattern().lower()
-            if not filter_text:
-                return True
+    def _visible_rows(self) -> range:
+        """Get the model rows shown in the viewport."""
+        view = self._table_view
+        first = view.rowAt(0)
+        if first < 0:
+            return range(0)
+        last = view.rowAt(view.viewport().height() - 1)
+        return range(first, (last if last >= 0 else self._proxy_model.rowCount() - 1) + 1)
+        
+    @property
+    def aggregates(self) -> Dict[str, Any]:
+        """Get footer aggregates of the visible rows by column key."""
+        return self._model.aggregates
+            
+    def selected_rows(self) -> RowSelection:
+        """Get the selected rows.
+        
+        Returns:
+            RowSelection over view row ranges whose iteration yields
+            storage rows, without expanding the ranges up front; group
+            rows yield None
+        """
+        ranges = self._selection_model.row_ranges()
+        if self._group_model is not None:
+            return RowSelection(ranges, self._group_model.storage_row)
+        if isinstance(self._proxy_model, DataGridProxyModel):
+            return RowSelection(ranges, self._model.storage_row)
+        proxy, model = self._proxy_model, self._model
+        return RowSelection(ranges, lambda row: model.storage_row(proxy.mapToSource(proxy.index(row, 0)).row()))
+        
+    def select_all(self):
+        """Select every visible row as a single range."""
+        self._table_view.selectAll()
+        
+    def clear_selection(self):
+        """Deselect all rows."""
+        self._selection_model.clearSelection()
+        
+    def set_selection_mode(self, mode: QTableView.SelectionMode):
+        """Set how rows are selected, e.g. ``QTableView.SingleSelection``.
+        
+        Args:
+            mode: Selection mode; extended selection by default
+        """
+        self._table_view.setSelectionMode(mode)
+        
+    @property
+    def fast_painting(self) -> bool:
+        """Check whether cells are painted by the fast-path delegate."""
+        return self._fast_delegate is not None
+        
+    def set_fast_painting(self, enabled: bool):
+        """Paint cells directly instead of through the stylesheet.
+        
+        The fast-path delegate fills backgrounds and draws text with
+        brushes and pens cached from the theme, and the stylesheet drops
+        its per-item rules, so scrolling wide grids skips the stylesheet
+        style for every cell.
+        
+        Args:
+            enabled: Use the fast-path delegate if True, the styled
+                delegate otherwise
+        """
+        if enabled == self.fast_painting:
+            return
+        if enabled:
+            self._fast_delegate = FastGridDelegate(self._selection_model, parent=self._table_view)
+            self._table_view.setItemDelegate(self._fast_delegate)
+        else:
+            self._table_view.setItemDelegate(self._selection_delegate)
+            self._fast_delegate.deleteLater()
+            self._fast_delegate = None
+        self._apply_theme(self._theme_engine.theme_data)
+        
+    @property
+    def group_by(self) -> List[str]:
+        """Get the column keys rows are grouped by, outermost first."""
+        return [] if self._group_model is None else self._group_model.keys
+        
+    def set_group_by(self, keys: Optional[Sequence[str]]):
+        """Group rows by one or more columns.
+        
+        Each group is shown as a collapsible row with its row count;
+        clicking it expands or collapses it. Groups are found in one pass
+        and their rows are only materialised when they are first expanded.
+        
+        Args:
+            keys: Column keys to group by, outermost first, or None to
+                show the rows ungrouped
                 
-            # Check each filterable column
-            for col_key in columns:
-                col_idx = next(
-                    (i for i, c in enumerate(self._columns) if c["key"] == col_key),
-                    None
-                )
-                if col_idx is not None:
-                    value = str(self._model.data(
-                        self._model.index(source_row, col_idx),
-                        Qt.DisplayRole
-                    )).lower()
-                    if filter_text in value:
-                        return True
-            return False
+        Raises:
+            KeyError: If a key is not a column
+            TypeError: If the rows are not held in memory
+        """
+        self._set_group_model(list(keys) if keys else None)
+        
+    def _set_group_model(self, keys: Optional[List[str]]):
+        """Show rows grouped by ``keys``, or ungrouped."""
+        group_model = DataGridGroupModel(self._model, keys, self) if keys else None
+        old_group_model = self._group_model
+        self._group_model = group_model
+        self._table_view.clearSpans()
+        if group_model is not None:
+            group_model.modelReset.connect(self._update_group_spans)
+            group_model.rowsInserted.connect(self._update_group_spans)
+            self._table_view.setModel(group_model)
+            self._update_group_spans()
+        else:
+            self._table_view.setModel(self._proxy_model)
+        self._install_selection_model()
+        if old_group_model is not None:
+            old_group_model.deleteLater()
             
-        self._proxy_model.setFilterKeyColumn(-1)  # Search all columns
-        self._proxy_model.setFilterRole(Qt.DisplayRole)
-        self._proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        self._proxy_model.setFilterFixedString("")
+    def _update_group_spans(self, parent: QModelIndex = QModelIndex(), first: int = 0, last: Optional[int] = None):
+        """Span group rows across all columns, from ``first`` to ``last`` or after a reset."""
+        view, group_model = self._table_view, self._group_model
+        if last is None:
+            view.clearSpans()
+            last = group_model.rowCount() - 1
+        columns = group_model.columnCount()
+        if columns < 2:
+            return
+        for row in group_model.group_rows(first, last):
+            view.setSpan(row, 0, 1, columns)
+        
+    def set_filter_columns(self, columns: Optional[List[str]]):
+        """Set which columns are searchable.
+        
+        Args:
+            columns: Column keys, or None to search all columns
+        """
+        self._filter_columns = list(columns) if columns is not None else None
+        self._model.set_filter_columns(self._filter_columns)
+        
+    def set_format_cache(self, max_size: Optional[int]):
+        """Cache formatter output of up to ``max_size`` cells.
+        
+        Args:
+            max_size: Maximum number of cached cells, or None to disable
+        """
+        self._format_cache_size = max_size
+        self._model.set_format_cache(max_size)
         
     def refresh(self):
         """Force refresh of the grid."""
+        self._model.clear_format_cache()
         self._model.layoutChanged.emit()
+        
+    def changeEvent(self, event: QEvent):
+        """Drop cached formatter output when the locale changes."""
+        if event.type() == QEvent.LocaleChange:
+            self._model.clear_format_cache()
+            self._table_view.viewport().update()
+        super().changeEvent(event)
 
     def _apply_theme(self, theme_data: Dict):
         """Apply theme styles to the grid."""
         if not hasattr(self, '_table_view'):
             return
             
-        style = f"""
-            QTableView {{
-                background-color: {theme_data.get("background", "#ffffff")};
-                alternate-background-color: {theme_data.get("alternate_bg", "#f8f9fa")};
-                gridline-color: {theme_data.get("border", "#dee2e6")};
-                color: {theme_data.get("text", "#212529")};
-                border: 1px solid {theme_data.get("border", "#dee2e6")};
-            }}
-            QHeaderView::section {{
-                background-color: {theme_data.get("header_bg", "#e9ecef")};
-                color: {theme_data.get("text", "#212529")};
-                padding: 8px;
-                border: none;
-                border-right: 1px solid {theme_data.get("border", "#dee2e6")};
-                border-bottom: 1px solid {theme_data.get("border", "#dee2e6")};
-            }}
-            QTableView::item {{
-                padding: 8px;
-            }}
-            QTableView::item:selected {{
-                background-color: {theme_data.get("primary", "#007bff")};
-                color: {theme_data.get("text_light", "#ffffff")};
-            }}
-        """
-        self._table_view.setStyleSheet(style)
\ No newline at end of file
+        variant = ""
+        if self._fast_delegate is not None:
+            variant = "fast_painting"
+            self._fast_delegate.set_colors(dict(
+                _grid_colors(theme_data),
+                selected_bg=theme_data.get("primary", "#007bff"),
+                selected_text=theme_data.get("text_light", "#ffffff"),
+            ))
+        self._theme_engine.apply_theme_to_widget(self._table_view, "data_grid", variant)
+        self._theme_engine.apply_theme_to_widget(self._footer, "data_grid", variant)
\ No newline at end of file
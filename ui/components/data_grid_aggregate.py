@@ -0,0 +1,97 @@
+"""Column aggregates for the DataGrid footer."""
+
+from array import array
+from typing import Any, Optional, Sequence, Union
+from ui.components.data_grid_store import MISSING
+
+AGGREGATES = ("sum", "avg", "min", "max", "count")
+
+_NUMBER_TYPES = (int, float)
+
+class ColumnAggregate:
+    """Count, sum, minimum and maximum of a column over a set of rows.
+
+    ``recompute`` scans the rows in bulk; ``add`` and ``remove`` keep the
+    values current as single rows change. Removing the current minimum or
+    maximum marks it stale until the next ``recompute``.
+    """
+
+    def __init__(self, count_only: bool = False):
+        """Initialize an empty aggregate.
+
+        Args:
+            count_only: Only ``count`` is needed, so numeric columns can be
+                counted without reading their values
+        """
+        self.count_only = count_only
+        self.count = 0  # Non-missing values
+        self.numbers = 0  # Numeric values
+        self.total: Union[int, float] = 0
+        self.low: Optional[Union[int, float]] = None
+        self.high: Optional[Union[int, float]] = None
+        self.stale = False
+
+    def recompute(self, buffer: Sequence, rows: Optional[Sequence[int]] = None):
+        """Aggregate the given rows of a column buffer.
+
+        Args:
+            buffer: Column buffer
+            rows: Storage rows to aggregate, or None for all rows
+        """
+        if self.count_only and isinstance(buffer, array):
+            self.count = len(buffer) if rows is None else len(rows)
+            self.stale = False
+            return
+        values = buffer if rows is None else list(map(buffer.__getitem__, rows))
+        if isinstance(buffer, array):
+            numbers = values
+            self.count = len(values)
+        else:
+            numbers = [value for value in values if type(value) in _NUMBER_TYPES]
+            self.count = len(values) - values.count(MISSING) - values.count(None)
+        self.numbers = len(numbers)
+        self.total = sum(numbers)
+        self.low = min(numbers, default=None)
+        self.high = max(numbers, default=None)
+        self.stale = False
+
+    def add(self, value: Any):
+        """Include a value of a newly visible or updated row."""
+        if value is None or value == MISSING:
+            return
+        self.count += 1
+        if type(value) not in _NUMBER_TYPES:
+            return
+        self.numbers += 1
+        self.total += value
+        if not self.stale:
+            self.low = value if self.low is None else min(self.low, value)
+            self.high = value if self.high is None else max(self.high, value)
+
+    def remove(self, value: Any):
+        """Exclude a value of a hidden, removed or updated row."""
+        if value is None or value == MISSING:
+            return
+        self.count -= 1
+        if type(value) not in _NUMBER_TYPES:
+            return
+        self.numbers -= 1
+        self.total -= value
+        if value == self.low or value == self.high:
+            self.stale = True
+
+    def value(self, name: str) -> Optional[Union[int, float]]:
+        """Get an aggregate by name, None if there are no numeric values."""
+        if name == "count":
+            return self.count
+        if not self.numbers:
+            return None
+        if name == "sum":
+            return self.total
+        if name == "avg":
+            return self.total / self.numbers
+        if name == "min":
+            return self.low
+        if name == "max":
+            return self.high
+        raise ValueError(f"Unknown aggregate: {name}")
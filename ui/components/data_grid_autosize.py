@@ -0,0 +1,87 @@
+"""Sampled column auto-sizing for DataGrid."""
+
+from array import array
+from itertools import compress, islice
+from typing import Dict, Iterable, List, Optional, Sequence
+from PySide6.QtGui import QFont, QFontMetrics
+
+# Rows measured at the top and at the bottom of the view
+AUTO_SIZE_EDGE_ROWS = 50
+
+# Rows with the longest values measured per column
+AUTO_SIZE_LONGEST_ROWS = 20
+
+# Measured texts remembered per font
+_MAX_CACHED_WIDTHS = 65536
+
+def longest_rows(buffer: Sequence, count: int = AUTO_SIZE_LONGEST_ROWS) -> List[int]:
+    """Find the rows of a column buffer most likely to render widest.
+
+    Typed numeric buffers render widest at their extremes; other buffers
+    are ranked by the length of their values as text.
+
+    Args:
+        buffer: Column buffer
+        count: Maximum number of rows to return
+
+    Returns:
+        Storage rows, in ascending order
+    """
+    if not len(buffer):
+        return []
+    if isinstance(buffer, array):
+        return sorted({buffer.index(min(buffer)), buffer.index(max(buffer))})
+    try:
+        lengths = list(map(len, buffer))
+    except TypeError:
+        lengths = [len(value) if type(value) is str else len(str(value)) for value in buffer]
+    # Lowest length among the ``count`` longest values
+    found = 0
+    for threshold in sorted(set(lengths), reverse=True):
+        found += lengths.count(threshold)
+        if found >= count:
+            break
+    rows = list(compress(range(len(lengths)), map(threshold.__lt__, lengths)))
+    rows.extend(islice(compress(range(len(lengths)), map(threshold.__eq__, lengths)), count - len(rows)))
+    return sorted(rows)
+
+class TextWidths:
+    """Widths of rendered texts, cached for the current font."""
+
+    def __init__(self):
+        self._font: Optional[QFont] = None
+        self._metrics: Optional[QFontMetrics] = None
+        self._widths: Dict[str, int] = {}
+
+    def width(self, font: QFont, text: str) -> int:
+        """Get the advance width of a text in a font."""
+        if font != self._font:
+            self._set_font(font)
+        width = self._widths.get(text)
+        if width is None:
+            if len(self._widths) >= _MAX_CACHED_WIDTHS:
+                self._widths.clear()
+            width = self._widths[text] = self._metrics.horizontalAdvance(text)
+        return width
+
+    def max_width(self, font: QFont, texts: Iterable[str]) -> int:
+        """Get the widest advance width of several texts in a font."""
+        if font != self._font:
+            self._set_font(font)
+        widths, measure = self._widths, self._metrics.horizontalAdvance
+        widest = 0
+        for text in texts:
+            width = widths.get(text)
+            if width is None:
+                if len(widths) >= _MAX_CACHED_WIDTHS:
+                    widths.clear()
+                width = widths[text] = measure(text)
+            if width > widest:
+                widest = width
+        return widest
+
+    def _set_font(self, font: QFont):
+        """Start measuring in a new font."""
+        self._font = QFont(font)
+        self._metrics = QFontMetrics(font)
+        self._widths = {}
@@ -0,0 +1,74 @@
+"""Formatted-value cache for DataGrid."""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, Optional
+
+DEFAULT_FORMAT_CACHE_SIZE = 10_000
+
+class FormatCache:
+    """Bounded LRU cache of formatted cell text.
+
+    Entries are keyed by ``(storage row, column index)``; the least
+    recently used entry is evicted once ``max_size`` is reached.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_FORMAT_CACHE_SIZE):
+        """Initialize format cache.
+
+        Args:
+            max_size: Maximum number of cached cells
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+        self._entries: OrderedDict = OrderedDict()
+        self._max_size = max_size
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_size(self) -> int:
+        """Get maximum number of cached cells."""
+        return self._max_size
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Get hit, miss and eviction counts and the current size."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "size": len(self._entries),
+            "max_size": self._max_size,
+        }
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """Get cached text, marking it as recently used."""
+        text = self._entries.get(key)
+        if text is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return text
+
+    def put(self, key: Hashable, text: str):
+        """Cache text, evicting the least recently used entry if full."""
+        self._entries[key] = text
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate_rows(self, rows: Iterable[int], columns: Iterable[int]):
+        """Drop cached text of the given cells."""
+        columns = list(columns)
+        for row in rows:
+            for column in columns:
+                self._entries.pop((row, column), None)
+
+    def clear(self):
+        """Drop all cached text."""
+        self._entries.clear()
@@ -0,0 +1,137 @@
+"""Computed columns for DataGrid, defined by expressions over other columns."""
+
+import ast
+from typing import Any, Callable, Dict, List, Mapping, Sequence
+from ui.components.data_grid_store import ColumnStore, MISSING, _type_hints
+
+# Functions that expressions may call
+FUNCTIONS: Dict[str, Callable] = {
+    "abs": abs,
+    "round": round,
+    "min": min,
+    "max": max,
+    "len": len,
+    "str": str,
+    "int": int,
+    "float": float,
+}
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp, ast.Call,
+    ast.Name, ast.Load, ast.Constant, ast.operator, ast.unaryop, ast.boolop, ast.cmpop,
+)
+
+class Expression:
+    """Expression over column keys, compiled for evaluation over whole columns.
+
+    Expressions use Python syntax restricted to arithmetic, comparisons,
+    conditionals and the calls in ``FUNCTIONS``, e.g. ``price * qty``.
+    Cells whose inputs cannot be combined evaluate to a missing value.
+    """
+
+    def __init__(self, source: str):
+        """Compile expression.
+
+        Args:
+            source: Expression text
+
+        Raises:
+            ValueError: If the expression is invalid or uses unsupported syntax
+        """
+        try:
+            tree = ast.parse(source.strip(), mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"Invalid expression {source!r}: {e.msg}") from e
+        inputs = {}
+        for node in ast.walk(tree):
+            if not isinstance(node, _ALLOWED_NODES):
+                raise ValueError(f"Unsupported syntax in expression {source!r}: {type(node).__name__}")
+            if isinstance(node, ast.Call) and not (
+                isinstance(node.func, ast.Name) and node.func.id in FUNCTIONS and not node.keywords
+            ):
+                raise ValueError(f"Unsupported call in expression {source!r}")
+            if isinstance(node, ast.Name) and node.id not in FUNCTIONS:
+                inputs[node.id] = None
+        self.source = source
+        self.inputs: List[str] = list(inputs)
+        self._func = eval(
+            compile(f"lambda {', '.join(self.inputs)}: ({source.strip()})", "<expression>", "eval"),
+            {"__builtins__": {}, **FUNCTIONS},
+        )
+
+    def evaluate(self, columns: Sequence[Sequence], row_count: int) -> List[Any]:
+        """Evaluate over whole columns.
+
+        Args:
+            columns: Buffer of each input, in ``inputs`` order
+            row_count: Number of rows
+
+        Returns:
+            One value per row
+        """
+        if not self.inputs:
+            return [self._call(())] * row_count
+        try:
+            return list(map(self._func, *columns))
+        except Exception:
+            return [self._call(args) for args in zip(*columns)]
+
+    def evaluate_row(self, values: Mapping[str, Any]) -> Any:
+        """Evaluate for a single row given its input values."""
+        return self._call([values.get(key, MISSING) for key in self.inputs])
+
+    def _call(self, args: Sequence[Any]) -> Any:
+        """Evaluate one cell, mapping errors to a missing value."""
+        try:
+            return self._func(*args)
+        except Exception:
+            return MISSING
+
+def computed_columns(columns: Sequence[Dict]) -> Dict[str, Expression]:
+    """Compile the expressions of computed columns, by column key."""
+    return {col["key"]: Expression(col["expression"]) for col in columns if "expression" in col}
+
+def compute_columns(store: ColumnStore, expressions: Mapping[str, Expression],
+                    columns: Sequence[Dict] = ()):
+    """Evaluate computed columns over a whole store.
+
+    Expressions may refer to computed columns listed before them.
+
+    Args:
+        store: Column store to add the computed columns to
+        expressions: Expressions by column key
+        columns: Column configuration used for type hints
+    """
+    hints = _type_hints(columns)
+    for key, expression in expressions.items():
+        values = expression.evaluate([store.column(name) for name in expression.inputs], len(store))
+        store.set_column(key, values, hints.get(key))
+
+def compute_rows(rows: List[Dict], expressions: Mapping[str, Expression]) -> List[Dict]:
+    """Add computed values to new row dictionaries."""
+    rows = [dict(row) for row in rows]
+    for key, expression in expressions.items():
+        inputs = [[row.get(name, MISSING) for row in rows] for name in expression.inputs]
+        values = expression.evaluate(inputs, len(rows))
+        for row, value in zip(rows, values):
+            row[key] = value
+    return rows
+
+def compute_row_update(store: ColumnStore, row: int, values: Mapping[str, Any],
+                       expressions: Mapping[str, Expression]) -> Dict[str, Any]:
+    """Recompute the computed values of a row whose ``values`` are about to change.
+
+    Returns:
+        New values of the computed columns depending on the changed ones
+    """
+    changed = dict(values)
+    computed = {}
+    for key, expression in expressions.items():
+        if changed.keys().isdisjoint(expression.inputs):
+            continue
+        inputs = {
+            name: changed[name] if name in changed else store.value(row, name)
+            for name in expression.inputs
+        }
+        changed[key] = computed[key] = expression.evaluate_row(inputs)
+    return computed
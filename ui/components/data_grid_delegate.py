@@ -0,0 +1,72 @@
+"""Fast-path cell painting for DataGrid."""
+
+from typing import Dict, Optional
+from PySide6.QtCore import Qt, QModelIndex, QRect
+from PySide6.QtGui import QBrush, QColor, QFontMetrics, QPainter, QPen
+from PySide6.QtWidgets import QStyleOptionViewItem
+from ui.components.data_grid_autosize import TextWidths
+from ui.components.data_grid_selection import RowSelectionModel, SelectionDelegate
+
+# Horizontal space between the cell edge and its text, matching the grid's item padding
+CELL_PADDING = 8
+
+_DISPLAY_ROLE = int(Qt.DisplayRole)
+_ALIGNMENT_ROLE = int(Qt.TextAlignmentRole)
+_FONT_ROLE = int(Qt.FontRole)
+_DEFAULT_ALIGNMENT = Qt.AlignLeft | Qt.AlignVCenter
+
+class FastGridDelegate(SelectionDelegate):
+    """Item delegate painting cells directly instead of through the style.
+
+    Stylesheet rules for items send every cell through QStyleSheetStyle,
+    which re-resolves the rules on each paint. This delegate fills the
+    background and draws the text itself with brushes and pens cached
+    from the theme colors, eliding text only when its cached width does
+    not fit. Selection is read from the RowSelectionModel as usual.
+    """
+
+    def __init__(self, selection: Optional[RowSelectionModel] = None, parent=None):
+        super().__init__(selection, parent)
+        self._backgrounds = (QBrush(QColor("#ffffff")), QBrush(QColor("#f8f9fa")))
+        self._selected_background = QBrush(QColor("#007bff"))
+        self._pen = QPen(QColor("#212529"))
+        self._selected_pen = QPen(QColor("#ffffff"))
+        self._text_widths = TextWidths()
+
+    def set_colors(self, colors: Dict[str, str]):
+        """Cache brushes and pens for new theme colors.
+
+        Args:
+            colors: ``background``, ``alternate_bg``, ``text``,
+                ``selected_bg`` and ``selected_text`` colors
+        """
+        self._backgrounds = (QBrush(QColor(colors["background"])), QBrush(QColor(colors["alternate_bg"])))
+        self._selected_background = QBrush(QColor(colors["selected_bg"]))
+        self._pen = QPen(QColor(colors["text"]))
+        self._selected_pen = QPen(QColor(colors["selected_text"]))
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        rect: QRect = option.rect
+        row = index.row()
+        selected = self._selection is not None and self._selection.contains_row(row)
+        painter.fillRect(rect, self._selected_background if selected else self._backgrounds[row & 1])
+
+        text = index.data(_DISPLAY_ROLE)
+        if not text:
+            return
+        text = str(text)
+        model_font = index.data(_FONT_ROLE)
+        if model_font is None:
+            font = option.font
+        else:
+            font = model_font
+            painter.save()
+            painter.setFont(font)
+        text_rect = rect.adjusted(CELL_PADDING, 0, -CELL_PADDING, 0)
+        if self._text_widths.width(font, text) > text_rect.width():
+            text = QFontMetrics(font).elidedText(text, Qt.ElideRight, text_rect.width())
+        painter.setPen(self._selected_pen if selected else self._pen)
+        alignment = index.data(_ALIGNMENT_ROLE)
+        painter.drawText(text_rect, _DEFAULT_ALIGNMENT if alignment is None else alignment, text)
+        if model_font is not None:
+            painter.restore()
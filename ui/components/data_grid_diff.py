@@ -0,0 +1,89 @@
+"""Keyed diffs between DataGrid column stores."""
+
+from array import array
+from itertools import compress
+from operator import ne, not_
+from typing import Any, Dict, List
+from ui.components.data_grid_store import ColumnStore
+
+class KeyedDiff:
+    """Rows removed, changed and added between two stores, matched by a key column.
+
+    ``renumber`` maps each row left in the old store once the removed rows
+    are dropped and the added rows appended to its row in the new store.
+    """
+
+    def __init__(self, removed: List[Any], changed: Dict[int, List[str]],
+                 added: List[int], renumber: array):
+        """Initialize a diff.
+
+        Args:
+            removed: Keys of old rows missing from the new store
+            changed: New row -> keys of the columns whose values changed
+            added: New rows whose key is not in the old store
+            renumber: Row after removals and appends -> row in the new store
+        """
+        self.removed = removed
+        self.changed = changed
+        self.added = added
+        self.renumber = renumber
+
+    @property
+    def reordered(self) -> bool:
+        """Check whether kept or added rows change their relative order."""
+        renumber = self.renumber
+        return any(map(ne, renumber, range(len(renumber))))
+
+def diff_stores(old: ColumnStore, new: ColumnStore, key: str) -> KeyedDiff:
+    """Diff two stores by a key column in linear time.
+
+    Args:
+        old: Store currently shown
+        new: Store replacing it
+        key: Column identifying rows
+
+    Returns:
+        KeyedDiff turning ``old`` into ``new``
+
+    Raises:
+        ValueError: If either store repeats a key
+    """
+    old_keys, new_keys = old.column(key), new.column(key)
+    if old_keys == new_keys:
+        return _diff_aligned(old, new, key)
+    old_key_set = set(old_keys)
+    new_lookup = dict(zip(new_keys, range(len(new_keys))))
+    if len(old_key_set) != len(old_keys) or len(new_lookup) != len(new_keys):
+        raise ValueError(f"Column {key!r} repeats key values")
+
+    kept = list(map(new_lookup.__contains__, old_keys))
+    removed = list(compress(old_keys, map(not_, kept)))
+    old_rows = array("q", compress(range(len(old)), kept))
+    new_rows = array("q", map(new_lookup.__getitem__, compress(old_keys, kept)))
+    added = list(compress(range(len(new_keys)), map(not_, map(old_key_set.__contains__, new_keys))))
+
+    changed: Dict[int, List[str]] = {}
+    for name in dict.fromkeys(old.keys + new.keys):
+        if name == key:
+            continue
+        old_values, new_values = old.column(name), new.column(name)
+        differs = map(ne, map(old_values.__getitem__, old_rows), map(new_values.__getitem__, new_rows))
+        for row in compress(new_rows, differs):
+            changed.setdefault(row, []).append(name)
+
+    renumber = new_rows
+    renumber.extend(added)
+    return KeyedDiff(removed, changed, added, renumber)
+
+def _diff_aligned(old: ColumnStore, new: ColumnStore, key: str) -> KeyedDiff:
+    """Diff two stores holding the same keys in the same order."""
+    if len(set(old.column(key))) != len(old):
+        raise ValueError(f"Column {key!r} repeats key values")
+    changed: Dict[int, List[str]] = {}
+    for name in dict.fromkeys(old.keys + new.keys):
+        old_values, new_values = old.column(name), new.column(name)
+        if name == key or old_values == new_values:
+            continue
+        for row in compress(range(len(new)), map(ne, old_values, new_values)):
+            changed.setdefault(row, []).append(name)
+    return KeyedDiff([], changed, [], array("q", range(len(new))))
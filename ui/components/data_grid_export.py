@@ -0,0 +1,173 @@
+"""Streaming export of DataGrid rows to CSV, JSON Lines and Parquet."""
+
+import csv
+import itertools
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from ui.components.data_grid_store import ColumnStore
+from ui.components.data_grid_search import _display_text
+
+EXPORT_FORMATS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+}
+
+# Rows converted and written per step; bounds memory use of an export
+EXPORT_CHUNK_SIZE = 50_000
+
+# Numbers the partial files of exports running in this process
+_partial_ids = itertools.count()
+
+class ExportCancelled(Exception):
+    """Raised when an export is cancelled."""
+
+def export_format(path: str, format: Optional[str] = None) -> str:
+    """Resolve and check the format of an export.
+
+    Args:
+        path: Destination path
+        format: "csv", "jsonl" or "parquet"; inferred from the extension if omitted
+
+    Returns:
+        str: Export format
+
+    Raises:
+        ValueError: If the format is not supported
+        ImportError: If Parquet is requested but pyarrow is not installed
+    """
+    if format is None:
+        format = EXPORT_FORMATS.get(os.path.splitext(path)[1].lower())
+    if format not in EXPORT_FORMATS.values():
+        raise ValueError(f"Unsupported export format: {format or path}")
+    if format == "parquet":
+        _import_pyarrow()
+    return format
+
+def export_rows(path: str, store: ColumnStore, rows: Sequence[int], columns: Sequence[Dict],
+                format: Optional[str] = None, formatted: bool = False,
+                is_cancelled: Optional[Callable[[], bool]] = None,
+                report_progress: Optional[Callable[[int], None]] = None) -> int:
+    """Write store rows to a file, chunk by chunk.
+
+    Rows are written to a partial file next to ``path`` that replaces
+    it once complete. A cancelled or failed export removes only its own
+    partial file, leaving any existing file and other exports to the
+    same path untouched.
+
+    Args:
+        path: Destination path
+        store: Column store holding the data
+        rows: Storage rows to write, in output order
+        columns: Configuration of the exported columns
+        format: "csv", "jsonl" or "parquet"; inferred from the extension if omitted
+        formatted: Write display text (formatter output) instead of raw values
+        is_cancelled: Polled between chunks; raises ExportCancelled
+        report_progress: Called with the percentage of rows written
+
+    Returns:
+        int: Number of rows written
+    """
+    format = export_format(path, format)
+    keys = [col["key"] for col in columns]
+    cells = [
+        (store.column(col["key"]), _display_text(col.get("formatter")) if formatted else None)
+        for col in columns
+    ]
+    partial_path = f"{path}.{os.getpid()}-{next(_partial_ids)}.partial"
+    writer = _WRITERS[format](partial_path, keys)
+    try:
+        total = len(rows)
+        for start in range(0, total, EXPORT_CHUNK_SIZE):
+            if is_cancelled and is_cancelled():
+                raise ExportCancelled()
+            chunk = rows[start:start + EXPORT_CHUNK_SIZE]
+            values = []
+            for buffer, render in cells:
+                column = list(map(buffer.__getitem__, chunk))
+                values.append(column if render is None else list(map(render, column)))
+            writer.write(values)
+            if report_progress:
+                report_progress((start + len(chunk)) * 100 // total)
+        writer.close()
+        if is_cancelled and is_cancelled():
+            raise ExportCancelled()
+        os.replace(partial_path, path)
+    except BaseException:
+        writer.close()
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+    return len(rows)
+
+class _CsvWriter:
+    """Writes column chunks as CSV records under a header of column keys."""
+
+    def __init__(self, path: str, keys: List[str]):
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(keys)
+
+    def write(self, columns: List[List[Any]]):
+        self._writer.writerows(zip(*columns))
+
+    def close(self):
+        self._file.close()
+
+class _JsonLinesWriter:
+    """Writes column chunks as one JSON object per line."""
+
+    def __init__(self, path: str, keys: List[str]):
+        self._file = open(path, "w", encoding="utf-8")
+        self._keys = keys
+        self._encode = json.JSONEncoder(ensure_ascii=False, default=str).encode
+
+    def write(self, columns: List[List[Any]]):
+        keys, encode = self._keys, self._encode
+        self._file.writelines(encode(dict(zip(keys, row))) + "\n" for row in zip(*columns))
+
+    def close(self):
+        self._file.close()
+
+class _ParquetWriter:
+    """Writes column chunks as Parquet row groups."""
+
+    def __init__(self, path: str, keys: List[str]):
+        self._pa, self._pq = _import_pyarrow()
+        self._path = path
+        self._keys = keys
+        self._writer = None
+
+    def write(self, columns: List[List[Any]]):
+        if self._writer is None:
+            # Later chunks are cast to the schema inferred from the first
+            table = self._pa.table(dict(zip(self._keys, columns)))
+            self._writer = self._pq.ParquetWriter(self._path, table.schema)
+        else:
+            table = self._pa.table(dict(zip(self._keys, columns)), schema=self._writer.schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is None:
+            # Nothing written yet; still produce a valid file
+            self._writer = self._pq.ParquetWriter(
+                self._path, self._pa.schema([(key, self._pa.string()) for key in self._keys])
+            )
+        self._writer.close()
+
+_WRITERS = {
+    "csv": _CsvWriter,
+    "jsonl": _JsonLinesWriter,
+    "parquet": _ParquetWriter,
+}
+
+def _import_pyarrow():
+    """Import pyarrow, which is only needed for Parquet export."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Parquet export requires pyarrow; install it with 'pip install pyarrow'") from e
+    return pyarrow, pyarrow.parquet
@@ -0,0 +1,230 @@
+"""Memory-mapped CSV and JSON Lines sources for DataGrid."""
+
+import csv
+import io
+import json
+import mmap
+import os
+import re
+from array import array
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from ui.components.data_grid_store import MISSING
+
+FILE_FORMATS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+# Bytes scanned per step while building the row index
+INDEX_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Size of the first indexed chunk; chunks double up to INDEX_CHUNK_SIZE so
+# the first rows are available quickly
+_FIRST_CHUNK_SIZE = 64 * 1024
+
+_NEWLINE = re.compile(b"\n")
+
+_CONVERTERS = {
+    "int": int,
+    "float": float,
+}
+
+class FileSource:
+    """DataGridSource over a memory-mapped CSV or JSON Lines file.
+
+    Rows are located through a byte-offset index built by ``build_index``,
+    usually on a worker thread, and parsed only when a page is fetched.
+    Rows indexed so far are reported by ``row_count_hint``, so the grid
+    can show the start of the file while the rest is still being indexed.
+    """
+
+    def __init__(self, path: str, format: Optional[str] = None, columns: Sequence[Dict] = (),
+                 encoding: str = "utf-8"):
+        """Initialize file source.
+
+        Args:
+            path: Path of the file
+            format: "csv" or "jsonl"; inferred from the extension if omitted
+            columns: Column configuration; ``type`` hints convert CSV fields
+            encoding: Text encoding of the file
+        """
+        if format is None:
+            format = FILE_FORMATS.get(os.path.splitext(path)[1].lower())
+        if format not in FILE_FORMATS.values():
+            raise ValueError(f"Unsupported file format: {format or path}")
+        self._path = path
+        self._format = format
+        self._encoding = encoding
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        # Empty files cannot be mapped
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._size = size
+        self._indexed = False
+
+        self._fields: List[str] = []
+        start = 0
+        if format == "csv":
+            start = self._read_header()
+        # Row i spans offsets[i]:offsets[i + 1]
+        self._offsets = array("q", [start])
+        self._columns = list(columns) or self._default_columns()
+        self._converters = {
+            col["key"]: _CONVERTERS[col["type"]]
+            for col in self._columns if col.get("type") in _CONVERTERS
+        }
+
+    @property
+    def path(self) -> str:
+        """Get path of the file."""
+        return self._path
+
+    @property
+    def format(self) -> str:
+        """Get file format."""
+        return self._format
+
+    @property
+    def columns(self) -> List[Dict]:
+        """Get column configuration, derived from the file if not given."""
+        return list(self._columns)
+
+    @property
+    def is_indexed(self) -> bool:
+        """Check whether the whole file has been indexed."""
+        return self._indexed
+
+    def row_count_hint(self) -> Optional[int]:
+        """Get number of rows indexed so far."""
+        return len(self._offsets) - 1
+
+    def fetch(self, offset: int, limit: int) -> List[Dict]:
+        """Parse up to ``limit`` indexed rows starting at ``offset``."""
+        offsets = self._offsets
+        end = min(offset + limit, len(offsets) - 1)
+        if offset >= end:
+            return []
+        text = self._data[offsets[offset]:offsets[end]].decode(self._encoding, errors="replace")
+        if self._format == "csv":
+            return self._parse_csv(text)
+        lines = text.split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        return [json.loads(line) if line.strip() else {} for line in lines]
+
+    def build_index(self, is_cancelled: Optional[Callable[[], bool]] = None,
+                    report_progress: Optional[Callable[[int], None]] = None) -> int:
+        """Index row offsets of the whole file.
+
+        Args:
+            is_cancelled: Polled between chunks; stops indexing when true
+            report_progress: Called with the percentage of bytes indexed
+
+        Returns:
+            int: Number of rows indexed
+        """
+        offsets = self._offsets
+        position = offsets[-1]
+        in_quotes = False
+        percent = -1
+        chunk_size = min(_FIRST_CHUNK_SIZE, INDEX_CHUNK_SIZE)
+        while position < self._size:
+            if is_cancelled and is_cancelled():
+                return len(offsets) - 1
+            chunk = self._data[position:position + chunk_size]
+            chunk_size = min(chunk_size * 2, INDEX_CHUNK_SIZE)
+            ends, in_quotes = _row_ends(chunk, position, self._format == "csv", in_quotes)
+            offsets.extend(ends)
+            position += len(chunk)
+            if report_progress and position * 100 // self._size != percent:
+                percent = position * 100 // self._size
+                report_progress(percent)
+        # Last row without a trailing newline
+        if offsets[-1] < self._size:
+            offsets.append(self._size)
+        self._indexed = True
+        return len(offsets) - 1
+
+    def close(self):
+        """Unmap and close the file."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def _read_header(self) -> int:
+        """Parse the CSV header row.
+
+        Returns:
+            int: Byte offset of the first data row
+        """
+        position = 0
+        in_quotes = False
+        end = self._size
+        while position < self._size:
+            chunk = self._data[position:position + INDEX_CHUNK_SIZE]
+            ends, in_quotes = _row_ends(chunk, position, True, in_quotes)
+            if ends:
+                end = ends[0]
+                break
+            position += len(chunk)
+        text = self._data[:end].decode(self._encoding, errors="replace")
+        self._fields = next(csv.reader(io.StringIO(text, newline="")), [])
+        return end
+
+    def _default_columns(self) -> List[Dict]:
+        """Derive columns from the CSV header or the first JSON record."""
+        fields = self._fields
+        if self._format == "jsonl":
+            newline = self._data.find(b"\n")
+            first = self._data[:newline if newline >= 0 else self._size]
+            fields = list(json.loads(first)) if first.strip() else []
+        return [{"key": field, "title": field} for field in fields]
+
+    def _parse_csv(self, text: str) -> List[Dict]:
+        """Parse CSV records into row dictionaries."""
+        fields = self._fields
+        converters = self._converters
+        rows = []
+        for record in csv.reader(io.StringIO(text, newline="")):
+            row = dict(zip(fields, record))
+            for key, convert in converters.items():
+                value = row.get(key)
+                if value:
+                    try:
+                        row[key] = convert(value)
+                    except ValueError:
+                        pass  # Keep malformed values as text
+                else:
+                    row[key] = MISSING
+            rows.append(row)
+        return rows
+
+def _row_ends(data: bytes, base: int, quoted: bool, in_quotes: bool) -> Tuple[List[int], bool]:
+    """Find the byte offsets just past each row in a chunk.
+
+    Args:
+        data: Chunk of the file
+        base: File offset of the chunk
+        quoted: Whether newlines inside double quotes continue the row (CSV)
+        in_quotes: Whether the chunk starts inside a quoted field
+
+    Returns:
+        Row end offsets and whether the chunk ends inside a quoted field
+    """
+    if not quoted or (not in_quotes and b'"' not in data):
+        return [match.end() + base for match in _NEWLINE.finditer(data)], in_quotes
+    # Escaped quotes come in pairs, so quote parity tells if a newline is quoted
+    ends = []
+    start = 0
+    count = data.count
+    for match in _NEWLINE.finditer(data):
+        end = match.end()
+        if count(b'"', start, end) & 1:
+            in_quotes = not in_quotes
+        if not in_quotes:
+            ends.append(end + base)
+        start = end
+    if count(b'"', start) & 1:
+        in_quotes = not in_quotes
+    return ends, in_quotes
@@ -0,0 +1,339 @@
+"""Lazily expanded row grouping for DataGrid."""
+
+from array import array
+from collections import Counter
+from itertools import compress
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+from PySide6.QtGui import QFont
+
+# Indentation of nested group rows, per level
+GROUP_INDENT = "    "
+
+_DISPLAY_ROLE = int(Qt.DisplayRole)
+_FONT_ROLE = int(Qt.FontRole)
+_BACKGROUND_ROLE = int(Qt.BackgroundRole)
+
+class DataGridGroupModel(QAbstractTableModel):
+    """Collapsible groups of the rows of a DataGridModel, shown as a flat table.
+
+    Rows are grouped by one or more columns, nested in that order. Groups
+    and their counts come from one hash pass over the dense value ranks
+    of the source's cached sort keys; the rows or subgroups of a group are
+    only materialised when it is first expanded. Within a group, rows keep
+    the source's sort order and filter.
+
+    Display rows are kept in one array: non-negative entries are source
+    model rows, negative entries ``-1 - group`` are group rows. Groups are
+    described by parallel arrays indexed by group. Source row changes
+    regroup once control returns to the event loop, since they may be
+    signalled while the source is still mid-change.
+    """
+
+    def __init__(self, source, keys: Sequence[str], parent=None):
+        """Initialize grouping.
+
+        Args:
+            source: DataGridModel holding the rows in memory
+            keys: Column keys to group by, outermost first
+
+        Raises:
+            KeyError: If a key is not a column of the source
+            TypeError: If the source rows are not held in memory
+        """
+        super().__init__(parent)
+        self._source = source
+        self._keys = list(keys)
+        self._columns = [source.column_index(key) for key in self._keys]
+        self._font = QFont()
+        self._font.setBold(True)
+        self._regroup_timer = QTimer(self)
+        self._regroup_timer.setSingleShot(True)
+        self._regroup_timer.setInterval(0)
+        self._regroup_timer.timeout.connect(self._regroup)
+        self._build()
+        for signal in (source.modelReset, source.layoutChanged, source.rowsInserted,
+                       source.rowsRemoved, source.rowsMoved):
+            signal.connect(self._schedule_regroup)
+        source.dataChanged.connect(self._on_data_changed)
+
+    @property
+    def keys(self) -> List[str]:
+        """Get the grouped column keys, outermost first."""
+        return list(self._keys)
+
+    @property
+    def group_count(self) -> int:
+        """Get the number of top-level groups."""
+        return self._top_count
+
+    def _build(self):
+        """Group the source rows by the outermost key; nothing is expanded."""
+        source = self._source
+        self._sort_keys = [source.sort_key(key) for key in self._keys]
+        self._descending = [
+            any(key == name and descending for name, descending in source.sort_spec) for key in self._keys
+        ]
+        # Parallel arrays by group
+        self._levels = array("b")
+        self._ranks = array("q")
+        self._counts = array("q")
+        self._parents = array("q")
+        self._shown = array("q")  # Rows shown below the group while expanded
+        self._expanded = bytearray()
+        self._paths: Dict[int, Tuple[Any, ...]] = {}  # Group -> value path, once expanded
+        self._members = {}  # Group -> source rows, once expanded
+        self._member_ranks = {}  # Group -> next-level ranks of its source rows
+        self._children = {}  # Group -> entries of its subgroups, once expanded
+
+        row_count = source.rowCount()
+        storage = source.storage_rows([(0, row_count - 1)]) if row_count else array("q")
+        self._top_ranks = self._rank_rows(0, storage)
+        self._entries = self._add_groups(0, -1, self._top_ranks)
+        self._top_count = len(self._entries)
+
+    def _rank_rows(self, level: int, storage: Sequence[int]) -> array:
+        """Map storage rows to the value ranks of a grouping level."""
+        return array("q", map(self._sort_keys[level].ranks.__getitem__, storage))
+
+    def _add_groups(self, level: int, parent: int, ranks: array) -> array:
+        """Create the groups of one level in a single hash pass.
+
+        Args:
+            level: Grouping level
+            parent: Enclosing group, -1 at the top level
+            ranks: Value rank of each row in the parent group
+
+        Returns:
+            Entries of the new groups in display order
+        """
+        counts = Counter(ranks)
+        order = sorted(counts, reverse=self._descending[level])
+        first, added = len(self._ranks), len(order)
+        self._levels.extend([level] * added)
+        self._ranks.extend(order)
+        self._counts.extend(map(counts.__getitem__, order))
+        self._parents.extend([parent] * added)
+        self._shown.extend(array("q", bytes(8 * added)))
+        self._expanded.extend(bytes(added))
+        return array("q", range(-1 - first, -1 - first - added, -1))
+
+    def _materialise(self, group: int) -> array:
+        """Get the entries shown below a group, computing them on first use."""
+        children = self._children.get(group)
+        if children is not None:
+            return children
+        level, parent = self._levels[group], self._parents[group]
+        if parent < 0:
+            rows, ranks = range(self._source.rowCount()), self._top_ranks
+        else:
+            rows, ranks = self._members[parent], self._member_ranks[parent]
+        members = array("q", compress(rows, map(self._ranks[group].__eq__, ranks)))
+        if level + 1 < len(self._keys):
+            self._members[group] = members
+            self._member_ranks[group] = self._rank_rows(level + 1, map(self._source.storage_row, members))
+            children = self._add_groups(level + 1, group, self._member_ranks[group])
+        else:
+            children = members
+        self._children[group] = children
+        return children
+
+    def _visible_entries(self, group: int) -> array:
+        """Get the entries shown below an expanded group, including expanded subgroups."""
+        children = self._materialise(group)
+        if self._levels[group] + 1 == len(self._keys):
+            return children
+        entries = array("q")
+        for entry in children:
+            entries.append(entry)
+            if self._expanded[-1 - entry]:
+                entries.extend(self._visible_entries(-1 - entry))
+        return entries
+
+    def _ancestors(self, group: int) -> List[int]:
+        """Get the groups enclosing a group, innermost first."""
+        ancestors = []
+        parent = self._parents[group]
+        while parent >= 0:
+            ancestors.append(parent)
+            parent = self._parents[parent]
+        return ancestors
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._source.columnCount()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role == _BACKGROUND_ROLE:
+            return None  # Alternate by display row rather than by source row
+        if entry >= 0:
+            return self._source.data(self._source.index(entry, index.column()), role)
+        if role == _DISPLAY_ROLE:
+            return self.group_text(-1 - entry) if index.column() == 0 else ""
+        if role == _FONT_ROLE:
+            return self._font
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        return self._source.headerData(section, orientation, role)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
+        """Sort the source; groups follow the source order of their columns."""
+        self._source.sort(column, order)
+
+    def group_text(self, group: int) -> str:
+        """Get the label of a group row."""
+        level = self._levels[group]
+        column = self._columns[level]
+        title = self._source.headerData(column, Qt.Horizontal, Qt.DisplayRole)
+        arrow = "▾" if self._expanded[group] else "▸"
+        text = self._source.storage_text(self._group_row(group), column)
+        return f"{GROUP_INDENT * level}{arrow} {title}: {text} ({self._counts[group]:,})"
+
+    def _group_row(self, group: int) -> int:
+        """Get a storage row holding the value of a group."""
+        sort_key = self._sort_keys[self._levels[group]]
+        return sort_key.order[sort_key.starts[self._ranks[group]]]
+
+    def group_value(self, row: int) -> Optional[Tuple[Any, ...]]:
+        """Get the grouped values of a group row, outermost first.
+
+        Returns:
+            Tuple of values, or None if the row is not a group row
+        """
+        entry = self._entries[row]
+        if entry >= 0:
+            return None
+        return self._group_path(-1 - entry)
+
+    def _group_path(self, group: int) -> Tuple[Any, ...]:
+        """Get the values of a group and its enclosing groups, outermost first."""
+        store = self._source.store
+        path = []
+        for member in [group] + self._ancestors(group):
+            path.append(store.value(self._group_row(member), self._keys[self._levels[member]]))
+        return tuple(reversed(path))
+
+    def is_group_row(self, row: int) -> bool:
+        """Check whether a display row is a group row."""
+        return self._entries[row] < 0
+
+    def group_rows(self, first: int = 0, last: Optional[int] = None) -> List[int]:
+        """Get the group rows among display rows ``first`` to ``last``, inclusive."""
+        last = len(self._entries) - 1 if last is None else last
+        return list(compress(range(first, last + 1), map((0).__gt__, self._entries[first:last + 1])))
+
+    def source_row(self, row: int) -> int:
+        """Map a display row to its source model row, -1 for group rows."""
+        entry = self._entries[row]
+        return entry if entry >= 0 else -1
+
+    def storage_row(self, row: int) -> Optional[int]:
+        """Map a display row to its storage row, None for group rows."""
+        entry = self._entries[row]
+        return self._source.storage_row(entry) if entry >= 0 else None
+
+    def is_expanded(self, row: int) -> bool:
+        """Check whether a display row is an expanded group row."""
+        entry = self._entries[row]
+        return entry < 0 and bool(self._expanded[-1 - entry])
+
+    def set_expanded(self, row: int, expanded: bool):
+        """Expand or collapse a group row.
+
+        Expanding shows the rows or subgroups of the group, materialising
+        them the first time; subgroups keep their own expanded state.
+
+        Args:
+            row: Display row of a group row; other rows are ignored
+            expanded: Expand if True, collapse otherwise
+        """
+        entry = self._entries[row]
+        if entry >= 0 or bool(self._expanded[-1 - entry]) == expanded:
+            return
+        group = -1 - entry
+        if expanded:
+            entries = self._visible_entries(group)
+            count = len(entries)
+            if count:
+                self.beginInsertRows(QModelIndex(), row + 1, row + count)
+                self._entries[row + 1:row + 1] = entries
+                self._expanded[group] = 1
+                self.endInsertRows()
+            else:
+                self._expanded[group] = 1
+        else:
+            count = self._shown[group]
+            if count:
+                self.beginRemoveRows(QModelIndex(), row + 1, row + count)
+                del self._entries[row + 1:row + 1 + count]
+                self._expanded[group] = 0
+                self.endRemoveRows()
+            else:
+                self._expanded[group] = 0
+        self._shown[group] = count
+        self._paths.setdefault(group, self._group_path(group))
+        for ancestor in self._ancestors(group):
+            self._shown[ancestor] += count if expanded else -count
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def toggle(self, row: int):
+        """Expand a collapsed group row or collapse an expanded one."""
+        self.set_expanded(row, not self.is_expanded(row))
+
+    def collapse_all(self):
+        """Collapse every group."""
+        self.beginResetModel()
+        self._expanded = bytearray(len(self._expanded))
+        self._shown = array("q", bytes(8 * len(self._shown)))
+        self._entries = array("q", range(-1, -1 - self._top_count, -1))
+        self.endResetModel()
+
+    def _expanded_paths(self) -> Set[Tuple[Any, ...]]:
+        """Get the value paths of the expanded groups."""
+        return {self._paths[group] for group in compress(range(len(self._expanded)), self._expanded)}
+
+    def _schedule_regroup(self, *_):
+        """Regroup once the source change in progress is complete."""
+        self._regroup_timer.start()
+
+    def _regroup(self):
+        """Rebuild groups after the source rows changed, keeping expanded groups expanded."""
+        paths = self._expanded_paths()
+        self.beginResetModel()
+        self._build()
+        if paths:
+            self._entries = self._restore(self._entries, paths)
+        self.endResetModel()
+
+    def _restore(self, entries: array, paths: Set[Tuple[Any, ...]]) -> array:
+        """Re-expand the groups of a level whose value paths were expanded."""
+        restored = array("q")
+        for entry in entries:
+            restored.append(entry)
+            group = -1 - entry
+            path = self._group_path(group)
+            if path not in paths:
+                continue
+            self._paths[group] = path
+            shown = self._materialise(group)
+            if self._levels[group] + 1 < len(self._keys):
+                shown = self._restore(shown, paths)
+            self._expanded[group] = 1
+            self._shown[group] = len(shown)
+            restored.extend(shown)
+        return restored
+
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles=()):
+        """Regroup when grouped values change, otherwise repaint the changed columns."""
+        left, right = top_left.column(), bottom_right.column()
+        if any(left <= column <= right for column in self._columns):
+            self._schedule_regroup()
+        elif self._entries:
+            self.dataChanged.emit(self.index(0, left), self.index(len(self._entries) - 1, right), roles)
@@ -0,0 +1,189 @@
+"""Text search index for DataGrid filtering."""
+
+import threading
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Callable, List, Optional, Sequence, Tuple
+from ui.components.data_grid_store import ColumnStore
+
+# Separators that cannot be typed into the filter bar
+CELL_SEPARATOR = "\x1f"
+ROW_SEPARATOR = "\x1e"
+
+# Queries matching more than 1/N of the rows are scanned row by row
+_DENSE_MATCH_RATIO = 16
+
+# Rows (or matches) processed between cancellation checks
+CHUNK_SIZE = 65536
+
+class SearchCancelled(Exception):
+    """Raised when a search is cancelled."""
+
+class SearchIndex:
+    """Lowercased, formatted row text for case-insensitive substring search.
+
+    Row texts are joined into one contiguous string so selective queries
+    are answered by a single ``str.find`` pass. A query that extends the
+    previous one only rescans the previous matches. Searches and updates
+    are serialized, so the index can be queried from a worker thread.
+    """
+
+    def __init__(self, texts: List[str], columns: Sequence[dict] = ()):
+        """Initialize search index.
+
+        Args:
+            texts: Lowercased search text per storage row
+            columns: Configuration of the searchable columns
+        """
+        self._texts = texts
+        self._columns = list(columns)
+        self._blob: Optional[str] = None
+        self._offsets: Optional[array] = None
+        self._last: Optional[Tuple[str, array]] = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def build(cls, store: ColumnStore, columns: Sequence[dict]) -> 'SearchIndex':
+        """Build index from the display text of the given columns.
+
+        Args:
+            store: Column store holding the data
+            columns: Configuration of the searchable columns
+        """
+        if not columns:
+            return cls([""] * len(store), columns)
+        cells = [
+            map(_display_text(col.get("formatter")), store.column(col["key"]))
+            for col in columns
+        ]
+        return cls([CELL_SEPARATOR.join(parts).lower() for parts in zip(*cells)], columns)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def text(self, row: int) -> str:
+        """Get indexed text of a row."""
+        return self._texts[row]
+
+    def search(self, query: str, is_cancelled: Optional[Callable[[], bool]] = None) -> Optional[array]:
+        """Find rows whose text contains the query.
+
+        Args:
+            query: Search text, matched case-insensitively
+            is_cancelled: Polled between chunks; raises SearchCancelled
+
+        Returns:
+            Ascending storage rows that match, or None for an empty query
+        """
+        query = query.lower()
+        if not query:
+            return None
+        with self._lock:
+            if self._last is not None and self._last[0] in query:
+                rows = self._refine(self._last[1], query, is_cancelled)
+            else:
+                rows = self._scan(query, is_cancelled)
+            self._last = (query, rows)
+            return rows
+
+    def update_rows(self, store: ColumnStore, rows: Sequence[int]):
+        """Re-index rows changed in the store."""
+        with self._lock:
+            for row, text in zip(rows, self._row_texts(store, rows)):
+                self._texts[row] = text
+            self._invalidate()
+
+    def append_rows(self, store: ColumnStore, count: int):
+        """Index rows appended to the end of the store."""
+        with self._lock:
+            start = len(self._texts)
+            self._texts.extend(self._row_texts(store, range(start, start + count)))
+            self._invalidate()
+
+    def remove_rows(self, rows: Sequence[int]):
+        """Drop rows removed from the store (later rows shift down)."""
+        with self._lock:
+            removed = set(rows)
+            self._texts = [text for row, text in enumerate(self._texts) if row not in removed]
+            self._invalidate()
+
+    def reorder(self, renumber: Sequence[int]):
+        """Follow rows moved to new positions in the store.
+
+        Args:
+            renumber: Old row -> new row
+        """
+        with self._lock:
+            texts = self._texts[:]
+            for row, target in enumerate(renumber):
+                texts[target] = self._texts[row]
+            self._texts = texts
+            self._invalidate()
+
+    def _row_texts(self, store: ColumnStore, rows: Sequence[int]) -> List[str]:
+        """Build indexed text for specific rows."""
+        cells = [
+            (_display_text(col.get("formatter")), store.column(col["key"]))
+            for col in self._columns
+        ]
+        return [
+            CELL_SEPARATOR.join(render(values[row]) for render, values in cells).lower()
+            for row in rows
+        ]
+
+    def _invalidate(self):
+        """Drop the joined text and cached results after changes."""
+        self._blob = None
+        self._offsets = None
+        self._last = None
+
+    def _refine(self, previous: array, query: str,
+                is_cancelled: Optional[Callable[[], bool]]) -> array:
+        """Search only the matches of a previous, shorter query."""
+        texts = self._texts
+        rows = array("q")
+        for start in range(0, len(previous), CHUNK_SIZE):
+            _check_cancelled(is_cancelled)
+            rows.extend([row for row in previous[start:start + CHUNK_SIZE] if query in texts[row]])
+        return rows
+
+    def _scan(self, query: str, is_cancelled: Optional[Callable[[], bool]]) -> array:
+        """Search all rows."""
+        texts = self._texts
+        if self._blob is None:
+            self._blob = ROW_SEPARATOR.join(texts)
+            # Start offset of each row in the joined text
+            self._offsets = array("q", accumulate((len(text) + 1 for text in texts), initial=0))
+        blob, offsets = self._blob, self._offsets
+
+        rows = array("q")
+        if blob.count(query) * _DENSE_MATCH_RATIO > len(texts):
+            for start in range(0, len(texts), CHUNK_SIZE):
+                _check_cancelled(is_cancelled)
+                rows.extend([
+                    row for row, text in enumerate(texts[start:start + CHUNK_SIZE], start)
+                    if query in text
+                ])
+            return rows
+
+        find = blob.find
+        position = find(query)
+        while position >= 0:
+            row = bisect_right(offsets, position) - 1
+            rows.append(row)
+            if len(rows) % CHUNK_SIZE == 0:
+                _check_cancelled(is_cancelled)
+            position = find(query, offsets[row + 1])
+        return rows
+
+def _check_cancelled(is_cancelled: Optional[Callable[[], bool]]):
+    """Raise SearchCancelled if cancellation was requested."""
+    if is_cancelled and is_cancelled():
+        raise SearchCancelled()
+
+def _display_text(formatter: Optional[Callable]) -> Callable:
+    """Get the function rendering a cell as display text."""
+    if formatter is None:
+        return str
+    return lambda value: str(formatter(value))
@@ -0,0 +1,370 @@
+"""Range-based row selection for DataGrid."""
+
+import re
+from bisect import bisect_right
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+from PySide6.QtCore import QEvent, QItemSelection, QItemSelectionModel, QModelIndex, Qt, Signal
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QAbstractItemView, QStyle, QStyledItemDelegate, QTableView
+
+Ranges = List[Tuple[int, int]]  # Sorted, disjoint (first, last) pairs, inclusive
+
+_SELECT = QItemSelectionModel.Select
+_DESELECT = QItemSelectionModel.Deselect
+_TOGGLE = QItemSelectionModel.Toggle
+
+_SET_RUNS = re.compile(b"\x01+")  # Runs of selected rows in a row mask
+
+class RowSelection:
+    """Selected rows as sorted, disjoint ranges of view rows.
+
+    Selecting all rows or a shift-click range is a single range whatever
+    the number of rows. Iteration maps view rows to row ids lazily, through
+    the view as it is at iteration time, so iterate before the view changes.
+    """
+
+    def __init__(self, ranges: Iterable[Tuple[int, int]] = (),
+                 row_id: Optional[Callable[[int], int]] = None):
+        """Initialize selection.
+
+        Args:
+            ranges: (first, last) view row pairs, inclusive, in any order
+            row_id: Maps a view row to its row id; identity if omitted
+        """
+        self._ranges = merge_ranges(ranges)
+        self._row_id = row_id
+        self._firsts = [first for first, _ in self._ranges]
+
+    @property
+    def ranges(self) -> Ranges:
+        """Get selected (first, last) view row ranges, inclusive."""
+        return list(self._ranges)
+
+    def __len__(self) -> int:
+        return sum(last - first + 1 for first, last in self._ranges)
+
+    def __bool__(self) -> bool:
+        return bool(self._ranges)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the ids of the selected rows in view order."""
+        for first, last in self._ranges:
+            rows = range(first, last + 1)
+            yield from rows if self._row_id is None else map(self._row_id, rows)
+
+    def view_rows(self) -> Iterator[int]:
+        """Iterate over the selected view rows in ascending order."""
+        for first, last in self._ranges:
+            yield from range(first, last + 1)
+
+    def contains(self, view_row: int) -> bool:
+        """Check whether a view row is selected."""
+        return _contains(self._ranges, self._firsts, view_row)
+
+class RowSelectionModel(QItemSelectionModel):
+    """Row selection model that stores selected rows as ranges.
+
+    QItemSelectionModel tracks selected rows through persistent indexes,
+    one pair per row once a layout change breaks up its ranges, so sorting
+    a large selection gets slow. This model keeps row ranges instead and
+    remaps them in bulk through row ids on layout changes; without a row
+    id mapping the selection is cleared on layout changes.
+
+    Qt's own selection state stays empty: selections are queried through
+    the overridden Python methods, painted by ``SelectionDelegate`` and
+    announced through ``rows_changed`` instead of ``selectionChanged``.
+    """
+
+    rows_changed = Signal()  # Emitted when the selected rows change
+
+    def __init__(self, model, to_ids: Optional[Callable[[Ranges], Sequence[int]]] = None,
+                 from_ids: Optional[Callable[[Sequence[int]], Sequence[Optional[int]]]] = None,
+                 parent=None):
+        """Initialize selection model.
+
+        Args:
+            model: Item model whose rows are selected
+            to_ids: Maps row ranges to the ids of their rows, which survive layout changes
+            from_ids: Maps row ids to view rows after a layout change, None when hidden
+            parent: Parent object
+        """
+        super().__init__(model, parent)
+        self._to_ids = to_ids
+        self._from_ids = from_ids
+        self._ranges: Ranges = []  # Committed selection
+        self._current: Ranges = []  # Selection in progress, e.g. while dragging
+        self._current_command = QItemSelectionModel.NoUpdate
+        self._effective: Optional[Ranges] = []  # Committed merged with current, None if outdated
+        self._firsts: List[int] = []
+        self._saved_ids = None  # Selected row ids across a layout change
+        self._saved_all = False  # Whether every row was selected before the layout change
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.rowsRemoved.connect(self._on_rows_removed)
+        model.rowsMoved.connect(self._on_rows_moved)
+        model.layoutAboutToBeChanged.connect(self._on_layout_about_to_be_changed)
+        model.layoutChanged.connect(self._on_layout_changed)
+        model.modelReset.connect(self.clearSelection)
+
+    def select(self, selection, command):
+        """Apply a selection command to rows, ignoring columns."""
+        if isinstance(selection, QModelIndex):
+            selection = QItemSelection(selection, selection) if selection.isValid() else QItemSelection()
+        if not command:
+            return
+        ranges = merge_ranges((item.top(), item.bottom()) for item in selection if item.isValid())
+        if command & QItemSelectionModel.Clear:
+            self._ranges = []
+            self._current = []
+        if not command & QItemSelectionModel.Current:
+            self._finalize()
+        if command & (_SELECT | _DESELECT | _TOGGLE):
+            self._current_command = command
+            self._current = ranges
+        self._changed()
+
+    def row_ranges(self) -> Ranges:
+        """Get selected (first, last) row ranges, inclusive."""
+        return list(self._selected())
+
+    def contains_row(self, row: int) -> bool:
+        """Check whether a row is selected."""
+        ranges = self._selected()
+        return _contains(ranges, self._firsts, row)
+
+    def isSelected(self, index: QModelIndex) -> bool:
+        return index.isValid() and self.contains_row(index.row())
+
+    def isRowSelected(self, row: int, parent: QModelIndex = QModelIndex()) -> bool:
+        return self.contains_row(row)
+
+    def rowIntersectsSelection(self, row: int, parent: QModelIndex = QModelIndex()) -> bool:
+        return self.contains_row(row)
+
+    def hasSelection(self) -> bool:
+        return bool(self._selected())
+
+    def selectedRows(self, column: int = 0) -> List[QModelIndex]:
+        model = self.model()
+        return [model.index(row, column) for first, last in self._selected() for row in range(first, last + 1)]
+
+    def selectedIndexes(self) -> List[QModelIndex]:
+        model = self.model()
+        columns = range(model.columnCount())
+        return [
+            model.index(row, column)
+            for first, last in self._selected() for row in range(first, last + 1) for column in columns
+        ]
+
+    def selection(self) -> QItemSelection:
+        model = self.model()
+        right = model.columnCount() - 1
+        selection = QItemSelection()
+        for first, last in self._selected():
+            selection.select(model.index(first, 0), model.index(last, right))
+        return selection
+
+    def clearSelection(self):
+        self._ranges = []
+        self._current = []
+        self._changed()
+
+    def clear(self):
+        self.clearSelection()
+        self.clearCurrentIndex()
+
+    def reset(self):
+        blocked = self.blockSignals(True)
+        self.clear()
+        self.blockSignals(blocked)
+
+    def _selected(self) -> Ranges:
+        """Get the committed selection merged with the one in progress."""
+        if self._effective is None:
+            self._effective = _apply(self._current_command, self._ranges, self._current)
+            self._firsts = [first for first, _ in self._effective]
+        return self._effective
+
+    def _finalize(self):
+        """Commit the selection in progress."""
+        self._ranges = _apply(self._current_command, self._ranges, self._current)
+        self._current = []
+
+    def _changed(self):
+        """Drop the merged selection and announce the change."""
+        self._effective = None
+        self.rows_changed.emit()
+
+    def _on_rows_inserted(self, parent: QModelIndex, first: int, last: int):
+        """Shift ranges below inserted rows, which start unselected."""
+        selected = self._selected()
+        count = last - first + 1
+        self._ranges = _insert_rows(self._ranges, first, count)
+        self._current = _insert_rows(self._current, first, count)
+        self._effective = None
+        if selected and selected[-1][1] >= first:
+            self.rows_changed.emit()
+
+    def _on_rows_removed(self, parent: QModelIndex, first: int, last: int):
+        """Drop removed rows and shift ranges below them."""
+        selected = self._selected()
+        self._ranges = _remove_rows(self._ranges, first, last)
+        self._current = _remove_rows(self._current, first, last)
+        self._effective = None
+        if selected and selected[-1][1] >= first:
+            self.rows_changed.emit()
+
+    def _on_rows_moved(self, parent: QModelIndex, start: int, end: int,
+                       destination: QModelIndex, row: int):
+        """Move the selection state of moved rows along with them."""
+        self._finalize()
+        moved = _intersect(self._ranges, [(start, end)])
+        count = end - start + 1
+        position = row if row < start else row - count
+        ranges = _insert_rows(_remove_rows(self._ranges, start, end), position, count)
+        moved = [(first - start + position, last - start + position) for first, last in moved]
+        self._ranges = merge_ranges(ranges + moved)
+        self._changed()
+
+    def _on_layout_about_to_be_changed(self):
+        """Save the selected rows as row ids before rows are rearranged."""
+        self._finalize()
+        self._effective = None
+        self._saved_all = self._ranges == [(0, self.model().rowCount() - 1)]
+        self._saved_ids = self._to_ids(self._ranges) if self._ranges and self._to_ids is not None else None
+        self._ranges = []
+
+    def _on_layout_changed(self):
+        """Select the saved row ids at their new positions."""
+        saved, self._saved_ids = self._saved_ids, None
+        count = self.model().rowCount()
+        if saved is not None and self._saved_all and len(saved) == count:
+            # Rows were only reordered
+            self._ranges = [(0, count - 1)] if count else []
+        elif saved:
+            mask = bytearray(count)
+            for row in self._from_ids(saved):
+                if row is not None:
+                    mask[row] = 1
+            self._ranges = _mask_ranges(mask)
+        self._changed()
+
+class SelectionDelegate(QStyledItemDelegate):
+    """Item delegate painting the rows selected in a RowSelectionModel."""
+
+    def __init__(self, selection: Optional[RowSelectionModel] = None, parent=None):
+        super().__init__(parent)
+        self._selection = selection
+
+    def set_selection(self, selection: Optional[RowSelectionModel]):
+        """Paint the rows of another selection model."""
+        self._selection = selection
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        if self._selection is not None and self._selection.contains_row(index.row()):
+            option.state |= QStyle.State_Selected
+
+class RowSelectionTableView(QTableView):
+    """Table view resolving click toggles against a RowSelectionModel.
+
+    Qt decides whether a ctrl-click (or a click in multi-selection mode)
+    selects or deselects through the non-virtual
+    QItemSelectionModel::isSelected, which does not see the rows of a
+    RowSelectionModel.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._toggle = _SELECT  # Select or deselect for the toggle in progress
+
+    def selectionCommand(self, index: QModelIndex, event: Optional[QEvent] = None):
+        command = super().selectionCommand(index, event)
+        if not isinstance(event, QMouseEvent):
+            return command
+        if event.type() == QEvent.MouseButtonPress and command & _TOGGLE:
+            self._toggle = _DESELECT if self.selectionModel().isSelected(index) else _SELECT
+            return (command & ~_TOGGLE) | self._toggle
+        mode = self.selectionMode()
+        modifiers = event.modifiers()
+        dragging = event.type() == QEvent.MouseMove and command & QItemSelectionModel.Current
+        if dragging and (mode == QAbstractItemView.MultiSelection or (
+            mode == QAbstractItemView.ExtendedSelection
+            and modifiers & Qt.ControlModifier and not modifiers & Qt.ShiftModifier
+        )):
+            # Continue a toggle started on press across the dragged rows
+            return (command & ~(_SELECT | _DESELECT)) | self._toggle
+        return command
+
+def merge_ranges(ranges: Iterable[Tuple[int, int]]) -> Ranges:
+    """Sort inclusive ranges and merge overlapping or adjacent ones."""
+    merged: Ranges = []
+    for first, last in sorted(ranges):
+        if merged and first <= merged[-1][1] + 1:
+            if last > merged[-1][1]:
+                merged[-1] = (merged[-1][0], last)
+        else:
+            merged.append((first, last))
+    return merged
+
+def _subtract(ranges: Ranges, removed: Ranges) -> Ranges:
+    """Get the rows of ``ranges`` not in ``removed``."""
+    result: Ranges = []
+    i = 0
+    for first, last in ranges:
+        while i < len(removed) and removed[i][1] < first:
+            i += 1
+        j = i
+        while j < len(removed) and removed[j][0] <= last:
+            if removed[j][0] > first:
+                result.append((first, removed[j][0] - 1))
+            first = max(first, removed[j][1] + 1)
+            j += 1
+        if first <= last:
+            result.append((first, last))
+    return result
+
+def _intersect(ranges: Ranges, other: Ranges) -> Ranges:
+    """Get the rows in both ``ranges`` and ``other``."""
+    return _subtract(ranges, _subtract(ranges, other))
+
+def _apply(command, ranges: Ranges, other: Ranges) -> Ranges:
+    """Combine ranges according to a selection command."""
+    if not other:
+        return ranges
+    if command & _SELECT:
+        return merge_ranges(ranges + other)
+    if command & _DESELECT:
+        return _subtract(ranges, other)
+    if command & _TOGGLE:
+        return merge_ranges(_subtract(ranges, other) + _subtract(other, ranges))
+    return ranges
+
+def _insert_rows(ranges: Ranges, first: int, count: int) -> Ranges:
+    """Shift ranges for ``count`` rows inserted at ``first``, splitting a range they land in."""
+    result: Ranges = []
+    for start, last in ranges:
+        if last < first:
+            result.append((start, last))
+        elif start >= first:
+            result.append((start + count, last + count))
+        else:
+            result.append((start, first - 1))
+            result.append((first + count, last + count))
+    return result
+
+def _remove_rows(ranges: Ranges, first: int, last: int) -> Ranges:
+    """Drop rows ``first`` to ``last`` and shift the ranges below them."""
+    count = last - first + 1
+    return merge_ranges(
+        (start if start < first else start - count, end if end < first else end - count)
+        for start, end in _subtract(ranges, [(first, last)])
+    )
+
+def _mask_ranges(mask: bytearray) -> Ranges:
+    """Get the ranges of set bytes in a row mask."""
+    return [(match.start(), match.end() - 1) for match in _SET_RUNS.finditer(mask)]
+
+def _contains(ranges: Ranges, firsts: List[int], row: int) -> bool:
+    """Check whether a row lies in sorted ranges whose starts are ``firsts``."""
+    position = bisect_right(firsts, row) - 1
+    return position >= 0 and row <= ranges[position][1]
@@ -0,0 +1,275 @@
+"""Binary snapshots of DataGrid data for fast reopening."""
+
+import itertools
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from ui.components.data_grid_store import ColumnStore
+
+SNAPSHOT_MAGIC = b"DGSNAP\r\n"
+SNAPSHOT_VERSION = 1
+
+# Magic, format version, header length and header CRC-32
+_PREFIX = struct.Struct("<8sIII")
+
+# Segments start on multiples of this many bytes
+_ALIGNMENT = 8
+
+# Separates the distinct values of a string column
+_SEPARATOR = "\0"
+
+# Buffers are stored little-endian
+_SWAP_BYTES = sys.byteorder != "little"
+
+# Numbers the partial files of snapshots written by this process
+_partial_ids = itertools.count()
+
+class Snapshot:
+    """Data and view state read back from a snapshot file."""
+
+    def __init__(self, store: ColumnStore, columns: List[Dict], sort_spec: List[Tuple[str, bool]],
+                 filter_text: str, order: Optional[array]):
+        """Initialize a snapshot.
+
+        Args:
+            store: Stored columns
+            columns: Column configuration
+            sort_spec: (column key, descending) pairs, most significant first
+            filter_text: Filter text
+            order: Sort permutation for ``sort_spec``, None when unsorted
+        """
+        self.store = store
+        self.columns = columns
+        self.sort_spec = sort_spec
+        self.filter_text = filter_text
+        self.order = order
+
+def write_snapshot(path: str, store: ColumnStore, columns: Sequence[Dict],
+                   sort_spec: Sequence[Tuple[str, bool]] = (), filter_text: str = "",
+                   order: Optional[Sequence[int]] = None, skip: Sequence[str] = ()):
+    """Write a store and its view state to a snapshot file.
+
+    The file holds a fixed prefix, a JSON header and one aligned segment
+    per buffer: typed columns are written as raw array bytes and string
+    columns as distinct values plus an array of codes, so reading them
+    back copies memory instead of parsing text. Column configuration
+    entries that are not JSON values, such as formatters, are left out.
+    The file is written under a private partial name and moved into
+    place once complete, so concurrent writes to the same path do not
+    clobber each other. A failed write leaves no partial file behind.
+
+    Args:
+        path: Destination path
+        store: Column store holding the data
+        columns: Column configuration
+        sort_spec: (column key, descending) pairs, most significant first
+        filter_text: Filter text
+        order: Sort permutation for ``sort_spec``, if sorted
+        skip: Keys of stored columns to leave out, e.g. computed columns
+
+    Raises:
+        ValueError: If an object column holds values that are not JSON values
+        OSError: If the file cannot be written
+    """
+    segments: List[Any] = []
+
+    def add(buffer) -> List[int]:
+        if isinstance(buffer, array) and _SWAP_BYTES:
+            buffer = array(buffer.typecode, buffer)
+            buffer.byteswap()
+        segments.append(buffer)
+        return [len(segments) - 1, zlib.crc32(buffer)]
+
+    stored = []
+    for key in store.keys:
+        if key in skip:
+            continue
+        entry, buffers = _encode_column(key, store.column(key))
+        for name, buffer in buffers.items():
+            entry[name] = add(buffer)
+        stored.append(entry)
+    header = {
+        "rows": len(store),
+        "columns": [_portable_column(col) for col in columns],
+        "sort": [[key, bool(descending)] for key, descending in sort_spec],
+        "filter": filter_text,
+        "order": None if order is None else add(array("q", order)),
+        "buffers": stored,
+    }
+    # Segment references become (offset, size, crc) once sizes are known
+    offset = 0
+    positions = []
+    for buffer in segments:
+        size = memoryview(buffer).nbytes
+        positions.append((offset, size))
+        offset += _padded(size)
+    _place_segments(header, positions)
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    prefix = _PREFIX.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(header_bytes), zlib.crc32(header_bytes))
+    head = prefix + header_bytes
+    head += bytes(_padded(len(head)) - len(head))
+
+    partial_path = f"{path}.{os.getpid()}-{next(_partial_ids)}.partial"
+    try:
+        with open(partial_path, "wb") as file:
+            file.write(head)
+            for buffer in segments:
+                size = memoryview(buffer).nbytes
+                file.write(buffer)
+                file.write(bytes(_padded(size) - size))
+        os.replace(partial_path, path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+def read_snapshot(path: str, verify: bool = True) -> Snapshot:
+    """Read a snapshot file written by ``write_snapshot``.
+
+    The file is memory-mapped and typed buffers are copied straight out
+    of the mapping.
+
+    Args:
+        path: Path of the snapshot
+        verify: Check the CRC-32 of every buffer; the header is always checked
+
+    Returns:
+        Snapshot: Stored data and view state
+
+    Raises:
+        ValueError: If the file is not a snapshot, has an unsupported
+            version or fails its checksums
+    """
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size < _PREFIX.size:
+            raise ValueError(f"Not a grid snapshot: {path}")
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(data)
+    try:
+        magic, version, header_size, header_crc = _PREFIX.unpack_from(view)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"Not a grid snapshot: {path}")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {version}")
+        with view[_PREFIX.size:_PREFIX.size + header_size] as header_view:
+            if len(header_view) != header_size or zlib.crc32(header_view) != header_crc:
+                raise ValueError(f"Snapshot header is corrupt: {path}")
+            header = json.loads(str(header_view, "utf-8"))
+        base = _padded(_PREFIX.size + header_size)
+
+        def segment(reference, convert: Callable[[memoryview], Any]) -> Any:
+            offset, length, crc = reference
+            start = base + offset
+            if start + length > size:
+                raise ValueError(f"Snapshot is truncated: {path}")
+            # Views into the mapping must be released before it is closed
+            with view[start:start + length] as buffer:
+                if verify and zlib.crc32(buffer) != crc:
+                    raise ValueError(f"Snapshot data is corrupt: {path}")
+                return convert(buffer)
+
+        store = ColumnStore({entry["key"]: _decode_column(entry, segment) for entry in header["buffers"]})
+        if len(store) != header["rows"] and store.keys:
+            raise ValueError(f"Snapshot is corrupt: {path}")
+        order = None if header["order"] is None else segment(header["order"], partial(_read_array, "q"))
+        return Snapshot(
+            store,
+            header["columns"],
+            [(key, descending) for key, descending in header["sort"]],
+            header["filter"],
+            order,
+        )
+    finally:
+        view.release()
+        data.close()
+
+def _encode_column(key: str, buffer: Sequence) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Encode a column buffer.
+
+    Returns:
+        Header entry and the buffers to store under its segment names
+    """
+    if isinstance(buffer, array):
+        return {"key": key, "kind": "array", "typecode": buffer.typecode, "itemsize": buffer.itemsize}, {
+            "values": buffer,
+        }
+    buffer = list(buffer)
+    if all(type(value) is str for value in buffer):
+        distinct = list(dict.fromkeys(buffer))
+        text = _SEPARATOR.join(distinct)
+        if text.count(_SEPARATOR) == max(len(distinct) - 1, 0):
+            if len(distinct) == len(buffer):
+                # Values in row order, no codes needed
+                return {"key": key, "kind": "str", "count": len(distinct)}, {"text": text.encode("utf-8")}
+            codes = dict(zip(distinct, range(len(distinct))))
+            typecode = "B" if len(distinct) <= 0xFF else "H" if len(distinct) <= 0xFFFF else "I"
+            return {"key": key, "kind": "str", "count": len(distinct), "typecode": typecode}, {
+                "text": text.encode("utf-8"),
+                "values": array(typecode, map(codes.__getitem__, buffer)),
+            }
+    try:
+        text = json.dumps(buffer, separators=(",", ":"))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Column {key!r} cannot be stored in a snapshot: {e}") from e
+    return {"key": key, "kind": "json"}, {"text": text.encode("utf-8")}
+
+def _decode_column(entry: Dict[str, Any], segment) -> Sequence:
+    """Decode a column buffer from its header entry and segments."""
+    kind = entry["kind"]
+    if kind == "array":
+        if array(entry["typecode"]).itemsize != entry["itemsize"]:
+            raise ValueError(f"Column {entry['key']!r} has an unsupported item size")
+        return segment(entry["values"], partial(_read_array, entry["typecode"]))
+    if kind == "str":
+        distinct = segment(entry["text"], _read_text).split(_SEPARATOR) if entry["count"] else []
+        if "values" not in entry:
+            return distinct
+        return list(map(distinct.__getitem__, segment(entry["values"], partial(_read_array, entry["typecode"]))))
+    if kind == "json":
+        return json.loads(segment(entry["text"], _read_text))
+    raise ValueError(f"Unknown snapshot column kind: {kind}")
+
+def _read_array(typecode: str, buffer: memoryview) -> array:
+    """Copy a little-endian segment into a typed array."""
+    values = array(typecode)
+    values.frombytes(buffer)
+    if _SWAP_BYTES:
+        values.byteswap()
+    return values
+
+def _read_text(buffer: memoryview) -> str:
+    """Decode a UTF-8 segment."""
+    return str(buffer, "utf-8")
+
+def _portable_column(col: Dict) -> Dict:
+    """Keep the column configuration entries that are JSON values."""
+    portable = {}
+    for name, value in col.items():
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            continue  # Formatters and other callables
+        portable[name] = value
+    return portable
+
+def _place_segments(header: Dict, positions: List[Tuple[int, int]]):
+    """Replace (segment, crc) references in the header by (offset, size, crc)."""
+    if header["order"] is not None:
+        index, crc = header["order"]
+        header["order"] = [*positions[index], crc]
+    for entry in header["buffers"]:
+        for name in ("values", "text"):
+            if name in entry:
+                index, crc = entry[name]
+                entry[name] = [*positions[index], crc]
+
+def _padded(size: int) -> int:
+    """Round a size up to the segment alignment."""
+    return -(-size // _ALIGNMENT) * _ALIGNMENT
@@ -0,0 +1,254 @@
+"""Type-aware sort engine for DataGrid."""
+
+import heapq
+import numbers
+import threading
+from array import array
+from decimal import Decimal
+from itertools import islice
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+from ui.components.data_grid_store import ColumnStore, infer_kind
+
+# Sort specification: (column key, descending) pairs, most significant first
+SortSpec = Sequence[Tuple[str, bool]]
+
+# Rows processed per uninterrupted call when sorting off the UI thread
+CHUNK_SIZE = 65536
+
+class SortCancelled(Exception):
+    """Raised when a chunked sort is cancelled."""
+
+class SortKey:
+    """Precomputed sort key for one column.
+
+    Ranks are derived lazily from the ascending order the first time a
+    descending or multi-column sort needs them.
+
+    Attributes:
+        order: Stable ascending permutation of the rows
+        ranks: Dense rank of each row's value (equal values share a rank)
+        starts: Position in ``order`` where each rank begins
+    """
+
+    __slots__ = ("order", "ranks", "starts", "_comparable")
+
+    def __init__(self, order: array, comparable: Sequence):
+        self.order = order
+        self.ranks: Optional[array] = None
+        self.starts: Optional[array] = None
+        self._comparable = comparable
+
+    @property
+    def distinct(self) -> int:
+        """Get number of distinct values."""
+        self.ensure_ranks()
+        return len(self.starts)
+
+    def ensure_ranks(self, is_cancelled: Optional[Callable[[], bool]] = None):
+        """Compute ranks and rank start positions if not done yet."""
+        if self.ranks is not None:
+            return
+        order, comparable = self.order, self._comparable
+        ranks = array("q", bytes(8 * len(order)))
+        starts = array("q")
+        rank = -1
+        previous = None
+        for start in range(0, len(order), CHUNK_SIZE):
+            _check_cancelled(is_cancelled)
+            for position, row in enumerate(order[start:start + CHUNK_SIZE], start):
+                value = comparable[row]
+                if rank < 0 or value != previous:
+                    rank += 1
+                    previous = value
+                    starts.append(position)
+                ranks[row] = rank
+        self.ranks, self.starts = ranks, starts
+        self._comparable = None
+
+    def descending_order(self, is_cancelled: Optional[Callable[[], bool]] = None) -> array:
+        """Get the stable descending permutation of the rows."""
+        self.ensure_ranks(is_cancelled)
+        order, starts = self.order, self.starts
+        if len(starts) == len(order):
+            return order[::-1]  # No ties to keep stable
+        result = array("q")
+        end = len(order)
+        for start in reversed(starts):
+            result.extend(order[start:end])
+            end = start
+        return result
+
+    def descending_ranks(self) -> Sequence[int]:
+        """Get ranks that sort in descending order."""
+        top = self.distinct - 1
+        return [top - rank for rank in self.ranks]
+
+class SortEngine:
+    """Sorts row permutations using cached, type-aware sort keys.
+
+    A SortKey is built once per column key and reused until ``invalidate``
+    is called for that column. Sorting by a cached key in ascending order
+    is a copy; other sorts compare small integer ranks instead of values.
+    """
+
+    def __init__(self):
+        self._keys: Dict[str, SortKey] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self, key: Optional[str] = None):
+        """Drop cached keys for a column, or for all columns."""
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._keys.clear()
+            else:
+                self._keys.pop(key, None)
+
+    def sort_key(self, store: ColumnStore, key: str, chunked: bool = False,
+                 is_cancelled: Optional[Callable[[], bool]] = None) -> SortKey:
+        """Get the cached sort key for a column, building it if needed."""
+        sort_key = self._keys.get(key)
+        if sort_key is None:
+            generation = self._generation
+            sort_key = build_sort_key(store.column(key), chunked, is_cancelled)
+            with self._lock:
+                if generation == self._generation:
+                    self._keys[key] = sort_key
+        return sort_key
+
+    def argsort(self, store: ColumnStore, spec: SortSpec, chunked: bool = False,
+                is_cancelled: Optional[Callable[[], bool]] = None) -> array:
+        """Compute a stable row permutation sorted by ``spec``.
+
+        Args:
+            store: Column store to sort
+            spec: (column key, descending) pairs, most significant first
+            chunked: Sort in bounded chunks and merge, so other threads
+                (including the UI thread) get to run in between
+            is_cancelled: Polled between chunks; raises SortCancelled
+
+        Returns:
+            array: View position -> storage row
+        """
+        if not spec:
+            return array("q", range(len(store)))
+        keys = [
+            (self.sort_key(store, key, chunked, is_cancelled), descending)
+            for key, descending in spec
+        ]
+
+        if len(keys) == 1:
+            sort_key, descending = keys[0]
+            if descending:
+                return sort_key.descending_order(is_cancelled)
+            return array("q", sort_key.order)
+
+        # Combine ranks into one integer key per row
+        composite: Sequence[int] = None
+        for sort_key, descending in keys:
+            sort_key.ensure_ranks(is_cancelled)
+            ranks = sort_key.descending_ranks() if descending else sort_key.ranks
+            if composite is None:
+                composite = ranks
+            else:
+                width = sort_key.distinct
+                composite = [high * width + low for high, low in zip(composite, ranks)]
+        return _argsort(composite, chunked, is_cancelled)
+
+def row_sort_key(store: ColumnStore, spec: SortSpec) -> Callable[[int], tuple]:
+    """Get a key function ordering storage rows like ``SortEngine.argsort``.
+
+    Used to place single rows into a sorted permutation with ``bisect``
+    instead of sorting again. Ties are broken by storage row. The key
+    reads the store's current buffers; get a new one after the store
+    changes.
+    """
+    getters = [_field_getter(store.column(key), descending) for key, descending in spec]
+    if not getters:
+        return lambda row: (row,)
+    if len(getters) == 1:
+        get = getters[0]
+        return lambda row: (get(row), row)
+    return lambda row: tuple([get(row) for get in getters]) + (row,)
+
+def _field_getter(values: Sequence, descending: bool) -> Callable[[int], Any]:
+    """Get a function reading one sort field of a row."""
+    if isinstance(values, array):
+        # Typed numeric buffers compare directly
+        if descending:
+            return lambda row: -values[row]
+        return values.__getitem__
+    if descending:
+        return lambda row: _Descending(_mixed_key(values[row]))
+    return lambda row: _mixed_key(values[row])
+
+class _Descending:
+    """Wrapper inverting the order of a key."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __eq__(self, other: '_Descending') -> bool:
+        return self.value == other.value
+
+    def __lt__(self, other: '_Descending') -> bool:
+        return other.value < self.value
+
+def build_sort_key(values: Sequence, chunked: bool = False,
+                   is_cancelled: Optional[Callable[[], bool]] = None) -> SortKey:
+    """Build the sort key for a value column."""
+    comparable = build_comparable_keys(values)
+    return SortKey(_argsort(comparable, chunked, is_cancelled), comparable)
+
+def build_comparable_keys(values: Sequence) -> Sequence:
+    """Build a mutually comparable key column for a value column.
+
+    Typed and single-type columns are used as-is. Mixed columns get
+    ``(rank, value)`` keys so numbers sort numerically before strings.
+    """
+    if isinstance(values, array) or infer_kind(values) is not None:
+        return values
+    return [_mixed_key(value) for value in values]
+
+def _mixed_key(value: Any) -> Tuple[int, Any]:
+    """Get a sort key that orders numbers, then strings, then other values.
+
+    Real numbers of any type, including Decimal and Fraction, compare by value.
+    """
+    if isinstance(value, (numbers.Real, Decimal)) and not isinstance(value, bool):
+        return (0, value)
+    if isinstance(value, str):
+        return (1, value)
+    return (2, str(value))
+
+def _check_cancelled(is_cancelled: Optional[Callable[[], bool]]):
+    """Raise SortCancelled if cancellation was requested."""
+    if is_cancelled and is_cancelled():
+        raise SortCancelled()
+
+def _argsort(keys: Sequence, chunked: bool,
+             is_cancelled: Optional[Callable[[], bool]]) -> array:
+    """Stable ascending argsort of a key column."""
+    rows = range(len(keys))
+    get_key = keys.__getitem__
+    if not chunked:
+        return array("q", sorted(rows, key=get_key))
+
+    chunks = []
+    for start in range(0, len(rows), CHUNK_SIZE):
+        _check_cancelled(is_cancelled)
+        chunks.append(sorted(rows[start:start + CHUNK_SIZE], key=get_key))
+    if len(chunks) <= 1:
+        return array("q", chunks[0] if chunks else [])
+
+    merged = heapq.merge(*chunks, key=get_key)
+    result = array("q")
+    while True:
+        _check_cancelled(is_cancelled)
+        block = list(islice(merged, CHUNK_SIZE))
+        if not block:
+            return result
+        result.extend(block)
@@ -0,0 +1,201 @@
+"""Lazily paged data sources for DataGrid."""
+
+from collections import abc
+from typing import Any, Dict, List, Mapping, Optional, Protocol, Sequence, Tuple, Union, runtime_checkable
+from ui.components.data_grid_store import ColumnStore
+from ui.components.data_grid_compute import computed_columns, compute_columns
+
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_MAX_PAGES = 32
+
+@runtime_checkable
+class DataGridSource(Protocol):
+    """Protocol for data sources that DataGrid pulls rows from in pages."""
+
+    def row_count_hint(self) -> Optional[int]:
+        """Get total number of rows if known, or None.
+
+        Sources that are still discovering their rows may report a count
+        that grows over time; paging resumes once it does.
+        """
+        ...
+
+    def fetch(self, offset: int, limit: int) -> Union[List[Dict], Mapping[str, Sequence]]:
+        """Fetch up to ``limit`` rows starting at ``offset``.
+
+        Returns:
+            Row dictionaries or a mapping of column key to column values.
+            Without a row count hint, fewer than ``limit`` rows signals
+            the end of the data.
+        """
+        ...
+
+@runtime_checkable
+class QueryableSource(DataGridSource, Protocol):
+    """Protocol for data sources that sort and filter rows themselves.
+
+    DataGrid pushes header sorting and filter text down to these sources
+    instead of sorting or filtering the rows it has fetched.
+    """
+
+    def set_sort(self, spec: Sequence[Tuple[str, bool]]) -> None:
+        """Order rows by (column key, descending) pairs, most significant first."""
+        ...
+
+    def set_filter(self, text: str, keys: Optional[Sequence[str]] = None) -> None:
+        """Show only rows containing ``text`` in the given columns, or in any if None."""
+        ...
+
+class PagedStore:
+    """Store that exposes a DataGridSource through a bounded page cache.
+
+    Rows become visible as pages are fetched via ``prefetch_next_page`` and
+    ``reveal_rows``. Pages are evicted farthest-first from the most recently
+    accessed page and transparently re-fetched when accessed again.
+    """
+
+    def __init__(self, source: DataGridSource, columns: Sequence[Dict],
+                 page_size: int = DEFAULT_PAGE_SIZE, max_pages: int = DEFAULT_MAX_PAGES):
+        """Initialize paged store.
+
+        Args:
+            source: Data source to fetch rows from
+            columns: Column configuration
+            page_size: Number of rows fetched per request
+            max_pages: Maximum number of pages kept in memory
+        """
+        if page_size < 1 or max_pages < 1:
+            raise ValueError("page_size and max_pages must be positive")
+        self._source = source
+        self._columns = list(columns)
+        self._keys = [col["key"] for col in self._columns]
+        self._expressions = computed_columns(self._columns)
+        self._page_size = page_size
+        self._max_pages = max_pages
+        self._pages: Dict[int, ColumnStore] = {}
+        self._current_page = 0
+        self._row_count = 0
+        self._exhausted = False
+
+    def __len__(self) -> int:
+        return self._row_count
+
+    @property
+    def source(self) -> DataGridSource:
+        """Get underlying data source."""
+        return self._source
+
+    @property
+    def page_size(self) -> int:
+        """Get number of rows per page."""
+        return self._page_size
+
+    @property
+    def cached_pages(self) -> int:
+        """Get number of pages currently held in memory."""
+        return len(self._pages)
+
+    @property
+    def keys(self) -> List[str]:
+        """Get column keys."""
+        return list(self._keys)
+
+    def has_column(self, key: str) -> bool:
+        """Check whether a column is available."""
+        return key in self._keys
+
+    def column(self, key: str) -> Sequence:
+        """Get a lazy view of a column."""
+        return _PagedColumn(self, key)
+
+    def value(self, row: int, key: str) -> Any:
+        """Get a single cell value, fetching its page if needed."""
+        page, offset = self._locate(row)
+        return page.value(offset, key)
+
+    def row(self, row: int) -> Dict[str, Any]:
+        """Get a row as a new dictionary."""
+        page, offset = self._locate(row)
+        return page.row(offset)
+
+    def can_fetch_more(self) -> bool:
+        """Check whether more rows may be available from the source."""
+        if self._exhausted:
+            return False
+        hint = self._source.row_count_hint()
+        return hint is None or self._row_count < hint
+
+    def prefetch_next_page(self) -> int:
+        """Fetch the page following the visible rows into the cache.
+
+        Returns:
+            int: Number of rows fetched; pass to ``reveal_rows`` to expose them
+        """
+        page_index = self._row_count // self._page_size
+        self._current_page = page_index
+        page = self._pages.get(page_index)
+        # Short pages are re-fetched in case the source has grown since
+        if page is None or len(page) < self._page_size:
+            page = self._load_page(page_index)
+        count = len(page) - self._row_count % self._page_size
+        if len(page) < self._page_size and self._source.row_count_hint() is None:
+            self._exhausted = True
+        return max(count, 0)
+
+    def reveal_rows(self, count: int):
+        """Make prefetched rows visible."""
+        self._row_count += count
+
+    def reset(self):
+        """Drop all fetched rows, e.g. after the source changed its ordering."""
+        self._pages.clear()
+        self._current_page = 0
+        self._row_count = 0
+        self._exhausted = False
+
+    def _locate(self, row: int):
+        """Get page store and in-page offset for a row."""
+        if not 0 <= row < self._row_count:
+            raise IndexError("row index out of range")
+        page_index, offset = divmod(row, self._page_size)
+        self._current_page = page_index
+        page = self._pages.get(page_index)
+        if page is None:
+            page = self._load_page(page_index)
+        return page, offset
+
+    def _load_page(self, page_index: int) -> ColumnStore:
+        """Fetch a page from the source and cache it."""
+        data = self._source.fetch(page_index * self._page_size, self._page_size)
+        if isinstance(data, Mapping):
+            page = ColumnStore.from_columns(data, self._columns)
+        else:
+            page = ColumnStore.from_rows(data, self._columns)
+        if self._expressions:
+            compute_columns(page, self._expressions, self._columns)
+        self._pages[page_index] = page
+        self._evict()
+        return page
+
+    def _evict(self):
+        """Drop pages farthest from the current page over the cache bound."""
+        while len(self._pages) > self._max_pages:
+            farthest = max(self._pages, key=lambda page: abs(page - self._current_page))
+            del self._pages[farthest]
+
+class _PagedColumn(abc.Sequence):
+    """Lazy column view over a PagedStore."""
+
+    def __init__(self, store: PagedStore, key: str):
+        self._store = store
+        self._key = key
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return self._store.value(index, self._key)
@@ -0,0 +1,190 @@
+"""SQLite data source for DataGrid with sort and filter pushdown."""
+
+import sqlite3
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+# Name under which the tie-breaking rowid is selected
+_ROWID = "__rowid__"
+
+class SqliteSource:
+    """DataGridSource over a SQLite table or query.
+
+    Sorting and text filtering are pushed down into SQL (``ORDER BY`` and
+    ``LIKE``, or ``MATCH`` on an FTS table), so only the pages the grid
+    shows are ever read. Pages following an already fetched one are read
+    with keyset pagination, which avoids scanning skipped rows the way
+    large ``OFFSET`` values do.
+    """
+
+    def __init__(self, database: Union[str, sqlite3.Connection], table: Optional[str] = None,
+                 query: Optional[str] = None, key: Optional[str] = None, fts_table: Optional[str] = None):
+        """Initialize SQLite source.
+
+        Args:
+            database: Database path or an open connection
+            table: Table or view to read; mutually exclusive with ``query``
+            query: SELECT statement to read from
+            key: Unique column used to order ties; defaults to the rowid of tables
+            fts_table: FTS5 table indexing ``table`` by rowid, used for filtering
+        """
+        if (table is None) == (query is None):
+            raise ValueError("Specify exactly one of table or query")
+        self._connection = database if isinstance(database, sqlite3.Connection) else sqlite3.connect(database)
+        self._relation = _quote(table) if table is not None else f"({query})"
+        self._fts_table = fts_table
+        self._fields = [
+            description[0] for description in
+            self._connection.execute(f"SELECT * FROM {self._relation} LIMIT 0").description
+        ]
+        if key is None and table is not None and self._has_rowid():
+            self._tiebreak = "rowid"
+            self._select = f"*, rowid AS {_quote(_ROWID)}"
+        else:
+            self._tiebreak = _quote(key) if key is not None else None
+            self._select = "*"
+        if fts_table is not None and self._tiebreak != "rowid":
+            raise ValueError("FTS filtering requires a table with a rowid")
+        self._sort: List[Tuple[str, bool]] = []
+        self._filter_text = ""
+        self._filter_keys: Optional[List[str]] = None
+        self._bookmarks: Dict[int, tuple] = {}  # Row offset -> sort values of the row before it
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> 'SqliteSource':
+        """Open a source from a ``sqlite:///path`` URL such as ``DATABASE_URL``.
+
+        Args:
+            url: Database URL; ``sqlite://`` alone opens an in-memory database
+            **kwargs: Passed to the constructor (``table`` or ``query``, ...)
+        """
+        prefix = "sqlite://"
+        if not url.startswith(prefix):
+            raise ValueError(f"Not a SQLite URL: {url}")
+        path = url[len(prefix):]
+        if path.startswith("/"):
+            path = path[1:]  # sqlite:///relative.db and sqlite:////absolute.db
+        return cls(path or ":memory:", **kwargs)
+
+    @property
+    def columns(self) -> List[Dict]:
+        """Get column configuration for the columns of the relation."""
+        return [{"key": field, "title": field} for field in self._fields]
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Get database connection."""
+        return self._connection
+
+    def row_count_hint(self) -> Optional[int]:
+        """Rows are not counted up front; paging stops at the first short page."""
+        return None
+
+    def row_count(self) -> int:
+        """Count the rows matching the current filter."""
+        where, params = self._where()
+        return self._connection.execute(f"SELECT COUNT(*) FROM {self._relation}{where}", params).fetchone()[0]
+
+    def set_sort(self, spec: Sequence[Tuple[str, bool]]):
+        """Order rows by (column key, descending) pairs; unknown columns are ignored."""
+        self._sort = [(key, descending) for key, descending in spec if key in self._fields]
+        self._bookmarks.clear()
+
+    def set_filter(self, text: str, keys: Optional[Sequence[str]] = None):
+        """Show only rows containing ``text``.
+
+        Args:
+            text: Filter text, matched case-insensitively
+            keys: Columns to search, or None for all columns
+        """
+        self._filter_text = text
+        self._filter_keys = [key for key in keys if key in self._fields] if keys is not None else None
+        self._bookmarks.clear()
+
+    def fetch(self, offset: int, limit: int) -> Dict[str, List[Any]]:
+        """Fetch a page of rows as columns."""
+        where, params = self._where()
+        order = self._order_keys()
+        # Continue after the nearest page end whose sort values are known
+        start = max((mark for mark in self._bookmarks if mark <= offset), default=0)
+        if start:
+            after, after_params = _keyset_predicate(order, self._bookmarks[start])
+            where = f"{where} AND ({after})" if where else f" WHERE {after}"
+            params += after_params
+        sql = f"SELECT {self._select} FROM {self._relation}{where}"
+        if order:
+            sql += " ORDER BY " + ", ".join(f"{column} {'DESC' if desc else 'ASC'}" for column, desc in order)
+        sql += " LIMIT ? OFFSET ?"
+        cursor = self._connection.execute(sql, params + [limit, offset - start])
+        names = [description[0] for description in cursor.description]
+        rows = cursor.fetchall()
+        if rows and self._tiebreak is not None:
+            positions = [names.index(_unquote(column)) for column, _ in order]
+            self._bookmarks[offset + len(rows)] = tuple(rows[-1][position] for position in positions)
+        return {name: list(values) for name, values in zip(names, zip(*rows))} if rows else {}
+
+    def close(self):
+        """Close the database connection."""
+        self._connection.close()
+
+    def _has_rowid(self) -> bool:
+        """Check whether the table has a rowid (views and WITHOUT ROWID tables do not)."""
+        try:
+            self._connection.execute(f"SELECT rowid FROM {self._relation} LIMIT 0")
+        except sqlite3.OperationalError:
+            return False
+        return True
+
+    def _order_keys(self) -> List[Tuple[str, bool]]:
+        """Get quoted ORDER BY columns, ending with the tie-breaker if any."""
+        order = [(_quote(key), descending) for key, descending in self._sort]
+        if self._tiebreak is not None:
+            order.append((self._tiebreak, False))
+        return order
+
+    def _where(self) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause of the current filter."""
+        if not self._filter_text:
+            return "", []
+        if self._fts_table is not None:
+            phrase = '"' + self._filter_text.replace('"', '""') + '"'
+            return f" WHERE rowid IN (SELECT rowid FROM {_quote(self._fts_table)} WHERE {_quote(self._fts_table)} MATCH ?)", [phrase]
+        keys = self._fields if self._filter_keys is None else self._filter_keys
+        if not keys:
+            return " WHERE 0", []
+        pattern = "%" + self._filter_text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        clause = " OR ".join(f"{_quote(key)} LIKE ? ESCAPE '\\'" for key in keys)
+        return f" WHERE ({clause})", [pattern] * len(keys)
+
+def _keyset_predicate(order: List[Tuple[str, bool]], values: tuple) -> Tuple[str, List[Any]]:
+    """Build a predicate selecting rows after ``values`` in ``order``.
+    
+    SQLite sorts NULLs first in ascending and last in descending order,
+    and plain comparisons with NULL are never true, so ties are matched
+    with ``IS`` and the NULLs following a value are selected explicitly.
+    """
+    clauses = ["0"]
+    params: List[Any] = []
+    for i, (column, descending) in enumerate(order):
+        value = values[i]
+        if value is None:
+            if descending:
+                continue  # Nothing sorts after NULL
+            after, after_params = f"{column} IS NOT NULL", []
+        elif descending:
+            after, after_params = f"({column} < ? OR {column} IS NULL)", [value]
+        else:
+            after, after_params = f"{column} > ?", [value]
+        terms = [f"{previous} IS ?" for previous, _ in order[:i]]
+        clauses.append("(" + " AND ".join(terms + [after]) + ")")
+        params += list(values[:i]) + after_params
+    return " OR ".join(clauses), params
+
+def _quote(name: str) -> str:
+    """Quote an SQL identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+def _unquote(column: str) -> str:
+    """Get the result column name of a quoted identifier or ``rowid``."""
+    if column == "rowid":
+        return _ROWID
+    return column[1:-1].replace('""', '"')
@@ -0,0 +1,252 @@
+"""Column-oriented storage backend for DataGrid."""
+
+from array import array
+from collections import abc
+from itertools import compress
+from typing import Any, Dict, Iterable, List, Mapping, MutableSequence, Optional, Sequence
+
+# Typecodes for column kinds that can be packed into typed buffers
+_TYPECODES = {
+    "int": "q",
+    "float": "d",
+}
+
+_KIND_NAMES = {
+    int: "int",
+    float: "float",
+    str: "str",
+}
+
+# Value used for keys missing from a row (matches the old ``dict.get(key, "")``)
+MISSING = ""
+
+class ColumnStore:
+    """Column-oriented table storage.
+
+    Each column is held in a single buffer: a typed ``array`` for int and
+    float columns, and a list of (deduplicated) objects otherwise.
+    """
+
+    def __init__(self, columns: Optional[Dict[str, MutableSequence]] = None):
+        """Initialize store.
+
+        Args:
+            columns: Mapping of column key to an equal-length buffer
+        """
+        self._columns: Dict[str, MutableSequence] = dict(columns or {})
+        lengths = {len(buffer) for buffer in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        self._row_count = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict], columns: Sequence[Dict] = ()) -> 'ColumnStore':
+        """Build store from a list of row dictionaries.
+
+        Args:
+            rows: Row dictionaries
+            columns: Column configuration used for type hints
+
+        Returns:
+            ColumnStore: New store
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        keys = _ordered_keys(columns, rows)
+        hints = _type_hints(columns)
+        return cls({
+            key: pack_column([row.get(key, MISSING) for row in rows], hints.get(key))
+            for key in keys
+        })
+
+    @classmethod
+    def from_columns(cls, data: Mapping[str, Sequence], columns: Sequence[Dict] = ()) -> 'ColumnStore':
+        """Build store from column arrays.
+
+        Typed arrays are copied, so later edits to the store leave the
+        caller's buffers unchanged.
+
+        Args:
+            data: Mapping of column key to a sequence of values
+            columns: Column configuration used for type hints
+
+        Returns:
+            ColumnStore: New store
+        """
+        hints = _type_hints(columns)
+        packed = {}
+        for key, values in data.items():
+            if isinstance(values, array):
+                packed[key] = array(values.typecode, values)  # Already typed, copy without repacking
+            else:
+                if hasattr(values, "tolist"):
+                    values = values.tolist()  # NumPy arrays
+                packed[key] = pack_column(list(values), hints.get(key))
+        return cls(packed)
+
+    def __len__(self) -> int:
+        return self._row_count
+
+    @property
+    def keys(self) -> List[str]:
+        """Get stored column keys."""
+        return list(self._columns)
+
+    def has_column(self, key: str) -> bool:
+        """Check whether a column is stored."""
+        return key in self._columns
+
+    def column(self, key: str) -> Sequence:
+        """Get the buffer for a column.
+
+        Unknown keys return a read-only sequence of missing values.
+        """
+        buffer = self._columns.get(key)
+        if buffer is None:
+            return _MissingColumn(self._row_count)
+        return buffer
+
+    def value(self, row: int, key: str) -> Any:
+        """Get a single cell value."""
+        buffer = self._columns.get(key)
+        return MISSING if buffer is None else buffer[row]
+
+    def row(self, row: int) -> Dict[str, Any]:
+        """Get a row as a new dictionary."""
+        return {key: buffer[row] for key, buffer in self._columns.items()}
+
+    def set_column(self, key: str, values: Sequence, kind: Optional[str] = None):
+        """Add or replace a whole column.
+
+        Args:
+            key: Column key
+            values: One value per row
+            kind: Optional type hint ("int", "float", "str")
+        """
+        if self._columns and len(values) != self._row_count:
+            raise ValueError("All columns must have the same length")
+        self._columns[key] = values if isinstance(values, array) else pack_column(list(values), kind)
+        self._row_count = len(values)
+
+    def append_rows(self, rows: Sequence[Dict]):
+        """Append row dictionaries.
+
+        Typed columns that cannot hold the new values are widened to lists.
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        for key in _ordered_keys((), rows):
+            if key not in self._columns:
+                self._columns[key] = [MISSING] * self._row_count
+        for key, buffer in self._columns.items():
+            values = [row.get(key, MISSING) for row in rows]
+            if isinstance(buffer, array):
+                try:
+                    values = array(buffer.typecode, values)  # Extend atomically
+                except (TypeError, OverflowError):
+                    self._columns[key] = buffer = buffer.tolist()
+            buffer.extend(values)
+        self._row_count += len(rows)
+
+    def update_row(self, row: int, values: Mapping[str, Any]):
+        """Replace cell values of a row.
+
+        Args:
+            row: Row index
+            values: Mapping of column key to new value
+        """
+        if not 0 <= row < self._row_count:
+            raise IndexError("row index out of range")
+        for key, value in values.items():
+            buffer = self._columns.get(key)
+            if buffer is None:
+                buffer = self._columns[key] = [MISSING] * self._row_count
+            try:
+                buffer[row] = value
+            except (TypeError, OverflowError):
+                self._columns[key] = buffer = buffer.tolist()
+                buffer[row] = value
+
+    def remove_rows(self, rows: Iterable[int]):
+        """Remove rows; later rows shift down."""
+        keep = bytearray(b"\x01") * self._row_count
+        for row in rows:
+            keep[row] = 0
+        for key, buffer in self._columns.items():
+            kept = compress(buffer, keep)
+            self._columns[key] = array(buffer.typecode, kept) if isinstance(buffer, array) else list(kept)
+        self._row_count = keep.count(1)
+
+    def nbytes(self) -> int:
+        """Approximate size of the column buffers in bytes."""
+        total = 0
+        for buffer in self._columns.values():
+            if isinstance(buffer, array):
+                total += buffer.itemsize * len(buffer)
+            else:
+                total += 8 * len(buffer)  # One pointer per row
+        return total
+
+def pack_column(values: List[Any], kind: Optional[str] = None) -> MutableSequence:
+    """Pack values into the most compact buffer for their kind.
+
+    Args:
+        values: Column values
+        kind: Optional type hint ("int", "float", "str"); inferred if omitted
+
+    Returns:
+        Typed ``array`` for numeric columns, list otherwise
+    """
+    if kind is None:
+        kind = infer_kind(values)
+    typecode = _TYPECODES.get(kind)
+    if typecode:
+        try:
+            return array(typecode, values)
+        except (TypeError, OverflowError):
+            pass  # Mixed or missing values, keep as objects
+    if kind == "str":
+        # Share repeated strings between rows
+        pool: Dict[Any, Any] = {}
+        try:
+            return [pool.setdefault(value, value) for value in values]
+        except TypeError:
+            pass  # Unhashable values
+    return values
+
+def infer_kind(values: Iterable[Any]) -> Optional[str]:
+    """Infer column kind from its values.
+
+    Returns:
+        Kind name if all values share one supported type, else None
+    """
+    types = set(map(type, values))
+    if len(types) == 1:
+        return _KIND_NAMES.get(types.pop())
+    return None
+
+def _type_hints(columns: Sequence[Dict]) -> Dict[str, str]:
+    """Collect explicit ``type`` hints from column configuration."""
+    return {col["key"]: col["type"] for col in columns if "type" in col}
+
+def _ordered_keys(columns: Sequence[Dict], rows: List[Dict]) -> List[str]:
+    """Get column keys followed by any extra keys found in rows."""
+    keys = {col["key"]: None for col in columns}
+    for row in rows:
+        if not row.keys() <= keys.keys():
+            keys.update(dict.fromkeys(row))
+    return list(keys)
+
+class _MissingColumn(abc.Sequence):
+    """Read-only column of missing values."""
+
+    def __init__(self, length: int):
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [MISSING] * len(range(*index.indices(self._length)))
+        if not -self._length <= index < self._length:
+            raise IndexError("column index out of range")
+        return MISSING
@@ -6,7 +6,6 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal
 from ui.themes.theme_engine import ThemeEngine
-from ui.themes.theme_config import get_component_styles
 from ui.components.button import StyledButton
 
 class FileBrowserDialog(QDialog):
@@ -30,7 +29,7 @@ class FileBrowserDialog(QDialog):
         
         # Set up theme engine
         self._theme_engine = ThemeEngine.get_instance()
-        self._theme_engine.theme_changed.connect(self._apply_theme)
+        self._theme_engine.subscribe(self._apply_theme)
         
         # Create widgets before theme initialization
         self.file_list = QListWidget()
@@ -143,4 +142,4 @@ class FileBrowserDialog(QDialog):
             return
             
         # Apply styles from theme config
-        self.setStyleSheet(get_component_styles(theme_data, "file_browser"))
\ No newline at end of file
+        self._theme_engine.apply_theme_to_widget(self, "file_browser")
\ No newline at end of file
@@ -42,7 +42,7 @@ class FormBuilder(QWidget):
         self.setLayout(self._layout)
         
         # Subscribe to theme changes
-        self._theme_engine.theme_changed.connect(self._on_theme_changed)
+        self._theme_engine.subscribe(self._on_theme_changed)
         
         if schema:
             self.load_schema(schema)
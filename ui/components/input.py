@@ -21,7 +21,7 @@ class StyledInput(QLineEdit):
         self._setup_input(placeholder)
         
         # Subscribe to theme changes
-        self._theme_engine.theme_changed.connect(self._on_theme_changed)
+        self._theme_engine.subscribe(self._on_theme_changed)
         
     def _setup_input(self, placeholder: str):
         """Configure input widget."""
@@ -1,6 +1,7 @@
 """Theme configuration and color palettes."""
 
 from typing import Dict, Any
+from ui.themes.theme_data import ThemeData
 
 LIGHT_THEME = {
     # Colors
@@ -118,12 +119,19 @@ DARK_THEME = {
     }
 }
 
-def get_component_styles(theme: Dict[str, Any], component: str) -> str:
+# Frozen theme data by theme name
+THEMES = {
+    "light": ThemeData(LIGHT_THEME),
+    "dark": ThemeData(DARK_THEME),
+}
+
+def get_component_styles(theme: Dict[str, Any], component: str, variant: str = "") -> str:
     """Get styles for a specific component based on theme.
     
     Args:
         theme: Theme configuration dictionary
         component: Component name to get styles for
+        variant: Component variant, e.g. "secondary" for buttons
         
     Returns:
         str: Component styles as CSS string
@@ -150,9 +158,10 @@ def get_component_styles(theme: Dict[str, Any], component: str) -> str:
             }}
         """
     elif component == "button":
+        variant = variant if variant == "secondary" else "primary"
         return f"""
             QPushButton {{
-                background-color: {theme["button"]["primary_bg"]};
+                background-color: {theme["button"][f"{variant}_bg"]};
                 color: {theme["button"]["primary_text"]};
                 border: none;
                 border-radius: 4px;
@@ -160,16 +169,39 @@ def get_component_styles(theme: Dict[str, Any], component: str) -> str:
                 font-size: 14px;
             }}
             QPushButton:hover {{
-                background-color: {theme["primary_hover"]};
+                background-color: {theme[f"{variant}_hover"]};
             }}
             QPushButton:pressed {{
-                background-color: {theme["primary_pressed"]};
+                background-color: {theme[f"{variant}_pressed"]};
             }}
             QPushButton:disabled {{
                 background-color: {theme["button"]["disabled_bg"]};
                 color: {theme["button"]["disabled_text"]};
             }}
         """
+    elif component == "checkbox":
+        checkbox = theme.get("checkbox", {})
+        return f"""
+            QCheckBox {{
+                color: {checkbox.get("text", "#212529")};
+                spacing: 8px;
+            }}
+            QCheckBox::indicator {{
+                width: 16px;
+                height: 16px;
+                border: 1px solid {checkbox.get("border", "#ced4da")};
+                border-radius: 3px;
+                background-color: {checkbox.get("background", "#ffffff")};
+            }}
+            QCheckBox::indicator:checked {{
+                background-color: {checkbox.get("checked_bg", "#007bff")};
+                border-color: {checkbox.get("checked_border", "#007bff")};
+            }}
+            QCheckBox::indicator:disabled {{
+                background-color: {checkbox.get("disabled_bg", "#e9ecef")};
+                border-color: {checkbox.get("disabled_border", "#dee2e6")};
+            }}
+        """
     elif component == "file_browser":
         return f"""
             QDialog {{
@@ -0,0 +1,56 @@
+"""Immutable theme data."""
+
+from types import MappingProxyType
+from typing import Any, Mapping
+
+class ThemeData(dict):
+    """Deeply frozen theme data.
+
+    A read-only dict whose nested mappings are frozen too, so one
+    instance per theme can be handed out without copying and used as a
+    cache key. ``flat`` maps dotted paths such as ``text.primary`` to
+    leaf values. ``copy()`` returns a mutable shallow copy.
+    """
+
+    __slots__ = ("_flat", "_hash")
+
+    def __init__(self, data: Mapping[str, Any] = ()):
+        """Freeze theme data.
+
+        Args:
+            data: Theme data; nested mappings and lists are frozen as well
+        """
+        super().__init__((key, _freeze(value)) for key, value in dict(data).items())
+        flat = {}
+        for key, value in dict.items(self):
+            if isinstance(value, ThemeData):
+                flat.update((f"{key}.{path}", leaf) for path, leaf in value.flat.items())
+            else:
+                flat[key] = value
+        self._flat = MappingProxyType(flat)
+        self._hash = hash(frozenset(flat.items()))
+
+    @property
+    def flat(self) -> Mapping[str, Any]:
+        """Get leaf values by dotted path, e.g. ``text.primary``."""
+        return self._flat
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        return ThemeData, (dict(self),)
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("ThemeData is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+def _freeze(value: Any) -> Any:
+    """Freeze a theme value."""
+    if isinstance(value, Mapping):
+        return value if isinstance(value, ThemeData) else ThemeData(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_freeze, value))
+    return value
@@ -1,18 +1,39 @@
 """Theme engine for managing application-wide theming."""
 
-from typing import Dict, Any, Optional
-from PySide6.QtCore import QObject, Signal
-from PySide6.QtWidgets import QWidget
-from ui.themes.theme_config import LIGHT_THEME, DARK_THEME, get_component_styles
+import re
+import time
+import weakref
+from typing import Callable, Dict, Any, List, Optional, Tuple
+import shiboken6
+from PySide6.QtCore import QObject, Qt, Signal
+from PySide6.QtWidgets import QApplication, QWidget
+from ui.themes.theme_config import THEMES, get_component_styles
+from ui.themes.theme_data import ThemeData
+
+# Per-widget stylesheets, or one application stylesheet matching widgets by property
+STYLE_MODES = ("widget", "application")
+
+# Dynamic properties naming the component and variant a widget is styled as
+COMPONENT_PROPERTY = "themeComponent"
+VARIANT_PROPERTY = "themeVariant"
+
+# Variant property value of widgets styled without a variant
+DEFAULT_VARIANT = "default"
+
+_RULE = re.compile(r"([^{}]*)\{([^{}]*)\}")
+_TYPE_SELECTOR = re.compile(r"^(\*|[A-Za-z_][\w-]*)?")
 
 class ThemeEngine(QObject):
     """Manages application-wide theme settings."""
     
     # Signals
-    theme_changed = Signal(dict)  # Emitted when theme changes
+    theme_changed = Signal(object)  # Emits the new ThemeData when the theme changes
     
     _instance: Optional['ThemeEngine'] = None
     
+    # Stylesheet builders of components not styled by theme_config, by component name
+    _stylesheet_builders: Dict[str, Callable[[Dict[str, Any], str], str]] = {}
+    
     def __new__(cls):
         """Ensure single instance (singleton pattern)."""
         if cls._instance is None:
@@ -25,7 +46,15 @@ class ThemeEngine(QObject):
             super().__init__()
             self._initialized = True
             self._current_theme = "light"
-            self._theme_data = LIGHT_THEME.copy()
+            self._theme_data = THEMES["light"]
+            self._stylesheets: Dict[Tuple[ThemeData, str, str], str] = {}  # By (theme data, component, variant)
+            self._stylesheet_stats = dict.fromkeys(("hits", "misses", "builds"), 0)
+            self._style_mode = "widget"
+            self._app_stylesheets: Dict[Tuple[str, str], str] = {}  # Scoped, by (component, variant)
+            self._apply_counts = [0, 0]  # Widgets themed, and restyled, by apply_theme_to_widget
+            self._switch_stats: Optional[Dict[str, Any]] = None
+            # Theme change handlers held weakly, by (subscriber id, function)
+            self._subscribers: Dict[Tuple[int, Any], weakref.WeakMethod] = {}
             
     @property
     def current_theme(self) -> str:
@@ -33,22 +62,119 @@ class ThemeEngine(QObject):
         return self._current_theme
         
     @property
-    def theme_data(self) -> Dict[str, Any]:
-        """Get current theme data."""
-        return self._theme_data.copy()  # Return copy to prevent modification
+    def theme_data(self) -> ThemeData:
+        """Get current theme data.
+        
+        Theme data is deeply frozen and shared rather than copied; it is
+        hashable, so it can be used as a cache key.
+        """
+        return self._theme_data
         
-    def switch_theme(self, theme_name: str):
-        """Switch to a different theme."""
+    def switch_theme(self, theme_name: str, batched: bool = True):
+        """Switch to a different theme.
+        
+        A batched switch disables updates on the visible top-level windows
+        while all subscribers restyle, then enables them again, so each
+        window repaints once. In application style mode widgets are
+        restyled in one pass by the application stylesheet, so windows
+        are not suspended. ``switch_stats`` reports the switch.
+        
+        Args:
+            theme_name: "light" or "dark"
+            batched: Suspend window updates during the switch in widget style mode
+        """
         if theme_name not in ['light', 'dark']:
             raise ValueError("Theme must be 'light' or 'dark'")
             
         if theme_name == self._current_theme:
             return
             
-        self._current_theme = theme_name
-        self._theme_data = (LIGHT_THEME if theme_name == 'light' else DARK_THEME).copy()
+        start = time.perf_counter()
+        applied, restyled = self._apply_counts
+        windows = []
+        if batched and self._style_mode == "widget" and QApplication.instance() is not None:
+            windows = [
+                window for window in QApplication.topLevelWidgets()
+                if window.isVisible() and window.updatesEnabled()
+            ]
+        for window in windows:
+            window.setUpdatesEnabled(False)
+        try:
+            self._current_theme = theme_name
+            self._theme_data = THEMES[theme_name]
+            # Rebuild the stylesheets in use once, before subscribers fetch them
+            self._stylesheets = {
+                (self._theme_data, component, variant): self._build_stylesheet(component, variant)
+                for _, component, variant in self._stylesheets
+            }
+            if self._style_mode == "application":
+                self._app_stylesheets = {
+                    (component, variant): self._scoped_stylesheet(component, variant)
+                    for component, variant in self._app_stylesheets
+                }
+                self._install_app_stylesheet()
+            
+            self._publish()
+        finally:
+            # Enabling updates repaints each window once
+            for window in windows:
+                window.setUpdatesEnabled(True)
+        self._switch_stats = {
+            "theme": theme_name,
+            "ms": (time.perf_counter() - start) * 1000,
+            "widgets": self._apply_counts[0] - applied,
+            "restyled": self._apply_counts[1] - restyled,
+            "windows": len(windows),
+        }
+        
+    @property
+    def switch_stats(self) -> Optional[Dict[str, Any]]:
+        """Get statistics of the last theme switch.
+        
+        Returns:
+            Theme switched to, its duration in milliseconds (``ms``), the
+            widgets themed and how many of them changed style, and the
+            windows whose updates were suspended; None before any switch
+        """
+        return None if self._switch_stats is None else dict(self._switch_stats)
         
-        # Emit theme changed signal with new theme data
+    def subscribe(self, handler: Callable[[Dict[str, Any]], None]):
+        """Call a method of a QObject with the new theme data on theme changes.
+        
+        The subscriber is held weakly: it is dropped once it is garbage
+        collected or its Qt object is deleted, so rebuilt widgets do not
+        pile up handlers on the engine.
+        
+        Args:
+            handler: Bound method of the subscriber
+        """
+        key = (id(handler.__self__), handler.__func__)
+        self._subscribers[key] = weakref.WeakMethod(handler, lambda _: self._subscribers.pop(key, None))
+        
+    def unsubscribe(self, handler: Callable[[Dict[str, Any]], None]):
+        """Stop calling a handler added by ``subscribe``."""
+        self._subscribers.pop((id(handler.__self__), handler.__func__), None)
+        
+    @property
+    def subscriber_count(self) -> int:
+        """Get the number of live theme change subscribers."""
+        return len(self._live_handlers())
+        
+    def _live_handlers(self) -> List[Callable[[Dict[str, Any]], None]]:
+        """Get the handlers of live subscribers, dropping dead ones."""
+        handlers = []
+        for key, reference in list(self._subscribers.items()):
+            handler = reference()
+            if handler is None or not shiboken6.isValid(handler.__self__):
+                del self._subscribers[key]  # Deleted by Qt while still referenced from Python
+            else:
+                handlers.append(handler)
+        return handlers
+        
+    def _publish(self):
+        """Notify subscribers and ``theme_changed`` listeners of the current theme."""
+        for handler in self._live_handlers():
+            handler(self._theme_data)
         self.theme_changed.emit(self._theme_data)
         
     def get_color(self, color_key: str) -> str:
@@ -61,7 +187,56 @@ class ThemeEngine(QObject):
         
     def get_component_style(self, component: str) -> str:
         """Get component-specific styles."""
-        return get_component_styles(self._theme_data, component)
+        return self.stylesheet(component)
+        
+    def stylesheet(self, component: str, variant: str = "") -> str:
+        """Get the compiled stylesheet of a component in the current theme.
+        
+        Stylesheets are built once per theme and shared by every widget
+        fetching them; switching themes rebuilds the cached ones.
+        
+        Args:
+            component: Component name
+            variant: Component variant, e.g. "secondary" for buttons
+            
+        Returns:
+            str: Component styles as CSS string
+        """
+        key = (self._theme_data, component, variant)
+        style = self._stylesheets.get(key)
+        if style is None:
+            self._stylesheet_stats["misses"] += 1
+            style = self._stylesheets[key] = self._build_stylesheet(component, variant)
+        else:
+            self._stylesheet_stats["hits"] += 1
+        return style
+        
+    @property
+    def stylesheet_stats(self) -> Dict[str, int]:
+        """Get stylesheet cache hits, misses, builds and cached entries."""
+        return dict(self._stylesheet_stats, entries=len(self._stylesheets))
+        
+    @classmethod
+    def register_stylesheet(cls, component: str, builder: Callable[[Dict[str, Any], str], str]):
+        """Register the stylesheet builder of a component.
+        
+        Args:
+            component: Component name
+            builder: Called with theme data and variant, returns the stylesheet
+        """
+        cls._stylesheet_builders[component] = builder
+        if cls._instance is not None:
+            cls._instance._stylesheets = {
+                key: style for key, style in cls._instance._stylesheets.items() if key[1] != component
+            }
+        
+    def _build_stylesheet(self, component: str, variant: str) -> str:
+        """Format the stylesheet of a component in the current theme."""
+        self._stylesheet_stats["builds"] += 1
+        builder = self._stylesheet_builders.get(component)
+        if builder is not None:
+            return builder(self._theme_data, variant)
+        return get_component_styles(self._theme_data, component, variant)
         
     @classmethod
     def get_instance(cls) -> 'ThemeEngine':
@@ -70,8 +245,117 @@ class ThemeEngine(QObject):
             cls._instance = cls()
         return cls._instance
         
-    def apply_theme_to_widget(self, widget: 'QWidget', component_type: str):
-        """Apply current theme to a widget."""
-        style = self.get_component_style(component_type)
-        if style:
-            widget.setStyleSheet(style)
\ No newline at end of file
+    @property
+    def style_mode(self) -> str:
+        """Get how themed widgets are styled: "widget" or "application"."""
+        return self._style_mode
+        
+    def set_style_mode(self, mode: str):
+        """Style themed widgets through their own stylesheets or one application stylesheet.
+        
+        In "application" mode the engine installs a single stylesheet on
+        the QApplication, holding the stylesheets of all components in
+        use scoped by the ``themeComponent`` and ``themeVariant`` dynamic
+        properties. Widgets only get those properties set, so creating
+        them or switching themes does not parse a stylesheet per widget.
+        Themed widgets are restyled by emitting ``theme_changed``.
+        
+        Args:
+            mode: "widget" or "application"
+            
+        Raises:
+            ValueError: If the mode is unknown
+            RuntimeError: If application mode is requested without a QApplication
+        """
+        if mode not in STYLE_MODES:
+            raise ValueError(f"Style mode must be one of {STYLE_MODES}")
+        if mode == self._style_mode:
+            return
+        if mode == "application" and QApplication.instance() is None:
+            raise RuntimeError("Application style mode requires a QApplication")
+        self._style_mode = mode
+        if mode == "application":
+            # Start with the stylesheets widget mode has been using
+            self._app_stylesheets = {
+                (component, variant): self._scoped_stylesheet(component, variant)
+                for _, component, variant in self._stylesheets
+            }
+            self._install_app_stylesheet()
+        else:
+            self._app_stylesheets = {}
+            QApplication.instance().setStyleSheet("")
+        self._publish()
+        
+    def apply_theme_to_widget(self, widget: 'QWidget', component_type: str, variant: str = ""):
+        """Apply current theme to a widget.
+        
+        Args:
+            widget: Widget to style
+            component_type: Component name
+            variant: Component variant, e.g. "secondary" for buttons
+        """
+        self._apply_counts[0] += 1
+        if self._style_mode == "application":
+            self._style_by_properties(widget, component_type, variant)
+            return
+        style = self.stylesheet(component_type, variant)
+        if style and widget.styleSheet() != style:
+            self._apply_counts[1] += 1
+            widget.setStyleSheet(style)
+            
+    def _style_by_properties(self, widget: QWidget, component: str, variant: str):
+        """Match a widget to its scoped rules in the application stylesheet."""
+        if (component, variant) not in self._app_stylesheets:
+            self._app_stylesheets[(component, variant)] = self._scoped_stylesheet(component, variant)
+            self._install_app_stylesheet()
+        if widget.styleSheet():
+            widget.setStyleSheet("")
+        variant = variant or DEFAULT_VARIANT
+        if widget.property(COMPONENT_PROPERTY) == component and widget.property(VARIANT_PROPERTY) == variant:
+            return
+        self._apply_counts[1] += 1
+        widget.setProperty(COMPONENT_PROPERTY, component)
+        widget.setProperty(VARIANT_PROPERTY, variant)
+        if widget.testAttribute(Qt.WA_WState_Polished):
+            # Property selectors are only matched again on polish
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+            
+    def _scoped_stylesheet(self, component: str, variant: str) -> str:
+        """Get a component stylesheet scoped to widgets styled as that component."""
+        return scope_stylesheet(self.stylesheet(component, variant), component, variant)
+        
+    def _install_app_stylesheet(self):
+        """Set the combined stylesheet of all components in use on the application."""
+        QApplication.instance().setStyleSheet("\n".join(self._app_stylesheets.values()))
+        
+def scope_stylesheet(style: str, component: str, variant: str = "") -> str:
+    """Rewrite a widget stylesheet to apply only to widgets styled as a component.
+    
+    A widget stylesheet applies to the widget and its children, so each
+    selector is matched both on the widget itself, by adding the property
+    selectors to its first part, and on the widget's descendants.
+    Declarations without a selector apply to the widget itself.
+    
+    Args:
+        style: Stylesheet set on widgets of the component
+        component: Component name
+        variant: Component variant
+        
+    Returns:
+        str: Stylesheet for the application
+    """
+    scope = f'[{COMPONENT_PROPERTY}="{component}"][{VARIANT_PROPERTY}="{variant or DEFAULT_VARIANT}"]'
+    if "{" not in style:
+        return f"*{scope} {{{style}}}" if style.strip() else ""
+    rules = []
+    for selectors, body in _RULE.findall(style):
+        scoped = []
+        for selector in selectors.split(","):
+            selector = selector.strip()
+            if not selector:
+                continue
+            itself = _TYPE_SELECTOR.sub(lambda match: (match.group(1) or "*") + scope, selector, count=1)
+            scoped += [itself, f"*{scope} {selector}"]
+        rules.append(f"{', '.join(scoped)} {{{body}}}")
+    return "\n".join(rules)
\ No newline at end of file